@@ -3,20 +3,53 @@ import random
 import decimal
 import string
 import hashlib
-import sha3
 
 import pyqrcode
 from deprecated import deprecated
 
+from mintersdk.amount import Amount, PIP
+from mintersdk.interning import COINS
+from mintersdk.keccak import keccak_256
+from mintersdk.prefixed import (
+    PREFIX_ADDR, PREFIX_PUBKEY, PREFIX_CHECK, PREFIX_TX, PREFIXES,
+    MinterAddress, MinterPubKey, MinterCheckId, MinterTxHash, remove_prefix,
+    to_bytes
+)
 
-# Number of PIP in 1 BIP
-PIP = 1000000000000000000
+# Decimal context for PIP/BIP conversion. It is passed to Decimal methods
+# explicitly, so context of current thread or coroutine isn't used or
+# changed. Precision is enough to convert any uint256 value exactly.
+_DECIMAL_CONTEXT = decimal.Context(prec=100, rounding=decimal.ROUND_DOWN)
+_DECIMAL_PIP = decimal.Decimal(PIP)
 
-# Prefixes
-PREFIX_ADDR = 'Mx'
-PREFIX_PUBKEY = 'Mp'
-PREFIX_CHECK = 'Mc'
-PREFIX_TX = 'Mt'
+
+def set_ecdsa_backend(name='default'):
+    """
+    Select ECDSA backend for all signing and recovering operations.
+    Args:
+        name (str): backend name ('sslcrypto', 'coincurve'),
+                    'default' for first available backend or
+                    'fastest' to select backend by micro-benchmark
+    Returns:
+        ECDSABackend
+    """
+    from mintersdk.sdk import ECDSA
+
+    return ECDSA.set_backend(name)
+
+
+def set_keccak_backend(name='default'):
+    """
+    Select Keccak backend for all hashing operations.
+    Args:
+        name (str): backend name ('pysha3', 'pycryptodome') or
+                    'default' for first available backend
+    Returns:
+        KeccakBackend
+    """
+    from mintersdk import keccak
+
+    return keccak.set_backend(name)
 
 
 @deprecated("Use 'to_bip', 'to_pip' shortcuts or MinterHelper methods")
@@ -39,26 +72,20 @@ class MinterConvertor:
         Returns:
             int|Decimal
         """
-        # Get default decimal context
-        context = decimal.getcontext()
-        # Set temporary decimal context for calculation
-        decimal.setcontext(
-            decimal.Context(prec=prec, rounding=decimal.ROUND_DOWN)
-        )
-
-        # PIP in BIP in Decimal
-        default = decimal.Decimal(str(cls.DEFAULT))
-        # Value in Decimal
-        value = decimal.Decimal(str(value))
-
-        # Make conversion
-        if to == 'pip':
-            value = int(value * default)
-        elif to == 'bip':
-            value /= default
-
-        # Reset decimal context to default
-        decimal.setcontext(context)
+        # Calculate in local decimal context, so context of current thread
+        # or coroutine isn't touched
+        with decimal.localcontext(
+                decimal.Context(prec=prec, rounding=decimal.ROUND_DOWN)):
+            # PIP in BIP in Decimal
+            default = decimal.Decimal(str(cls.DEFAULT))
+            # Value in Decimal
+            value = decimal.Decimal(str(value))
+
+            # Make conversion
+            if to == 'pip':
+                value = int(value * default)
+            elif to == 'bip':
+                value /= default
 
         return value
 
@@ -103,15 +130,22 @@ class MinterHelper:
         Returns:
             hex (string)
         """
+        return MinterHelper.keccak_digest(data, digest_bits).hex()
 
-        if digest_bits == 256:
-            khash = sha3.keccak_256()
-        else:
+    @staticmethod
+    def keccak_digest(data, digest_bits=256):
+        """
+        Create Keccak hash by selected backend (see `keccak.set_backend`).
+        Args:
+            data (bytes)
+            digest_bits (int)
+        Returns:
+            bytes: raw digest
+        """
+        if digest_bits != 256:
             raise NotImplementedError
 
-        khash.update(data)
-
-        return khash.hexdigest()
+        return keccak_256(data)
 
     @staticmethod
     @deprecated('Unnecessary method')
@@ -163,13 +197,13 @@ class MinterHelper:
         Get validator address from it's pub key (Mp...).
         Validator address is used in signing blocks.
         Args:
-            pub_key (string): candidate public key (Mp....)
+            pub_key (str|MinterPubKey): candidate public key (Mp....)
             upper (bool)
         Returns:
             string, validator address
         """
 
-        pub_key = bytes.fromhex(MinterHelper.prefix_remove(pub_key))
+        pub_key = to_bytes(pub_key)
         vaddress = hashlib.sha256(pub_key).hexdigest()[:40]
 
         return vaddress.upper() if upper else vaddress
@@ -268,6 +302,33 @@ class MinterHelper:
 
     @staticmethod
     def decode_coin_name(symbol):
+        """
+        Decode coin symbol. Symbols are shared by interning table.
+        String keys of the table are always canonical symbols, so value
+        doesn't depend on which function cached it first.
+        Args:
+            symbol (bytes|str)
+        Returns:
+            string
+        """
+        if type(symbol) is str:
+            return COINS.get(symbol.replace(chr(0), ''), str)
+
+        return COINS.get(symbol, MinterHelper._decode_coin_name)
+
+    @staticmethod
+    def upper_coin_name(symbol):
+        """
+        Coin symbol in upper case. Symbols are shared by interning table.
+        Args:
+            symbol (str)
+        Returns:
+            string
+        """
+        return COINS.get(symbol.upper(), str)
+
+    @staticmethod
+    def _decode_coin_name(symbol):
         """
         Args:
             symbol (bytes|str)
@@ -284,60 +345,137 @@ class MinterHelper:
     def to_pip(value):
         """
         Convert BIPs to PIPs.
-        Always cast value to str, due to float behaviour:
+        Value is parsed with integer arithmetic (see `Amount.parse`).
+        Float is always cast to str, due to float behaviour:
             Decimal(0.1) = Decimal('0.10000000000004524352345234')
             Decimal('0.1') = Decimal('0.1')
         Args:
-            value (str|float|int|Decimal): value in BIP
+            value (str|float|int|Decimal|Amount): value in BIP
         Returns:
             int
         """
-        return int(decimal.Decimal(str(value)) * decimal.Decimal(PIP))
+        return Amount.parse(value)
 
     @staticmethod
     def to_bip(value):
         """
         Convert PIPs to BIPs.
-        Use dynamic Decimal precision, depending on value length.
+        Division is exact, result has no more digits than value.
         Args:
-            value (int|str|Decimal): value in PIP
+            value (int|str|Decimal|Amount): value in PIP or amount
         Returns:
             Decimal
         """
+        if type(value) is Amount:
+            return value.to_decimal()
+
         # Check if value is correct PIP value
         value = str(value)
         if not value.isdigit():
             raise ValueError(f'{value} is not correct PIP value')
 
-        # Get default decimal context
-        context = decimal.getcontext()
-        # Set temporary decimal context for calculation
-        decimal.setcontext(
-            decimal.Context(prec=len(value), rounding=decimal.ROUND_DOWN)
-        )
+        return _DECIMAL_CONTEXT.divide(decimal.Decimal(value), _DECIMAL_PIP)
 
-        # Convert value
-        value = decimal.Decimal(value) / decimal.Decimal(PIP)
+    @staticmethod
+    def _column_to_list(values):
+        """
+        Args:
+            values (list|tuple|numpy.ndarray|pandas.Series): column
+        Returns:
+            list: column values as python objects
+        """
+        # NumPy arrays and pandas Series convert values to python
+        # objects at once (numpy.int64 to int, etc.)
+        if hasattr(values, 'tolist'):
+            return values.tolist()
 
-        # Reset decimal context to default
-        decimal.setcontext(context)
+        return list(values)
 
-        return value
+    @staticmethod
+    def to_pip_many(values):
+        """
+        Convert column of BIP values to PIP.
+        Args:
+            values (list|tuple|numpy.ndarray|pandas.Series): values in BIP
+                                                             (see `to_pip`)
+        Returns:
+            list[int]: values in PIP
+        """
+        parse = Amount.parse
+
+        return [parse(value) for value in MinterHelper._column_to_list(values)]
+
+    @staticmethod
+    def to_bip_many(values, scale=None):
+        """
+        Convert column of PIP values to BIP.
+        Values are converted by integer arithmetic, without Decimal.
+        Args:
+            values (list|tuple|numpy.ndarray|pandas.Series): values in PIP
+                                                             (int or digit
+                                                             str)
+            scale (int|None): number of decimal places (0-18) to format
+                              values to fixed scale strings, extra digits
+                              are dropped
+        Returns:
+            list[Amount|str]: amounts or strings, if `scale` is set
+        """
+        values = MinterHelper._column_to_list(values)
+
+        # Column of ints is checked at once, other values one by one
+        if not all(type(value) is int for value in values):
+            converted = []
+            for value in values:
+                if type(value) is Amount:
+                    value = value.pip
+                elif type(value) is not int:
+                    text = str(value)
+                    if not text.isdigit():
+                        raise ValueError(f'{text} is not correct PIP value')
+                    value = int(text)
+                converted.append(value)
+            values = converted
+        minimum = min(values, default=0)
+        if minimum < 0:
+            raise ValueError(f'{minimum} is not correct PIP value')
+
+        if scale is None:
+            return [Amount(value) for value in values]
+
+        if not 0 <= scale <= 18:
+            raise ValueError("'scale' should be from 0 to 18")
+
+        divisor = 10 ** (18 - scale)
+        if scale == 0:
+            return [str(value // divisor) for value in values]
+
+        fraction = 10 ** scale
+        return [
+            f'{integer}.{rest:0{scale}d}'
+            for integer, rest in (
+                divmod(value // divisor, fraction) for value in values
+            )
+        ]
 
     @staticmethod
     def prefix_add(value, prefix):
-        if prefix not in [PREFIX_ADDR, PREFIX_PUBKEY, PREFIX_CHECK, PREFIX_TX]:
+        if prefix not in PREFIXES:
             raise ValueError(f"Unknown prefix '{prefix}'")
         return prefix + value
 
     @staticmethod
     def prefix_remove(value):
-        value = value.replace(PREFIX_ADDR, '')
-        value = value.replace(PREFIX_PUBKEY, '')
-        value = value.replace(PREFIX_CHECK, '')
-        value = value.replace(PREFIX_TX, '')
+        """
+        Remove known prefix from the start of value.
+        Args:
+            value (str|PrefixedValue)
+        Returns:
+            str
+        """
+        if not isinstance(value, str):
+            return value.hex()
 
-        return value
+        return remove_prefix(value)
 
 
 @deprecated("Deprecated. Use 'MinterHelper' class instead")
@@ -0,0 +1,257 @@
+"""
+@author: Roman Matusevich
+"""
+import decimal
+import fractions
+import math
+import operator
+
+
+# Number of decimal places in BIP and number of PIP in 1 BIP
+DECIMALS = 18
+PIP = 10 ** DECIMALS
+
+# Context for values, which aren't handled by integers only (Decimal,
+# exponent notation, multiplication by float). It is passed to Decimal
+# methods explicitly, so context of current thread isn't used.
+_CONTEXT = decimal.Context(prec=100, rounding=decimal.ROUND_DOWN)
+_DECIMAL_PIP = decimal.Decimal(PIP)
+
+# PIP in one unit of decimal place by number of decimal places
+_FRACTION_SCALE = tuple(10 ** (DECIMALS - i) for i in range(DECIMALS + 1))
+
+
+class Amount(object):
+    """
+    Coin amount, stored as integer PIP.
+    Decimal BIP values are parsed and formatted with integer arithmetic
+    only. Amount compares and calculates with numbers as BIP value, so it
+    can be used instead of Decimal, e.g. `Amount.from_bip('1.5') == 1.5`.
+    As Decimal, it is equal to float only if float value is exact, so
+    `Amount.from_bip('0.1') != 0.1`.
+    """
+
+    __slots__ = ('pip',)
+
+    def __init__(self, pip):
+        """
+        Args:
+            pip (int): amount in PIP
+        """
+        if type(pip) is not int:
+            raise TypeError("'pip' should be 'int'")
+
+        self.pip = pip
+
+    @classmethod
+    def from_bip(cls, value):
+        """
+        Args:
+            value (str|int|float|Decimal|Amount): amount in BIP
+        Returns:
+            Amount
+        """
+        if type(value) is cls:
+            return value
+
+        return cls(cls.parse(value))
+
+    @staticmethod
+    def parse(value):
+        """
+        Convert BIP value to integer PIP. Digits after 18th decimal place
+        are dropped. Plain decimal strings and floats are parsed with
+        integer arithmetic only, other values with Decimal.
+        Args:
+            value (str|int|float|Decimal|Amount): amount in BIP
+        Returns:
+            int
+        """
+        if type(value) is int:
+            return value * PIP
+        if type(value) is Amount:
+            return value.pip
+
+        if type(value) is decimal.Decimal:
+            return int(_CONTEXT.multiply(value, _DECIMAL_PIP))
+
+        # Float is parsed from it's shortest repr, e.g. 0.1 -> '0.1'
+        text = value if type(value) is str else str(value)
+
+        # Plain unsigned decimal string is parsed by integers
+        integer, _, fraction = text.partition('.')
+        if text.isascii() and integer.isdigit():
+            if not fraction:
+                return int(integer) * PIP
+            if fraction.isdigit() and len(fraction) <= DECIMALS:
+                return int(integer) * PIP + \
+                    int(fraction) * _FRACTION_SCALE[len(fraction)]
+
+        # Sign, exponent notation, spaces, more than 18 decimal places
+        # and special values
+        return int(_CONTEXT.multiply(decimal.Decimal(text), _DECIMAL_PIP))
+
+    def to_decimal(self):
+        """
+        Returns:
+            Decimal: amount in BIP
+        """
+        return decimal.Decimal(str(self))
+
+    def __str__(self):
+        integer, fraction = divmod(abs(self.pip), PIP)
+        sign = '-' if self.pip < 0 else ''
+        if not fraction:
+            return f'{sign}{integer}'
+
+        fraction = str(fraction).rjust(DECIMALS, '0').rstrip('0')
+        return f'{sign}{integer}.{fraction}'
+
+    def __repr__(self):
+        return f"Amount('{self}')"
+
+    def __format__(self, format_spec):
+        if not format_spec:
+            return str(self)
+
+        return format(self.to_decimal(), format_spec)
+
+    def __reduce__(self):
+        return self.__class__, (self.pip,)
+
+    @staticmethod
+    def _other_pip(other):
+        """
+        Args:
+            other (any): second operand, number is BIP value
+        Returns:
+            int|None: operand in PIP or None if it isn't a finite number
+        """
+        if type(other) is Amount:
+            return other.pip
+        if type(other) is int:
+            return other * PIP
+        if type(other) is float and math.isfinite(other) or \
+                type(other) is decimal.Decimal and other.is_finite():
+            return Amount.parse(other)
+
+        return None
+
+    def _exact(self, other):
+        """
+        Exact values of both operands for comparison. Float and Decimal
+        are compared by their exact value (as Decimal does), so equal
+        values have equal hashes.
+        Args:
+            other (any): second operand, number is BIP value
+        Returns:
+            tuple|None: pair of int PIP or pair of Fraction BIP values or
+                        None if operand isn't a finite number
+        """
+        if type(other) is Amount:
+            return self.pip, other.pip
+        if type(other) is int:
+            return self.pip, other * PIP
+        if type(other) is float and math.isfinite(other) or \
+                type(other) is decimal.Decimal and other.is_finite():
+            return (
+                fractions.Fraction(self.pip, PIP), fractions.Fraction(other)
+            )
+
+        return None
+
+    def _compare(self, other, op):
+        values = self._exact(other)
+        if values is None:
+            return NotImplemented
+
+        return op(*values)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __hash__(self):
+        # Equal to hash of int, Fraction, Decimal or float with the same
+        # exact value
+        if not self.pip % PIP:
+            return hash(self.pip // PIP)
+
+        return hash(fractions.Fraction(self.pip, PIP))
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __bool__(self):
+        return self.pip != 0
+
+    def __float__(self):
+        return self.pip / PIP
+
+    def __int__(self):
+        # Whole BIP, truncated like int(Decimal)
+        integer = abs(self.pip) // PIP
+        return -integer if self.pip < 0 else integer
+
+    def __neg__(self):
+        return Amount(-self.pip)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Amount(abs(self.pip))
+
+    def __add__(self, other):
+        pip = self._other_pip(other)
+        if pip is None:
+            return NotImplemented
+
+        return Amount(self.pip + pip)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        pip = self._other_pip(other)
+        if pip is None:
+            return NotImplemented
+
+        return Amount(self.pip - pip)
+
+    def __rsub__(self, other):
+        pip = self._other_pip(other)
+        if pip is None:
+            return NotImplemented
+
+        return Amount(pip - self.pip)
+
+    def __mul__(self, other):
+        if type(other) is int:
+            return Amount(self.pip * other)
+        if type(other) in (decimal.Decimal, float):
+            pip = _CONTEXT.multiply(self.pip, decimal.Decimal(str(other)))
+            return Amount(int(pip))
+
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if type(other) is Amount:
+            # Ratio of amounts
+            return _CONTEXT.divide(self.pip, other.pip)
+        if type(other) is int:
+            return Amount(int(_CONTEXT.divide(self.pip, other)))
+        if type(other) in (decimal.Decimal, float):
+            pip = _CONTEXT.divide(self.pip, decimal.Decimal(str(other)))
+            return Amount(int(pip))
+
+        return NotImplemented
@@ -0,0 +1,109 @@
+"""
+@author: Roman Matusevich
+"""
+import sys
+
+
+class InternTable(object):
+    """
+    Bounded table of canonical values.
+    Maps raw key (e.g. RLP item bytes) to value, which is created once and
+    then shared by all decoded objects. Strings are also interned by
+    `sys.intern`, so the same value, got by raw bytes or by string, is
+    one object.
+    When table is full it is cleared, so hot keys are collected again.
+    """
+
+    def __init__(self, name, max_size):
+        """
+        Args:
+            name (str): table name
+            max_size (int): max number of keys, 0 to disable table
+        """
+        self.name = name
+        self.max_size = max_size
+        self._values = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, factory):
+        """
+        Get canonical value for key.
+        Args:
+            key (bytes|str): raw key
+            factory (callable): creates value from key on table miss
+        Returns:
+            any: canonical value
+        """
+        value = self._values.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = factory(key)
+        if type(value) is str:
+            value = sys.intern(value)
+
+        if self.max_size > 0:
+            if len(self._values) >= self.max_size:
+                self._values.clear()
+                self.resets += 1
+            self._values[key] = value
+
+        return value
+
+    def clear(self):
+        """ Remove all values and reset counters """
+        self._values.clear()
+        self.hits = self.misses = self.resets = 0
+
+    def stats(self):
+        """
+        Table usage and memory stats.
+        Memory is approximate size of table dict, keys and values.
+        Returns:
+            dict: size, max_size, hits, misses, resets, memory (bytes)
+        """
+        values = dict(self._values)
+        memory = sys.getsizeof(values) + sum(
+            sys.getsizeof(key) + sys.getsizeof(value)
+            for key, value in values.items()
+        )
+
+        return {
+            'size': len(values),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'resets': self.resets,
+            'memory': memory
+        }
+
+
+# Tables by raw 10-byte coin field or symbol, raw 20-byte address or
+# address string and raw 32-byte public key or public key string
+COINS = InternTable('coins', 1024)
+ADDRESSES = InternTable('addresses', 65536)
+PUBLIC_KEYS = InternTable('public_keys', 4096)
+
+TABLES = (COINS, ADDRESSES, PUBLIC_KEYS)
+
+
+def stats():
+    """
+    Returns:
+        dict: stats of each table by table name (see `InternTable.stats`)
+    """
+    return {table.name: table.stats() for table in TABLES}
+
+
+def clear():
+    """ Clear all tables """
+    for table in TABLES:
+        table.clear()
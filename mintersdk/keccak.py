@@ -0,0 +1,219 @@
+"""
+@author: Roman Matusevich
+"""
+
+
+class KeccakBackend(object):
+    """
+    Base Keccak-256 backend class.
+    Used only for inheritance by real backend classes.
+    """
+
+    # Backend name, used for registry
+    name = None
+
+    @classmethod
+    def is_available(cls):
+        """
+        Check if backend library is installed.
+        Returns:
+            bool
+        """
+        return True
+
+    def digest(self, data):
+        """
+        Args:
+            data (bytes)
+        Returns:
+            bytes: 32 bytes Keccak-256 digest
+        """
+        raise NotImplementedError
+
+
+class Pysha3Backend(KeccakBackend):
+    """
+    Default backend.
+    Uses `sha3` module, which is installed by `pysha3` or by
+    `safe-pysha3` package (fork, which builds on newer Pythons).
+    """
+
+    name = 'pysha3'
+
+    def __init__(self):
+        import sha3
+        self._keccak_256 = sha3.keccak_256
+
+    @classmethod
+    def is_available(cls):
+        try:
+            import sha3  # noqa: F401
+        except ImportError:
+            return False
+
+        return True
+
+    def digest(self, data):
+        return self._keccak_256(data).digest()
+
+
+class PycryptodomeBackend(KeccakBackend):
+    """
+    Fallback backend over `pycryptodome` (`Crypto`) or `pycryptodomex`
+    (`Cryptodome`) package.
+    """
+
+    name = 'pycryptodome'
+
+    def __init__(self):
+        self._new = self._import().new
+
+    @staticmethod
+    def _import():
+        """
+        Returns:
+            module: keccak module of installed package
+        """
+        try:
+            from Crypto.Hash import keccak
+        except ImportError:
+            from Cryptodome.Hash import keccak
+
+        return keccak
+
+    @classmethod
+    def is_available(cls):
+        try:
+            cls._import()
+        except ImportError:
+            return False
+
+        return True
+
+    def digest(self, data):
+        return self._new(data=data, digest_bits=256).digest()
+
+
+# Registered backends by name.
+# Order matters: first available backend is used by default.
+BACKENDS = {
+    Pysha3Backend.name: Pysha3Backend,
+    PycryptodomeBackend.name: PycryptodomeBackend
+}
+
+# Self test vectors: data and it's Keccak-256 digest
+_TEST_VECTORS = (
+    (b'', bytes.fromhex(
+        'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'
+    )),
+    (b'abc', bytes.fromhex(
+        '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45'
+    ))
+)
+
+# Current backend. Default backend is loaded on first use.
+_backend = None
+
+
+def register_backend(backend_cls):
+    """
+    Register custom Keccak backend.
+    Args:
+        backend_cls (type): KeccakBackend subclass
+    Returns:
+        type: registered class
+    """
+    if not backend_cls.name:
+        raise ValueError('Backend should have a name')
+
+    BACKENDS[backend_cls.name] = backend_cls
+
+    return backend_cls
+
+
+def self_test(backend):
+    """
+    Check backend against test vectors.
+    Args:
+        backend (KeccakBackend): backend instance
+    Returns:
+        bool
+    """
+    try:
+        return all(
+            backend.digest(data) == digest for data, digest in _TEST_VECTORS
+        )
+    except Exception:
+        return False
+
+
+def load_backend(name):
+    """
+    Create backend instance and check it against test vectors.
+    Args:
+        name (str): backend name
+    Returns:
+        KeccakBackend
+    """
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"Unknown Keccak backend '{name}'")
+
+    if not backend_cls.is_available():
+        raise ValueError(f"Keccak backend '{name}' is not installed")
+
+    backend = backend_cls()
+    if not self_test(backend):
+        raise ValueError(f"Keccak backend '{name}' failed self test")
+
+    return backend
+
+
+def set_backend(name='default'):
+    """
+    Select Keccak backend for all hashing operations.
+    Args:
+        name (str): backend name (see `BACKENDS`) or 'default' for first
+                    available backend
+    Returns:
+        KeccakBackend
+    """
+    global _backend
+
+    if name != 'default':
+        _backend = load_backend(name)
+        return _backend
+
+    for backend_name in BACKENDS:
+        try:
+            _backend = load_backend(backend_name)
+        except ValueError:
+            continue
+        return _backend
+
+    raise ValueError(
+        'There are no working Keccak backends. '
+        "Install 'safe-pysha3' or 'pycryptodome' package"
+    )
+
+
+def get_backend():
+    """
+    Get current Keccak backend
+    Returns:
+        KeccakBackend
+    """
+    if _backend is None:
+        set_backend()
+
+    return _backend
+
+
+def keccak_256(data):
+    """
+    Args:
+        data (bytes)
+    Returns:
+        bytes: 32 bytes Keccak-256 digest
+    """
+    return (_backend or get_backend()).digest(data)
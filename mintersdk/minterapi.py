@@ -6,7 +6,9 @@ import json
 import base64
 
 from deprecated import deprecated
-from mintersdk import MinterHelper
+from mintersdk import (
+    Amount, MinterHelper, PREFIX_ADDR, PREFIX_PUBKEY, interning
+)
 
 
 class MinterAPI(object):
@@ -53,13 +55,13 @@ class MinterAPI(object):
         """
         Get candidate
         Args:
-            public_key (string): candidate public key
+            public_key (str|MinterPubKey): candidate public key
             height (int): block height,
             pip2bip (bool): Convert coin amounts to BIP (default is in PIP)
         """
         response = self._request(
             command='candidate',
-            params={'pub_key': public_key, 'height': height}
+            params={'pub_key': str(public_key), 'height': height}
         )
 
         if pip2bip:
@@ -87,13 +89,16 @@ class MinterAPI(object):
         """
         Returns addresses balances
         Args:
-            addresses (list[str]): Addresses list
+            addresses (list[str|MinterAddress]): Addresses list
             height (int|None): Block height
             pip2bip (bool): Convert coin amounts to BIP (default is in PIP)
         """
         response = self._request(
             command='addresses',
-            params={'addresses': json.dumps(addresses), 'height': height}
+            params={
+                'addresses': json.dumps([str(a) for a in addresses]),
+                'height': height
+            }
         )
 
         if pip2bip:
@@ -107,12 +112,13 @@ class MinterAPI(object):
         """
         Get balance by address
         Args:
-            address (string): wallet address
+            address (str|MinterAddress): wallet address
             height (int): block height
             pip2bip (bool): Convert coin amounts to BIP (default is in PIP)
         """
         response = self._request(
-            command='address', params={'address': address, 'height': height}
+            command='address',
+            params={'address': str(address), 'height': height}
         )
 
         if pip2bip:
@@ -126,7 +132,7 @@ class MinterAPI(object):
         """
         Nonce - int, used for prevent transaction reply
         Args:
-            address (string): wallet address
+            address (str|MinterAddress): wallet address
         """
 
         balance = self.get_balance(address)
@@ -148,12 +154,13 @@ class MinterAPI(object):
         """
         Get transaction info
         Args:
-            tx_hash (string): transaction hash
+            tx_hash (str|MinterTxHash): transaction hash
             pip2bip (bool): Convert coin amounts to BIP (default is in PIP)
             decode_payload (bool): Try to decode payload from base64
         """
         response = self._request(
-            command='transaction', params={'hash': '0x' + tx_hash}
+            command='transaction',
+            params={'hash': '0x' + MinterHelper.prefix_remove(tx_hash)}
         )
 
         # Convert PIPs to BIPs
@@ -457,12 +464,12 @@ class MinterAPI(object):
         """
         Returns missed blocks by validator public key.
         Args:
-            public_key (str): candidate public key
+            public_key (str|MinterPubKey): candidate public key
             height (int): block chain height
         """
         return self._request(
             command='missed_blocks',
-            params={'pub_key': public_key, 'height': height}
+            params={'pub_key': str(public_key), 'height': height}
         )
 
     def get_genesis(self, pip2bip=False):
@@ -512,7 +519,8 @@ class MinterAPI(object):
             # Try to get json response and prepare result
             try:
                 return self.__response_processor(
-                    data=response.json(), funcs=[self.__digits_to_int]
+                    data=response.json(),
+                    funcs=[self.__digits_to_int, self.__intern_value]
                 )
             except Exception as e:
                 msg = 'Response parse JSON error: {}; Response is: {}'
@@ -550,6 +558,28 @@ class MinterAPI(object):
 
         return value
 
+    @staticmethod
+    def __intern_value(value, key):
+        """
+        Replace coin symbols, addresses and public keys with values from
+        interning tables, so values from many responses are shared.
+        Used as processor function for '__response_processor()'
+        Returns:
+            str|any
+        """
+        if type(value) is not str:
+            return value
+
+        if key in ['coin', 'gas_coin', 'symbol', 'coin_to_buy',
+                   'coin_to_sell']:
+            return interning.COINS.get(value, str)
+        if len(value) == 42 and value.startswith(PREFIX_ADDR):
+            return interning.ADDRESSES.get(value, str)
+        if len(value) == 66 and value.startswith(PREFIX_PUBKEY):
+            return interning.PUBLIC_KEYS.get(value, str)
+
+        return value
+
     @staticmethod
     def __pip_to_bip(value, key, exclude=None):
         """
@@ -558,7 +588,7 @@ class MinterAPI(object):
         Args:
             exclude ([str]): Keys excluded from conversion
         Returns:
-            Decimal|int
+            Amount|int
         """
         # Keys with coin values. Keys' values should be converted
         # from PIP to BIP
@@ -586,7 +616,7 @@ class MinterAPI(object):
                     (key in include_keys and key not in exclude_keys) or
                     key.isupper()
                 ):
-            return MinterHelper.to_bip(value)
+            return Amount(value)
 
         return value
 
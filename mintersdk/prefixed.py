@@ -0,0 +1,176 @@
+"""
+@author: Roman Matusevich
+"""
+
+# Prefixes
+PREFIX_ADDR = 'Mx'
+PREFIX_PUBKEY = 'Mp'
+PREFIX_CHECK = 'Mc'
+PREFIX_TX = 'Mt'
+
+PREFIXES = (PREFIX_ADDR, PREFIX_PUBKEY, PREFIX_CHECK, PREFIX_TX)
+
+
+def remove_prefix(value):
+    """
+    Remove known Minter prefix from the start of value.
+    Args:
+        value (str)
+    Returns:
+        str
+    """
+    if value[:2] in PREFIXES:
+        return value[2:]
+
+    return value
+
+
+def to_bytes(value):
+    """
+    Get raw bytes of prefixed value.
+    Args:
+        value (str|bytes|PrefixedValue): hex string with or without
+                                         prefix, raw bytes or typed value
+    Returns:
+        bytes
+    """
+    if isinstance(value, PrefixedValue):
+        return value.raw
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+
+    return bytes.fromhex(remove_prefix(value))
+
+
+class PrefixedValue(object):
+    """
+    Immutable value, stored as raw bytes.
+    Value is parsed once from string with prefix. String is rendered on
+    first use. Values are equal and hashed by type and raw bytes, so they
+    are cheap dict keys. Value isn't equal to it's string.
+    """
+
+    __slots__ = ('raw', '_text')
+
+    # Value prefix
+    PREFIX = None
+
+    # Allowed lengths of raw bytes or None for any length
+    SIZES = None
+
+    def __init__(self, raw):
+        """
+        Args:
+            raw (bytes): raw value
+        """
+        raw = bytes(raw)
+        if self.SIZES is not None and len(raw) not in self.SIZES:
+            raise ValueError(
+                f'{type(self).__name__} should be '
+                f'{" or ".join(map(str, self.SIZES))} bytes, got {len(raw)}'
+            )
+
+        object.__setattr__(self, 'raw', raw)
+        object.__setattr__(self, '_text', None)
+
+    @classmethod
+    def parse(cls, value):
+        """
+        Args:
+            value (str|bytes|PrefixedValue): string with or without
+                                             prefix, raw bytes or value
+                                             of the same type
+        Returns:
+            PrefixedValue
+        """
+        if type(value) is cls:
+            return value
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return cls(value)
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Can't parse {type(value).__name__} as {cls.__name__}"
+            )
+
+        # Only prefix of this type is accepted
+        text = value[2:] if value[:2] == cls.PREFIX else value
+        try:
+            raw = bytes.fromhex(text)
+        except ValueError:
+            raise ValueError(
+                f"'{value}' is not valid {cls.__name__}"
+            ) from None
+
+        return cls(raw)
+
+    def hex(self):
+        """
+        Returns:
+            str: hex without prefix
+        """
+        return self.raw.hex()
+
+    def __str__(self):
+        if self._text is None:
+            object.__setattr__(self, '_text', self.PREFIX + self.raw.hex())
+
+        return self._text
+
+    def __repr__(self):
+        return f"{type(self).__name__}('{self}')"
+
+    def __bytes__(self):
+        return self.raw
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self.raw == other.raw
+
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.raw)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' is immutable")
+
+    def __reduce__(self):
+        return self.__class__, (self.raw,)
+
+
+class MinterAddress(PrefixedValue):
+    """ Wallet address (Mx...) """
+
+    __slots__ = ()
+
+    PREFIX = PREFIX_ADDR
+    SIZES = (20,)
+
+
+class MinterPubKey(PrefixedValue):
+    """ Candidate public key or wallet public key (Mp...) """
+
+    __slots__ = ()
+
+    PREFIX = PREFIX_PUBKEY
+    SIZES = (32, 64)
+
+
+class MinterCheckId(PrefixedValue):
+    """ Raw check (Mc...) """
+
+    __slots__ = ()
+
+    PREFIX = PREFIX_CHECK
+
+
+class MinterTxHash(PrefixedValue):
+    """ Tx hash (Mt...) """
+
+    __slots__ = ()
+
+    PREFIX = PREFIX_TX
+    SIZES = (32,)
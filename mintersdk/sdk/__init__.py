@@ -1,36 +1,121 @@
 """
 @author: Roman Matusevich
 """
+import collections
+import threading
+
 import sslcrypto
 
+from mintersdk import (
+    MinterHelper, PREFIX_ADDR, PREFIX_PUBKEY, interning, to_bytes
+)
+from mintersdk.sdk import backends
+from mintersdk.sdk.workers import map_ordered as workers_map
+
 
 class ECDSA:
     """
-    ECDSA class
+    ECDSA class.
+    All operations are made by selected backend (see `set_backend`).
     """
 
     # Curve data
     curve = sslcrypto.ecc.get_curve('secp256k1')
     pub_key_len = curve._backend.public_key_length
 
+    # Current backend. Default backend is loaded on first use.
+    backend = None
+
+    # LRU cache of recovered public keys and addresses,
+    # keyed by (message, v, r, s)
+    recover_cache_size = 4096
+    _recover_cache = collections.OrderedDict()
+    _recover_lock = threading.Lock()
+
+    @classmethod
+    def set_backend(cls, name='default'):
+        """
+        Select ECDSA backend.
+        Backend is checked against test vectors before it is used.
+        Args:
+            name (str): backend name (see `backends.BACKENDS`),
+                        'default' for first available backend or
+                        'fastest' to select backend by micro-benchmark
+        Returns:
+            ECDSABackend
+        """
+        if name == 'fastest':
+            backend = backends.fastest_backend()
+        elif name == 'default':
+            available = backends.available_backends()
+            if not available:
+                raise ValueError('There are no working ECDSA backends')
+            backend = available[0]
+        else:
+            backend = backends.load_backend(name)
+
+        cls.backend = backend
+
+        return backend
+
+    @classmethod
+    def get_backend(cls):
+        """
+        Get current ECDSA backend
+        Returns:
+            ECDSABackend
+        """
+        if cls.backend is None:
+            cls.set_backend()
+
+        return cls.backend
+
+    @classmethod
+    def prepare_private_key(cls, private_key):
+        """
+        Prepare private key context, which can be reused for signing.
+        Args:
+            private_key (bytes): raw private key
+        Returns:
+            any: backend specific context
+        """
+        return cls.get_backend().prepare_private_key(private_key)
+
+    @staticmethod
+    def _digest(message):
+        """
+        Args:
+            message (bytes|str): 32 bytes digest or digest in hex
+        Returns:
+            bytes
+        """
+        if type(message) is bytes:
+            return message
+
+        return bytes.fromhex(message)
+
     @classmethod
     def sign(cls, message, private_key):
         """
         Args:
-            message (string): message to sign
-            private_key (string): private_key
+            message (bytes|string): digest to sign, raw or in hex
+            private_key (string|MinterSigningKey): private_key
         Returns:
             list(int)
         """
+        backend = cls.get_backend()
+
+        # Get private key context. Signing key object already holds
+        # prepared context, so private key isn't parsed again.
+        if type(private_key) is str:
+            private_key = backend.prepare_private_key(
+                bytes.fromhex(private_key)
+            )
+        else:
+            private_key = private_key.get_context(backend)
 
         # Create signature
-        signature = cls.curve.sign(
-            data=bytes.fromhex(message), private_key=bytes.fromhex(private_key),
-            recoverable=True, hash=None
-        )
-        v = signature[0]
-        r = int.from_bytes(signature[1:cls.pub_key_len+1], byteorder='big')
-        s = int.from_bytes(signature[cls.pub_key_len+1:], byteorder='big')
+        v, r, s = backend.sign(cls._digest(message), private_key)
 
         return [v, r, s]
 
@@ -38,30 +123,203 @@ class ECDSA:
     def recover(cls, message, vrs):
         """
         Args:
-            message (string): message
+            message (bytes|string): signed digest, raw or in hex
             vrs (tuple): tuple of v, r, s (r, s in hex)
         Returns:
             str
         """
 
-        # Create signature
-        signature = (
-            vrs[0].to_bytes(length=1, byteorder='big') +
-            int(vrs[1], 16).to_bytes(
-                length=cls.pub_key_len, byteorder='big'
-            ) +
-            int(vrs[2], 16).to_bytes(
-                length=cls.pub_key_len, byteorder='big'
-            )
-        )
-
         # Get raw recover of public key.
-        pub_key_raw = cls.curve.recover(
-            signature=signature, data=bytes.fromhex(message), hash=None
+        pub_key_raw = cls.get_backend().recover(
+            cls._digest(message), vrs[0], int(vrs[1], 16), int(vrs[2], 16)
         )
 
         # Convert public key to hex electrum format
-        x, y = cls.curve.decode_public_key(pub_key_raw)
-        pub_key = x.hex() + y.hex()
+        return pub_key_raw[1:].hex()
+
+    @classmethod
+    def recover_address(cls, message, vrs):
+        """
+        Recover public key and address.
+        Results are cached, so the same signature is recovered once.
+        Args:
+            message (bytes|string): signed digest, raw or in hex
+            vrs (tuple): tuple of v, r, s (r, s in hex)
+        Returns:
+            tuple(str, str): public key (Mp...) and address (Mx...)
+        """
+        key = cls._recover_key(message, vrs)
+
+        with cls._recover_lock:
+            result = cls._recover_cache.get(key)
+            if result is not None:
+                cls._recover_cache.move_to_end(key)
+                return result
+
+        # Public key without 0x04 prefix is hashed as is, without hex
+        public_key = cls.get_backend().recover(*key)[1:]
+        address = MinterHelper.prefix_add(
+            MinterHelper.keccak_digest(public_key)[-20:].hex(), PREFIX_ADDR
+        )
+        result = (
+            MinterHelper.prefix_add(public_key.hex(), PREFIX_PUBKEY),
+            interning.ADDRESSES.get(address, str)
+        )
+        cls._cache_recovered(key, result)
+
+        return result
+
+    @classmethod
+    def _recover_key(cls, message, vrs):
+        """
+        Args:
+            message (bytes|string): signed digest, raw or in hex
+            vrs (tuple): tuple of v, r, s (r, s in hex)
+        Returns:
+            tuple: digest, v, r, s as recover arguments and cache key
+        """
+        return cls._digest(message), vrs[0], int(vrs[1], 16), int(vrs[2], 16)
+
+    @classmethod
+    def _cache_recovered(cls, key, result):
+        """
+        Put recovered public key and address to LRU cache
+        Args:
+            key (tuple): message, v, r, s
+            result (tuple(str, str)): public key and address
+        """
+        if cls.recover_cache_size <= 0:
+            return
+
+        with cls._recover_lock:
+            cls._recover_cache[key] = result
+            cls._recover_cache.move_to_end(key)
+            while len(cls._recover_cache) > cls.recover_cache_size:
+                cls._recover_cache.popitem(last=False)
+
+    @classmethod
+    def clear_recover_cache(cls):
+        """ Remove all cached recovered public keys """
+        with cls._recover_lock:
+            cls._recover_cache.clear()
+
+    @classmethod
+    def verify(cls, message, vrs, signer):
+        """
+        Check signature is made by signer.
+        Args:
+            message (bytes|string): signed digest, raw or in hex
+            vrs (tuple): tuple of v, r, s (r, s in hex)
+            signer (str|bytes|MinterPubKey|MinterAddress): public key
+                                                           (Mp...) or
+                                                           address (Mx...)
+        Returns:
+            bool
+        """
+        try:
+            recovered = cls.recover_address(message, vrs)
+        except Exception:
+            return False
+
+        return cls._is_signer(recovered, signer)
+
+    @staticmethod
+    def _is_signer(recovered, signer):
+        """
+        Compare signer with recovered public key and address by raw bytes,
+        so hex case and value type don't matter.
+        Args:
+            recovered (tuple(str, str)): public key (Mp...) and address (Mx...)
+            signer (str|bytes|MinterPubKey|MinterAddress)
+        Returns:
+            bool: False for malformed signer
+        """
+        try:
+            raw = to_bytes(signer)
+        except (TypeError, ValueError):
+            return False
+
+        return raw in (to_bytes(recovered[0]), to_bytes(recovered[1]))
 
-        return pub_key
+    @classmethod
+    def verify_many(cls, items, workers=None):
+        """
+        Check many signatures.
+        Args:
+            items (iterable): (message, vrs, signer) tuples,
+                              see `verify` for values
+            workers (int|None): number of worker processes to recover
+                                keys in parallel. Keys are recovered in
+                                current process by default.
+        Returns:
+            list[bool]
+        """
+        items = list(items)
+        if not workers:
+            return [cls.verify(*item) for item in items]
+
+        # Malformed signature isn't verified, as in `verify`
+        keys = []
+        for message, vrs, _ in items:
+            try:
+                keys.append(cls._recover_key(message, vrs))
+            except Exception:
+                keys.append(None)
+
+        # Only keys, which aren't cached, are recovered by workers
+        with cls._recover_lock:
+            cached = [
+                None if key is None else cls._recover_cache.get(key)
+                for key in keys
+            ]
+        missing = [
+            index for index, result in enumerate(cached)
+            if result is None and keys[index] is not None
+        ]
+
+        results = workers_map(
+            _recover_worker, [items[index][:2] for index in missing],
+            workers=workers
+        )
+        for index, (success, result) in zip(missing, results):
+            if success:
+                # Address from worker is shared as address recovered here
+                result = (result[0], interning.ADDRESSES.get(result[1], str))
+                cls._cache_recovered(keys[index], result)
+                cached[index] = result
+
+        return [
+            result is not None and cls._is_signer(result, item[2])
+            for item, result in zip(items, cached)
+        ]
+
+    @classmethod
+    def private_to_public(cls, private_key):
+        """
+        Args:
+            private_key (bytes): raw private key
+        Returns:
+            bytes: uncompressed public key
+        """
+        return cls.get_backend().private_to_public(private_key)
+
+    @classmethod
+    def decode_public_key(cls, public_key):
+        """
+        Args:
+            public_key (bytes): compressed or uncompressed public key
+        Returns:
+            tuple(bytes, bytes): x, y coordinates
+        """
+        return cls.get_backend().decode_public_key(public_key)
+
+
+def _recover_worker(task):
+    """
+    Recover public key and address in worker process.
+    Args:
+        task (tuple): message, vrs
+    Returns:
+        tuple(str, str): public key and address
+    """
+    return ECDSA.recover_address(*task)
@@ -0,0 +1,333 @@
+"""
+@author: Roman Matusevich
+"""
+import time
+
+import sslcrypto
+
+
+class ECDSABackend(object):
+    """
+    Base secp256k1 ECDSA backend class.
+    Used only for inheritance by real backend classes.
+    All public keys are passed in uncompressed format (0x04 + x + y).
+    """
+
+    # Backend name, used for registry
+    name = None
+
+    # Whether sign and recover release the GIL while they are inside
+    # native code. Only such backend can sign or recover in parallel
+    # from several threads (see `workers.map_ordered(threads=True)`).
+    # Hashing and RLP encoding always hold the GIL.
+    releases_gil = False
+
+    @classmethod
+    def is_available(cls):
+        """
+        Check if backend library is installed.
+        Returns:
+            bool
+        """
+        return True
+
+    def prepare_private_key(self, private_key):
+        """
+        Prepare private key context, which is reused for signing.
+        Args:
+            private_key (bytes): raw private key
+        Returns:
+            any: backend specific context
+        """
+        return private_key
+
+    def sign(self, digest, private_key):
+        """
+        Create recoverable signature
+        Args:
+            digest (bytes): 32 bytes message hash
+            private_key (any): context from `prepare_private_key`
+        Returns:
+            tuple(int, int, int): v, r, s
+        """
+        raise NotImplementedError
+
+    def recover(self, digest, v, r, s):
+        """
+        Recover public key from signature
+        Args:
+            digest (bytes): 32 bytes message hash
+            v (int)
+            r (int)
+            s (int)
+        Returns:
+            bytes: uncompressed public key
+        """
+        raise NotImplementedError
+
+    def private_to_public(self, private_key):
+        """
+        Args:
+            private_key (bytes): raw private key
+        Returns:
+            bytes: uncompressed public key
+        """
+        raise NotImplementedError
+
+    def decode_public_key(self, public_key):
+        """
+        Args:
+            public_key (bytes): compressed or uncompressed public key
+        Returns:
+            tuple(bytes, bytes): x, y coordinates
+        """
+        raise NotImplementedError
+
+
+class SslcryptoBackend(ECDSABackend):
+    """
+    Default backend.
+    Uses `sslcrypto` package, which works over OpenSSL if it is found
+    or over pure python implementation otherwise.
+    OpenSSL is called by ctypes, which releases the GIL for each call.
+    Pure python implementation holds the GIL.
+    """
+
+    name = 'sslcrypto'
+
+    def __init__(self):
+        self.curve = sslcrypto.ecc.get_curve('secp256k1')
+        self.pub_key_len = self.curve._backend.public_key_length
+        self.releases_gil = type(self.curve._backend).__module__.startswith(
+            'sslcrypto.openssl'
+        )
+
+    def sign(self, digest, private_key):
+        signature = self.curve.sign(
+            data=digest, private_key=private_key, recoverable=True,
+            hash=None
+        )
+        v = signature[0]
+        r = int.from_bytes(signature[1:self.pub_key_len+1], byteorder='big')
+        s = int.from_bytes(signature[self.pub_key_len+1:], byteorder='big')
+
+        return v, r, s
+
+    def recover(self, digest, v, r, s):
+        signature = (
+            v.to_bytes(length=1, byteorder='big') +
+            r.to_bytes(length=self.pub_key_len, byteorder='big') +
+            s.to_bytes(length=self.pub_key_len, byteorder='big')
+        )
+        public_key = self.curve.recover(
+            signature=signature, data=digest, hash=None
+        )
+        x, y = self.curve.decode_public_key(public_key)
+
+        return b'\x04' + x + y
+
+    def private_to_public(self, private_key):
+        return self.curve.private_to_public(private_key)
+
+    def decode_public_key(self, public_key):
+        return self.curve.decode_public_key(public_key)
+
+
+class CoincurveBackend(ECDSABackend):
+    """
+    Optional backend over libsecp256k1.
+    Available if `coincurve` package is installed.
+    libsecp256k1 is called by cffi, which releases the GIL.
+    """
+
+    name = 'coincurve'
+    releases_gil = True
+
+    def __init__(self):
+        import coincurve
+        self.coincurve = coincurve
+
+    @classmethod
+    def is_available(cls):
+        try:
+            import coincurve  # noqa: F401
+        except ImportError:
+            return False
+
+        return True
+
+    def prepare_private_key(self, private_key):
+        return self.coincurve.PrivateKey(private_key)
+
+    def sign(self, digest, private_key):
+        if type(private_key) is bytes:
+            private_key = self.prepare_private_key(private_key)
+
+        # Signature is r (32 bytes) + s (32 bytes) + recovery id (1 byte)
+        signature = private_key.sign_recoverable(digest, hasher=None)
+        v = signature[64] + 27
+        r = int.from_bytes(signature[:32], byteorder='big')
+        s = int.from_bytes(signature[32:64], byteorder='big')
+
+        return v, r, s
+
+    def recover(self, digest, v, r, s):
+        signature = (
+            r.to_bytes(length=32, byteorder='big') +
+            s.to_bytes(length=32, byteorder='big') +
+            bytes([v - 27])
+        )
+        public_key = self.coincurve.PublicKey.from_signature_and_message(
+            signature, digest, hasher=None
+        )
+
+        return public_key.format(compressed=False)
+
+    def private_to_public(self, private_key):
+        public_key = self.coincurve.PublicKey.from_secret(private_key)
+        return public_key.format(compressed=False)
+
+    def decode_public_key(self, public_key):
+        public_key = self.coincurve.PublicKey(public_key)
+        public_key = public_key.format(compressed=False)
+
+        return public_key[1:33], public_key[33:]
+
+
+# Registered backends by name.
+# Order matters: first available backend is used by default.
+BACKENDS = {
+    SslcryptoBackend.name: SslcryptoBackend,
+    CoincurveBackend.name: CoincurveBackend
+}
+
+# Self test vectors. Signature of MinterBuyCoinTx test transaction.
+_TEST_PRIVATE_KEY = bytes.fromhex(
+    '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+)
+_TEST_PUBLIC_KEY = bytes.fromhex(
+    '045ecb93ea4368127b6311fd73fb86df0b63c38162fd564a204611a9549059c89b'
+    'd91e63be5ee1341c43e0a692fdae1da7894ab91969e13aa4cb15a5e59d2dbdee'
+)
+_TEST_DIGEST = bytes.fromhex(
+    'a75a6dfdd271971f8c2994e3ee8a4f2c9b6949aa27d4aa32fd87617b22b4e67b'
+)
+_TEST_SIGNATURE = (
+    28,
+    0x4ee095a20ca58062a5758e2a6d3941857daa8943b5873c57f111190ca88dbc56,
+    0x1148bf2fcc721ca353105e4f4a3419bec471d7ae08173f443a28c3ae6d27018a
+)
+
+
+def register_backend(backend_cls):
+    """
+    Register custom ECDSA backend.
+    Args:
+        backend_cls (type): ECDSABackend subclass
+    Returns:
+        type: registered class
+    """
+    if not backend_cls.name:
+        raise ValueError('Backend should have a name')
+
+    BACKENDS[backend_cls.name] = backend_cls
+
+    return backend_cls
+
+
+def self_test(backend):
+    """
+    Check backend against test vectors.
+    Args:
+        backend (ECDSABackend): backend instance
+    Returns:
+        bool
+    """
+    try:
+        context = backend.prepare_private_key(_TEST_PRIVATE_KEY)
+        signature = tuple(backend.sign(_TEST_DIGEST, context))
+        public_key = backend.recover(_TEST_DIGEST, *_TEST_SIGNATURE)
+
+        return (
+            signature == _TEST_SIGNATURE and
+            public_key == _TEST_PUBLIC_KEY and
+            backend.private_to_public(_TEST_PRIVATE_KEY) == _TEST_PUBLIC_KEY
+            and
+            backend.decode_public_key(_TEST_PUBLIC_KEY) == (
+                _TEST_PUBLIC_KEY[1:33], _TEST_PUBLIC_KEY[33:]
+            )
+        )
+    except Exception:
+        return False
+
+
+def load_backend(name):
+    """
+    Create backend instance and check it against test vectors.
+    Args:
+        name (str): backend name
+    Returns:
+        ECDSABackend
+    """
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"Unknown ECDSA backend '{name}'")
+
+    if not backend_cls.is_available():
+        raise ValueError(f"ECDSA backend '{name}' is not installed")
+
+    backend = backend_cls()
+    if not self_test(backend):
+        raise ValueError(f"ECDSA backend '{name}' failed self test")
+
+    return backend
+
+
+def available_backends():
+    """
+    Get all installed backends, which passed self test.
+    Returns:
+        list[ECDSABackend]
+    """
+    backends = []
+    for name in BACKENDS:
+        try:
+            backends.append(load_backend(name))
+        except ValueError:
+            continue
+
+    return backends
+
+
+def benchmark(backend, rounds=50):
+    """
+    Micro-benchmark of backend sign and recover operations.
+    Args:
+        backend (ECDSABackend): backend instance
+        rounds (int): number of sign + recover rounds
+    Returns:
+        float: elapsed seconds
+    """
+    context = backend.prepare_private_key(_TEST_PRIVATE_KEY)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        backend.sign(_TEST_DIGEST, context)
+        backend.recover(_TEST_DIGEST, *_TEST_SIGNATURE)
+
+    return time.perf_counter() - start
+
+
+def fastest_backend(rounds=50):
+    """
+    Get fastest of available backends by running micro-benchmark.
+    Args:
+        rounds (int): number of benchmark rounds
+    Returns:
+        ECDSABackend
+    """
+    backends = available_backends()
+    if not backends:
+        raise ValueError('There are no working ECDSA backends')
+
+    return min(backends, key=lambda b: benchmark(b, rounds=rounds))
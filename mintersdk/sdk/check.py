@@ -3,10 +3,17 @@
 """
 import hashlib
 
-import rlp
-from mintersdk import MinterHelper, PREFIX_CHECK, PREFIX_PUBKEY
+from mintersdk import Amount, MinterHelper, PREFIX_CHECK, to_bytes
 from mintersdk.sdk import ECDSA
-from mintersdk.sdk.wallet import MinterWallet
+from mintersdk.sdk.encoding import (
+    COIN, SIGNATURE, HexField, DecodingError, DecodingLimitError, encode,
+    decode_strings, validate_item
+)
+from mintersdk.sdk.workers import map_ordered as workers_map
+
+
+# Check lock: signature by passphrase (r, s, recovery id)
+LOCK = HexField(size=65)
 
 
 class MinterCheck(object):
@@ -15,6 +22,10 @@ class MinterCheck(object):
     Create new check or decode existing
     """
 
+    # Max raw check size in bytes.
+    # Larger raw checks are rejected by decoder before RLP decoding.
+    MAX_CHECK_SIZE = 1024
+
     def __init__(self, nonce, due_block, coin, value, gas_coin,
                  passphrase='', chain_id=1, **kwargs):
         """
@@ -30,9 +41,9 @@ class MinterCheck(object):
 
         self.nonce = nonce
         self.due_block = due_block
-        self.coin = coin.upper()
+        self.coin = MinterHelper.upper_coin_name(coin)
         self.value = value
-        self.gas_coin = gas_coin.upper()
+        self.gas_coin = MinterHelper.upper_coin_name(gas_coin)
         self.passphrase = passphrase
         self.chain_id = chain_id
 
@@ -47,9 +58,9 @@ class MinterCheck(object):
         Args:
             data (list)
         Returns:
-            hash (str)
+            bytes: raw digest
         """
-        return MinterHelper.keccak_hash(rlp.encode(data))
+        return MinterHelper.keccak_digest(encode(data))
 
     @staticmethod
     def __lockfromsignature(signature):
@@ -71,7 +82,7 @@ class MinterCheck(object):
         """
         Sign check
         Args:
-            private_key (str)
+            private_key (str|MinterSigningKey)
         """
         # Prepare structure
         # It contains nonce, chain_id, due_block, coin, value, gas_coin,
@@ -113,24 +124,73 @@ class MinterCheck(object):
         structure += signature
 
         # Get RLP, which will be the check
-        check = rlp.encode(structure).hex()
+        check = encode(structure).hex()
 
         return MinterHelper.prefix_add(check, PREFIX_CHECK)
 
+    @classmethod
+    def sign_many(cls, checks, private_key, workers=None, chunksize=None,
+                  threads=False):
+        """
+        Sign many checks over persistent process or thread pool.
+        Each check object gets `lock` and `signature` attributes, like
+        after `sign()` call.
+        Args:
+            checks (list[MinterCheck]): checks to sign
+            private_key (str|MinterSigningKey|list): private key to sign
+                                                     every check with or
+                                                     list of private keys,
+                                                     one per check
+            workers (int|None): number of worker processes or threads.
+                                Defaults to number of CPUs.
+            chunksize (int|None): checks per task sent to worker process
+            threads (bool): sign in thread pool instead of process pool.
+                            Signing is parallel only if ECDSA backend
+                            releases the GIL (`ECDSABackend.releases_gil`).
+        Returns:
+            list[str|Exception]: signed check or error for each check,
+                                 in input order
+        """
+        checks = list(checks)
+
+        # Pair each check with it's private key
+        if isinstance(private_key, (list, tuple)):
+            private_keys = list(private_key)
+            if len(private_keys) != len(checks):
+                raise ValueError(
+                    "'private_key' list should have the same length as "
+                    "'checks'"
+                )
+        else:
+            private_keys = [private_key] * len(checks)
+
+        results = workers_map(
+            _sign_worker, zip(checks, private_keys), workers=workers,
+            chunksize=chunksize, threads=threads
+        )
+
+        # Update check objects with data, which was received from workers
+        signed = []
+        for check, (success, result) in zip(checks, results):
+            if success:
+                result, check.lock, check.signature = result
+            signed.append(result)
+
+        return signed
+
     @classmethod
     def proof(cls, address, passphrase=''):
         """
         Create proof
         Args:
-            address (str)
+            address (str|MinterAddress)
             passphrase (str)
         Returns:
             str
         """
 
         # Get address hash
-        address = MinterHelper.prefix_remove(address)
-        address = bytes.fromhex(address)
+        address = to_bytes(address)
         address_hash = cls.__hash(data=[address])
 
         # Create SHA256 from passphrase
@@ -148,15 +208,38 @@ class MinterCheck(object):
         """
         Create check instance from raw check
         Args:
-            rawcheck (str)
+            rawcheck (str|MinterCheckId)
         Returns:
             MinterCheck
+        Raises:
+            DecodingError: raw check is malformed or exceeds size limit
         """
 
-        # Remove check prefix and RLP decode it
+        # Remove check prefix and RLP decode it.
+        # Size is checked before hex is parsed.
         rawcheck = MinterHelper.prefix_remove(rawcheck)
-        rawcheck = bytes.fromhex(rawcheck)
-        decoded = rlp.decode(rawcheck)
+        if len(rawcheck) // 2 > cls.MAX_CHECK_SIZE:
+            raise DecodingLimitError(
+                f'Raw check is {len(rawcheck) // 2} bytes, '
+                f'max is {cls.MAX_CHECK_SIZE}'
+            )
+        try:
+            rawcheck = bytes.fromhex(rawcheck)
+        except ValueError:
+            raise DecodingError('Raw check is not valid hex') from None
+        decoded = decode_strings(rawcheck)
+
+        # Check items before owner is recovered
+        if len(decoded) != 10:
+            raise DecodingError(
+                f'Raw check should have 10 RLP items, got {len(decoded)}'
+            )
+        if not decoded[0].isdigit():
+            raise DecodingError("'nonce' should be decimal digits")
+        validate_item(COIN, decoded[3], 'coin')
+        validate_item(COIN, decoded[5], 'gas_coin')
+        validate_item(LOCK, decoded[6], 'lock')
+        validate_item(SIGNATURE, decoded[7:], 'signature')
 
         # Create MinterCheck instance
         kwargs = {
@@ -164,14 +247,10 @@ class MinterCheck(object):
             'chain_id': int.from_bytes(decoded[1], 'big'),
             'due_block': int.from_bytes(decoded[2], 'big'),
             'coin': MinterHelper.decode_coin_name(decoded[3]),
-            'value': MinterHelper.to_bip(int.from_bytes(decoded[4], 'big')),
+            'value': Amount(int.from_bytes(decoded[4], 'big')),
             'gas_coin': MinterHelper.decode_coin_name(decoded[5]),
             'lock': decoded[6].hex(),
-            'signature': {
-                'v': int.from_bytes(decoded[7], 'big'),
-                'r': decoded[8].hex(),
-                's': decoded[9].hex()
-            }
+            'signature': SIGNATURE.decode(decoded[7:])
         }
         check = MinterCheck(**kwargs)
 
@@ -185,9 +264,26 @@ class MinterCheck(object):
             MinterHelper.encode_coin_name(check.gas_coin),
             bytes.fromhex(check.lock)
         ])
-        public_key = ECDSA.recover(msg_hash, tuple(check.signature.values()))
-        public_key = MinterHelper.prefix_add(public_key, PREFIX_PUBKEY)
-
-        check.owner = MinterWallet.get_address_from_public_key(public_key)
+        try:
+            _, check.owner = ECDSA.recover_address(
+                msg_hash, tuple(check.signature.values())
+            )
+        except ValueError as exc:
+            raise DecodingError(f"Can't recover owner: {exc}") from None
 
         return check
+
+
+def _sign_worker(task):
+    """
+    Sign check in worker process or thread.
+    Args:
+        task (tuple(MinterCheck, str|MinterSigningKey)): check and
+                                                         private key
+    Returns:
+        tuple(str, bytes, dict): signed check, lock and signature
+    """
+    check, private_key = task
+    signed = check.sign(private_key)
+
+    return signed, check.lock, check.signature
@@ -3,8 +3,8 @@
 """
 import base64
 
-import rlp
 from mintersdk import MinterHelper
+from mintersdk.sdk.encoding import encode
 
 
 class MinterDeeplink(object):
@@ -35,8 +35,7 @@ class MinterDeeplink(object):
     @staticmethod
     def __get_tx_data(tx):
         """ Get data from transaction """
-        structure = tx._structure_from_instance()
-        return rlp.encode(list(structure['data'].values()))
+        return tx._encode_data()
 
     def generate(self, password=None):
         """
@@ -55,7 +54,7 @@ class MinterDeeplink(object):
                           self.gas_price, gas_coin]
 
         # Create deephash base64 urlsafe
-        deephash = rlp.encode(deep_structure)
+        deephash = encode(deep_structure)
         deephash = base64.urlsafe_b64encode(deephash)
         deephash = deephash.decode().rstrip('=')
 
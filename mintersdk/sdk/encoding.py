@@ -0,0 +1,529 @@
+"""
+@author: Roman Matusevich
+"""
+from mintersdk import (
+    Amount, MinterHelper, PREFIX_ADDR, PREFIX_PUBKEY, PREFIX_CHECK, interning,
+    to_bytes
+)
+
+
+class DecodingError(ValueError):
+    """ Raised when RLP data can't be decoded """
+    pass
+
+
+class DecodingLimitError(DecodingError):
+    """ Raised when RLP data exceeds decoder size, items or depth limit """
+    pass
+
+
+class FieldLengthError(DecodingError):
+    """ Raised when decoded field has wrong bytes length """
+    pass
+
+
+# RLP encoding of empty string (zero integer)
+EMPTY = b'\x80'
+
+
+def encode_length(length, offset):
+    """
+    Create RLP length prefix
+    Args:
+        length (int): payload length
+        offset (int): 0x80 for strings, 0xc0 for lists
+    Returns:
+        bytes
+    """
+    if length < 56:
+        return bytes((offset + length,))
+
+    length = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes((offset + 55 + len(length),)) + length
+
+
+def encode_bytes(value):
+    """
+    RLP encode bytes string
+    Args:
+        value (bytes)
+    Returns:
+        bytes
+    """
+    length = len(value)
+    if length < 56:
+        if length == 1 and value[0] < 0x80:
+            return bytes(value)
+        return bytes((0x80 + length,)) + value
+
+    return encode_length(length, 0x80) + value
+
+
+def encode_int(value):
+    """
+    RLP encode unsigned integer (big endian, without leading zeros)
+    Args:
+        value (int)
+    Returns:
+        bytes
+    """
+    if value < 0:
+        raise ValueError('Only unsigned integers can be RLP encoded')
+    if value == 0:
+        return EMPTY
+
+    return encode_bytes(value.to_bytes((value.bit_length() + 7) // 8, 'big'))
+
+
+def encode_text(value):
+    """
+    RLP encode str (utf-8) or bytes
+    Args:
+        value (str|bytes)
+    Returns:
+        bytes
+    """
+    if type(value) is str:
+        value = value.encode()
+
+    return encode_bytes(value)
+
+
+def encode_list(items):
+    """
+    RLP encode list of already encoded items
+    Args:
+        items (list[bytes]): RLP encoded items
+    Returns:
+        bytes
+    """
+    payload = b''.join(items)
+    length = len(payload)
+    if length < 56:
+        return bytes((0xc0 + length,)) + payload
+
+    return encode_length(length, 0xc0) + payload
+
+
+def encode(value):
+    """
+    RLP encode any supported value.
+    Args:
+        value (bytes|str|int|list|tuple)
+    Returns:
+        bytes
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return encode_bytes(bytes(value))
+    if isinstance(value, str):
+        return encode_bytes(value.encode())
+    if isinstance(value, int) and not isinstance(value, bool):
+        return encode_int(value)
+    if isinstance(value, (list, tuple)):
+        return encode_list([encode(item) for item in value])
+
+    raise TypeError(f"Can't RLP encode value of '{type(value).__name__}'")
+
+
+def _decode_length(data, pos):
+    """
+    Decode RLP item prefix at position.
+    Args:
+        data (bytes)
+        pos (int): item start position
+    Returns:
+        tuple(bool, int, int): is list, payload start, payload end
+    """
+    try:
+        prefix = data[pos]
+    except IndexError:
+        raise DecodingError('Unexpected end of RLP data')
+
+    if prefix < 0x80:
+        return False, pos, pos + 1
+
+    if prefix < 0xc0:
+        is_list, short, long = False, 0x80, 0xb7
+    else:
+        is_list, short, long = True, 0xc0, 0xf7
+
+    if prefix <= long:
+        start = pos + 1
+        end = start + prefix - short
+        if not is_list and end - start == 1 and end <= len(data) and \
+                data[start] < 0x80:
+            raise DecodingError('Single byte should be encoded as itself')
+    else:
+        size = prefix - long
+        start = pos + 1 + size
+        if data[pos + 1:pos + 2] == b'\x00':
+            raise DecodingError('Length prefix has leading zeros')
+        length = int.from_bytes(data[pos + 1:start], 'big')
+        if length < 56:
+            raise DecodingError('Long length prefix for short payload')
+        end = start + length
+
+    if end > len(data):
+        raise DecodingError('Unexpected end of RLP data')
+
+    return is_list, start, end
+
+
+def _decode_item(data, pos, depth=None, budget=None):
+    """
+    Recursively decode RLP item at position.
+    Args:
+        data (bytes)
+        pos (int): item start position
+        depth (int|None): max nesting of lists from this item
+        budget (list[int]|None): number of items left to decode
+    Returns:
+        tuple(bytes|list, int): decoded item and item end position
+    """
+    is_list, start, end = _decode_length(data, pos)
+    if budget is not None:
+        budget[0] -= 1
+        if budget[0] < 0:
+            raise DecodingLimitError('Too many RLP items')
+    if not is_list:
+        return data[start:end], end
+
+    if depth is not None:
+        if depth == 0:
+            raise DecodingLimitError('RLP lists are nested too deep')
+        depth -= 1
+
+    items = []
+    pos = start
+    while pos < end:
+        item, pos = _decode_item(data, pos, depth, budget)
+        items.append(item)
+
+    if pos != end:
+        raise DecodingError('List payload length mismatch')
+
+    return items, end
+
+
+def decode(data, max_size=None, max_items=None, max_depth=None):
+    """
+    RLP decode data.
+    Limits are checked while decoding, so oversized or deeply nested
+    input is rejected before it is fully read.
+    Args:
+        data (bytes)
+        max_size (int|None): max data length in bytes
+        max_items (int|None): max number of decoded items (strings and
+                              lists)
+        max_depth (int|None): max nesting of lists
+    Returns:
+        bytes|list: decoded item, lists contain bytes or nested lists
+    """
+    data = bytes(data)
+    if max_size is not None and len(data) > max_size:
+        raise DecodingLimitError(
+            f'RLP data is {len(data)} bytes, max is {max_size}'
+        )
+
+    budget = [max_items] if max_items is not None else None
+    item, end = _decode_item(data, 0, max_depth, budget)
+    if end != len(data):
+        raise DecodingError('Trailing bytes after RLP item')
+
+    return item
+
+
+def decode_strings(data, max_size=None):
+    """
+    RLP decode flat list of strings.
+    Only outer list is read, string payloads are sliced as is.
+    Args:
+        data (bytes)
+        max_size (int|None): max data length in bytes
+    Returns:
+        list[bytes]
+    """
+    data = bytes(data)
+    if max_size is not None and len(data) > max_size:
+        raise DecodingLimitError(
+            f'RLP data is {len(data)} bytes, max is {max_size}'
+        )
+    is_list, pos, end = _decode_length(data, 0)
+    if not is_list:
+        raise DecodingError('RLP data is not a list')
+    if end != len(data):
+        raise DecodingError('Trailing bytes after RLP item')
+
+    items = []
+    while pos < end:
+        is_list, start, pos = _decode_length(data, pos)
+        if is_list:
+            raise DecodingError('Unexpected nested RLP list')
+        items.append(data[start:pos])
+
+    return items
+
+
+class Field(object):
+    """
+    Base tx data field class.
+    Field knows how to encode instance attribute value to RLP item and
+    how to decode RLP item back to verbose value.
+    """
+
+    # Exact bytes length of field item, if it is fixed
+    size = None
+
+    def encode(self, value):
+        """
+        Args:
+            value (any): instance attribute value
+        Returns:
+            bytes: RLP encoded item
+        """
+        raise NotImplementedError
+
+    def decode(self, item):
+        """
+        Args:
+            item (bytes|list): decoded RLP item
+        Returns:
+            any: verbose value
+        """
+        raise NotImplementedError
+
+    def decode_compact(self, item):
+        """
+        Decode to compact value, if field has one.
+        Args:
+            item (bytes|list): decoded RLP item
+        Returns:
+            any: compact or verbose value
+        """
+        return self.decode(item)
+
+    def validate(self, item):
+        """
+        Check shape and length of decoded RLP item before decoding it.
+        Args:
+            item (bytes|list): decoded RLP item
+        Raises:
+            DecodingError: item is a list instead of string
+            FieldLengthError: item has wrong length
+        """
+        if type(item) is not bytes:
+            raise DecodingError('Expected RLP string, got list')
+        if self.size is not None and len(item) != self.size:
+            raise FieldLengthError(
+                f'Expected {self.size} bytes, got {len(item)}'
+            )
+
+
+def validate_item(field, item, name):
+    """
+    Check decoded RLP item by field. Error message gets item name.
+    Args:
+        field (Field)
+        item (bytes|list): decoded RLP item
+        name (str): item name
+    Raises:
+        DecodingError
+    """
+    try:
+        field.validate(item)
+    except DecodingError as exc:
+        raise type(exc)(f"'{name}': {exc}") from None
+
+
+class UintField(Field):
+    """ Unsigned integer. Empty string is treated as zero. """
+
+    def encode(self, value):
+        return encode_int(value) if value != '' else EMPTY
+
+    def decode(self, item):
+        return int.from_bytes(item, 'big')
+
+
+class AmountField(Field):
+    """ Coin amount, BIP or `Amount` in attribute, PIP in RLP """
+
+    def encode(self, value):
+        return encode_int(Amount.parse(value))
+
+    def decode(self, item):
+        return Amount(int.from_bytes(item, 'big'))
+
+
+class CoinField(Field):
+    """ Coin symbol, null padded to 10 bytes """
+
+    size = 10
+
+    def encode(self, value):
+        symbol = value.upper().encode()
+        return encode_bytes(symbol + b'\x00' * (10 - len(symbol)))
+
+    def decode(self, item):
+        return MinterHelper.decode_coin_name(item)
+
+    def validate(self, item):
+        super().validate(item)
+        if not item.rstrip(b'\x00').isalnum():
+            raise DecodingError('Coin symbol should be alphanumeric')
+
+
+class TextField(Field):
+    """ UTF-8 string """
+
+    def encode(self, value):
+        return encode_text(value)
+
+    def decode(self, item):
+        return item.decode()
+
+
+class HexField(Field):
+    """ Bytes, hex string with optional Minter prefix in attribute """
+
+    def __init__(self, prefix=None, size=None, table=None):
+        """
+        Args:
+            prefix (str|None): Minter prefix (Mx, Mp, Mc)
+            size (int|None): exact bytes length
+            table (InternTable|None): table to share decoded values
+        """
+        self.prefix = prefix
+        self.size = size
+        self.table = table
+
+    def encode(self, value):
+        if self.prefix:
+            return encode_bytes(to_bytes(value))
+
+        return encode_bytes(bytes.fromhex(value))
+
+    def decode(self, item):
+        if self.table is not None:
+            return self.table.get(item, self._decode)
+
+        return self._decode(item)
+
+    def _decode(self, item):
+        if self.prefix:
+            return MinterHelper.prefix_add(item.hex(), self.prefix)
+
+        return item.hex()
+
+
+class ListField(Field):
+    """ List of same type values """
+
+    def __init__(self, field, max_length=None):
+        """
+        Args:
+            field (Field): list item field
+            max_length (int|None): max number of items
+        """
+        self.field = field
+        self.max_length = max_length
+
+    def encode(self, value):
+        _encode = self.field.encode
+        return encode_list([_encode(item) for item in value])
+
+    def decode(self, item):
+        _decode = self.field.decode
+        return [_decode(i) for i in item]
+
+    def validate(self, item):
+        if type(item) is not list:
+            raise DecodingError('Expected RLP list, got string')
+        if self.max_length is not None and len(item) > self.max_length:
+            raise DecodingLimitError(
+                f'Expected max {self.max_length} items, got {len(item)}'
+            )
+
+        _validate = self.field.validate
+        for i in item:
+            _validate(i)
+
+
+class StructField(Field):
+    """ Dict of fields, encoded as RLP list """
+
+    def __init__(self, fields):
+        """
+        Args:
+            fields (tuple(tuple(str, Field))): struct schema
+        """
+        self.fields = tuple(fields)
+        self._encoders = tuple(
+            (name, field.encode) for name, field in self.fields
+        )
+
+    def encode(self, value):
+        return encode_list([
+            _encode(value[name]) for name, _encode in self._encoders
+        ])
+
+    def decode(self, item):
+        return {
+            name: field.decode(i)
+            for (name, field), i in zip(self.fields, item)
+        }
+
+    def validate(self, item):
+        if type(item) is not list:
+            raise DecodingError('Expected RLP list, got string')
+        if len(item) != len(self.fields):
+            raise DecodingError(
+                f'Expected {len(self.fields)} items, got {len(item)}'
+            )
+
+        for (_, field), i in zip(self.fields, item):
+            field.validate(i)
+
+
+class SignatureField(Field):
+    """ ECDSA signature [v, r, s], r and s are hex in verbose value """
+
+    # Max bytes length of r and s
+    MAX_SIZE = 32
+
+    def encode(self, value):
+        return encode_list([
+            encode_int(value['v']),
+            encode_int(int(value['r'], 16)),
+            encode_int(int(value['s'], 16))
+        ])
+
+    def decode(self, item):
+        return {
+            'v': int.from_bytes(item[0], 'big'),
+            'r': item[1].hex(),
+            's': item[2].hex()
+        }
+
+    def validate(self, item):
+        if type(item) is not list or len(item) != 3 or \
+                any(type(i) is not bytes for i in item):
+            raise DecodingError('Signature should be RLP list of 3 strings')
+        if item[0] not in (b'\x1b', b'\x1c'):
+            raise DecodingError('Signature v should be 27 or 28')
+        if len(item[1]) > self.MAX_SIZE or len(item[2]) > self.MAX_SIZE:
+            raise FieldLengthError(
+                f'Signature r and s should be max {self.MAX_SIZE} bytes'
+            )
+
+
+# Field instances, shared by all tx schemas
+UINT = UintField()
+AMOUNT = AmountField()
+COIN = CoinField()
+TEXT = TextField()
+HEX = HexField()
+ADDRESS = HexField(PREFIX_ADDR, size=20, table=interning.ADDRESSES)
+PUBKEY = HexField(PREFIX_PUBKEY, size=32, table=interning.PUBLIC_KEYS)
+CHECK = HexField(PREFIX_CHECK)
+SIGNATURE = SignatureField()
@@ -0,0 +1,141 @@
+"""
+@author: Roman Matusevich
+"""
+import decimal
+
+from mintersdk.sdk.transactions import MinterTx
+
+
+def payload_length(value):
+    """
+    Bytes length of payload or service data.
+    ASCII string length is taken without encoding.
+    Args:
+        value (str|bytes|int|None): value or it's bytes length
+    Returns:
+        int
+    """
+    if not value:
+        return 0
+    if type(value) is int:
+        return value
+    if type(value) is str and not value.isascii():
+        return len(value.encode())
+
+    return len(value)
+
+
+def sell_return(sell_amount, supply, reserve, crr):
+    """
+    Amount of base coin, which is received by selling custom coin.
+    Args:
+        sell_amount (int): coin amount (PIP)
+        supply (int): coin supply (PIP)
+        reserve (int): coin reserve (PIP)
+        crr (int): coin constant reserve ratio (10-100)
+    Returns:
+        int: base coin amount (PIP)
+    """
+    if sell_amount == 0:
+        return 0
+    if sell_amount >= supply:
+        return reserve
+
+    if crr == 100:
+        return sell_amount * reserve // supply
+
+    # reserve * (1 - (1 - sell_amount / supply) ^ (100 / crr))
+    with decimal.localcontext(
+            decimal.Context(prec=50, rounding=decimal.ROUND_DOWN)):
+        ratio = 1 - decimal.Decimal(sell_amount) / supply
+        result = decimal.Decimal(reserve) * (
+            1 - ratio ** (decimal.Decimal(100) / crr)
+        )
+
+        return int(result)
+
+
+def sale_amount(want_receive, supply, reserve, crr):
+    """
+    Amount of custom coin to sell to receive base coin amount,
+    e.g. tx fee in custom gas coin. It is inverse of `sell_return`,
+    rounded up, so selling it returns at least `want_receive`.
+    Args:
+        want_receive (int): base coin amount (PIP)
+        supply (int): coin supply (PIP)
+        reserve (int): coin reserve (PIP)
+        crr (int): coin constant reserve ratio (10-100)
+    Returns:
+        int: coin amount (PIP)
+    """
+    if want_receive == 0:
+        return 0
+    if want_receive >= reserve:
+        raise ValueError('Coin reserve is too small')
+
+    if crr == 100:
+        return -(-want_receive * supply // reserve)
+
+    # supply * (1 - ((reserve - want_receive) / reserve) ^ (crr / 100))
+    with decimal.localcontext(
+            decimal.Context(prec=50, rounding=decimal.ROUND_UP)):
+        ratio = decimal.Decimal(reserve - want_receive) / reserve
+        result = decimal.Decimal(supply) * (
+            1 - ratio ** (decimal.Decimal(crr) / 100)
+        )
+
+        return int(result.to_integral_value(rounding=decimal.ROUND_CEILING))
+
+
+def plan_fees(rows, coin=None):
+    """
+    Calculate fees of many txs without creating tx objects.
+    Args:
+        rows (iterable): (type, payload, service_data, recipients) rows.
+                         type: tx type (int) or tx class,
+                         payload, service_data: value or it's bytes length,
+                         recipients: number of MultiSend recipients
+                         (ignored for other txs)
+        coin (dict|None): gas coin data to convert fees from base coin:
+                          {'supply': PIP, 'reserve': PIP, 'crr': int}
+    Returns:
+        tuple(list[int], int): fee for each row and total fee (PIP)
+    """
+    multiplier = MinterTx.FEE_DEFAULT_MULTIPLIER
+    payload_commission = MinterTx.PAYLOAD_COMMISSION
+
+    # Fee units by tx type, looked up once per type
+    commissions = {}
+
+    fees = []
+    for tx_type, payload, service_data, recipients in rows:
+        try:
+            commission, per_recipient = commissions[tx_type]
+        except KeyError:
+            tx_class = tx_type
+            if type(tx_type) is int:
+                tx_class = MinterTx.get_type_class(tx_type)
+                if tx_class is None:
+                    raise ValueError(f"Undefined tx type '{tx_type}'")
+            commission = tx_class.COMMISSION
+            per_recipient = getattr(tx_class, 'COMMISSION_PER_RECIPIENT', 0)
+            commissions[tx_type] = commission, per_recipient
+
+        units = commission + payload_commission * (
+            payload_length(payload) + payload_length(service_data)
+        )
+        if per_recipient and recipients:
+            units += (recipients - 1) * per_recipient
+
+        fees.append(units * multiplier)
+
+    if coin is not None:
+        # Plan rows mostly have a few distinct fees, convert each once
+        converted = {}
+        for fee in set(fees):
+            converted[fee] = sale_amount(
+                fee, coin['supply'], coin['reserve'], coin['crr']
+            )
+        fees = [converted[fee] for fee in fees]
+
+    return fees, sum(fees)
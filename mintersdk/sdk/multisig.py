@@ -0,0 +1,153 @@
+"""
+@author: Roman Matusevich
+"""
+from mintersdk import to_bytes
+from mintersdk.sdk import ECDSA
+from mintersdk.sdk.encoding import encode, encode_bytes, encode_list
+from mintersdk.sdk.transactions import MinterTx
+from mintersdk.sdk.workers import map_ordered as workers_map
+
+
+class MultisigSession(object):
+    """
+    Multi signature tx signing session.
+    Unsigned tx is encoded and hashed once, then signatures are collected
+    from private keys or from detached signatures and tx is assembled
+    in one pass by `finalize`.
+    Tx attributes shouldn't be changed while session is active.
+    """
+
+    def __init__(self, tx, ms_address, signatures=None):
+        """
+        Args:
+            tx (MinterTx): tx to sign
+            ms_address (str|MinterAddress): multisig address (Mx...)
+            signatures (list[list[int]]|None): already collected raw
+                                               signatures (v, r, s)
+        """
+        tx.signature_type = tx.SIGNATURE_MULTI_TYPE
+
+        self.tx = tx
+        self.ms_address = ms_address
+        self.signatures = list(signatures or [])
+
+        # Unsigned tx items and hash to sign
+        self._items = tx._encode_unsigned()
+        self.keccak = tx._unsigned_hash(self._items)
+
+    @classmethod
+    def from_raw(cls, raw_tx):
+        """
+        Continue session from partially signed multisig tx.
+        Args:
+            raw_tx (str|bytes): signed tx
+        Returns:
+            MultisigSession
+        """
+        tx = MinterTx.from_raw(raw_tx)
+
+        if tx.signature_type != MinterTx.SIGNATURE_MULTI_TYPE:
+            raise Exception(
+                'Signature can be added only to tx with multi signature type'
+            )
+
+        signatures = [
+            [item['v'], int(item['r'], 16), int(item['s'], 16)]
+            for item in tx.signature_data['signatures']
+        ]
+
+        return cls(
+            tx=tx, ms_address=tx.signature_data['from_mx'],
+            signatures=signatures
+        )
+
+    def sign(self, private_key):
+        """
+        Sign tx hash and add signature to session.
+        Args:
+            private_key (str|MinterSigningKey)
+        Returns:
+            str: hex signature, the same as `tx.generate_signature()`
+        """
+        signature = ECDSA.sign(self.keccak, private_key)
+        self.signatures.append(signature)
+
+        return encode(signature).hex()
+
+    def sign_many(self, private_keys, workers=None):
+        """
+        Sign tx hash by several private keys over persistent process pool.
+        Signatures are added in keys order.
+        Args:
+            private_keys (list[str|MinterSigningKey])
+            workers (int|None): number of worker processes.
+                                Defaults to number of CPUs.
+        """
+        results = workers_map(
+            _sign_worker, [(self.keccak, pk) for pk in private_keys],
+            workers=workers, chunksize=1
+        )
+
+        # Add nothing if any key fails
+        for success, result in results:
+            if not success:
+                raise result
+
+        self.signatures.extend(result for _, result in results)
+
+    def add_signature(self, signature):
+        """
+        Add detached signature (see `MinterTx.generate_signature`).
+        Args:
+            signature (str): hex signature
+        """
+        self.signatures.append(MinterTx.decode_signature(signature))
+
+    def finalize(self):
+        """
+        Assemble signed tx from collected signatures.
+        Tx object gets `signed_tx` and `signature_data`.
+        Returns:
+            str: signed tx
+        """
+        signature_data = [
+            to_bytes(self.ms_address),
+            self.signatures
+        ]
+        self.tx.signed_bytes = encode_list(
+            self._items + [encode_bytes(encode(signature_data))]
+        )
+        # Signature values in hex, as they are decoded by `from_raw`
+        self.tx.signature_data = {
+            'from_mx': self.ms_address,
+            'signatures': [
+                {'v': v, 'r': _int_to_hex(r), 's': _int_to_hex(s)}
+                for v, r, s in self.signatures
+            ]
+        }
+        self.tx.from_mx = self.ms_address
+
+        return self.tx.signed_tx
+
+
+def _int_to_hex(value):
+    """
+    Args:
+        value (int)
+    Returns:
+        str: big endian bytes in hex
+    """
+    return value.to_bytes((value.bit_length() + 7) // 8, 'big').hex()
+
+
+def _sign_worker(task):
+    """
+    Sign tx hash in worker process.
+    Args:
+        task (tuple(str, str|MinterSigningKey)): tx hash and private key
+    Returns:
+        list[int]: v, r, s
+    """
+    keccak, private_key = task
+
+    return ECDSA.sign(keccak, private_key)
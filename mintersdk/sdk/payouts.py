@@ -0,0 +1,147 @@
+"""
+@author: Roman Matusevich
+"""
+import itertools
+import os
+
+from mintersdk import Amount, MinterHelper, to_bytes
+from mintersdk.sdk.encoding import (
+    ADDRESS, COIN, encode_int, encode_length, encode_text
+)
+from mintersdk.sdk.transactions import MinterTx, MinterMultiSendCoinTx
+
+
+# Reserved size of tx header (without payload and service data) and
+# signature in bytes, when recipients are split to txs by size.
+# Multi signature data is larger, than single one.
+TX_OVERHEAD = 300
+
+
+def merge_recipients(rows):
+    """
+    Merge rows with the same coin and recipient.
+    Recipients are compared by raw address, so `MinterAddress`, address
+    with or without prefix and in any case are merged.
+    All unique recipients are kept in memory until rows are exhausted.
+    Args:
+        rows (iterable): (coin, to, value) rows, value in BIP
+    Returns:
+        iterator: (coin, to, value) rows, value in PIP, in order of
+                  first appearance. Recipient is address string (Mx...).
+    """
+    merged = {}
+    for coin, to, value in rows:
+        key = (coin.upper(), to_bytes(to))
+        merged[key] = merged.get(key, 0) + MinterHelper.to_pip(value)
+
+    return (
+        (coin, ADDRESS.decode(to), value)
+        for (coin, to), value in merged.items()
+    )
+
+
+def chunk_recipients(rows, max_recipients=None, max_tx_size=None,
+                     in_pip=False, payload='', service_data=''):
+    """
+    Split recipients to MultiSend txs data.
+    Rows are consumed lazily, one chunk at a time.
+    Args:
+        rows (iterable): (coin, to, value) rows
+        max_recipients (int|None): max recipients per tx.
+                                   Defaults to network limit.
+        max_tx_size (int|None): max raw tx size in bytes.
+                                Defaults to network limit.
+        in_pip (bool): row values are in PIP instead of BIP
+        payload (str|bytes): tx payload, which takes part of tx size
+        service_data (str|bytes): tx service data
+    Returns:
+        iterator: lists of send items {coin, to, value}
+    """
+    max_recipients = max_recipients or MinterMultiSendCoinTx.MAX_RECIPIENTS
+    max_size = (max_tx_size or MinterTx.MAX_TX_SIZE) - TX_OVERHEAD - \
+        len(encode_text(payload)) - len(encode_text(service_data))
+    if max_size <= 0:
+        raise ValueError('There is no room for recipients in tx size')
+
+    chunk, size = [], 0
+    for coin, to, value in rows:
+        pip = value if in_pip else MinterHelper.to_pip(value)
+
+        # Encoded item size: list prefix + coin + address + value
+        item_size = len(COIN.encode(coin)) + len(ADDRESS.encode(to)) + \
+            len(encode_int(pip))
+        item_size += len(encode_length(item_size, 0xc0))
+
+        if chunk and (len(chunk) == max_recipients or
+                      size + item_size > max_size):
+            yield chunk
+            chunk, size = [], 0
+
+        chunk.append({
+            'coin': coin.upper(),
+            'to': to,
+            'value': Amount(pip)
+        })
+        size += item_size
+
+    if chunk:
+        yield chunk
+
+
+def payout(rows, private_key, nonce, gas_coin, chain_id=1, gas_price=1,
+           payload='', service_data='', merge=True, max_recipients=None,
+           max_tx_size=None, workers=None, batch_size=None):
+    """
+    Create and sign MultiSend txs for any number of recipients.
+    Recipients are split to txs by network limits, txs get consecutive
+    nonces and are signed by batches over persistent process pool.
+    Txs are yielded lazily, so only one batch is kept in memory.
+    Args:
+        rows (iterable): (coin, to, value) rows, value in BIP
+        private_key (str|MinterSigningKey): sender private key
+        nonce (int): nonce of first tx
+        gas_coin (str)
+        chain_id (int)
+        gas_price (int)
+        payload (str)
+        service_data (str)
+        merge (bool): merge rows with the same coin and recipient.
+                      Needs memory for all unique recipients, set to False
+                      to stream rows if they are already unique.
+        max_recipients (int|None): max recipients per tx
+        max_tx_size (int|None): max raw tx size in bytes
+        workers (int|None): number of worker processes.
+                            Defaults to number of CPUs.
+        batch_size (int|None): txs signed at once.
+                               Defaults to 4 txs per worker.
+    Returns:
+        iterator: signed MinterMultiSendCoinTx objects
+    """
+    if merge:
+        rows = merge_recipients(rows)
+
+    chunks = chunk_recipients(
+        rows, max_recipients=max_recipients, max_tx_size=max_tx_size,
+        in_pip=merge, payload=payload, service_data=service_data
+    )
+    batch_size = batch_size or (workers or os.cpu_count() or 1) * 4
+
+    while True:
+        batch = [
+            MinterMultiSendCoinTx(
+                txs=txs, nonce=nonce + index, gas_coin=gas_coin,
+                chain_id=chain_id, gas_price=gas_price, payload=payload,
+                service_data=service_data
+            )
+            for index, txs in enumerate(itertools.islice(chunks, batch_size))
+        ]
+        if not batch:
+            break
+        nonce += len(batch)
+
+        signed = MinterTx.sign_many(batch, private_key, workers=workers)
+        for tx, result in zip(batch, signed):
+            # Following txs can't be applied without this one
+            if isinstance(result, Exception):
+                raise result
+            yield tx
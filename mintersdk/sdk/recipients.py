@@ -0,0 +1,187 @@
+"""
+@author: Roman Matusevich
+"""
+import array
+
+from mintersdk import Amount, MinterHelper
+from mintersdk.sdk.encoding import (
+    ADDRESS, AMOUNT, COIN, ListField, StructField, encode_bytes, encode_int,
+    encode_list
+)
+
+
+class MultiSendRecipients(object):
+    """
+    Compact MultiSend recipients list.
+    Recipients are kept in parallel arrays: addresses in one bytes buffer
+    (20 bytes each), coin ids into coins table and values as int PIP.
+    Verbose dict {coin, to, value} is created only on item access.
+    """
+
+    __slots__ = ('coins', 'coin_ids', 'addresses', 'values')
+
+    # Address length in bytes
+    ADDRESS_LEN = 20
+
+    def __init__(self, coins, coin_ids, addresses, values):
+        """
+        Args:
+            coins (tuple(str)): coins table
+            coin_ids (array): index in coins table for each recipient
+            addresses (bytes): concatenated raw addresses
+            values (list[int]): values in PIP
+        """
+        self.coins = coins
+        self.coin_ids = coin_ids
+        self.addresses = addresses
+        self.values = values
+
+    @classmethod
+    def from_items(cls, items):
+        """
+        Create from decoded RLP items.
+        Args:
+            items (list[list[bytes]]): [coin, to, value] items
+        Returns:
+            MultiSendRecipients
+        """
+        coins = {}
+        coin_ids = array.array('H')
+        addresses = []
+        values = []
+        for coin, to, value in items:
+            coin_id = coins.get(coin)
+            if coin_id is None:
+                coin_id = coins[coin] = len(coins)
+            coin_ids.append(coin_id)
+            addresses.append(to)
+            values.append(int.from_bytes(value, 'big'))
+
+        if any(len(to) != cls.ADDRESS_LEN for to in addresses):
+            raise ValueError('Recipient address should be 20 bytes')
+
+        return cls(
+            coins=tuple(MinterHelper.decode_coin_name(c) for c in coins),
+            coin_ids=coin_ids,
+            addresses=b''.join(addresses),
+            values=values
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        """
+        Get verbose recipient dict
+        Args:
+            index (int)
+        Returns:
+            dict: {coin, to, value}
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Recipient index out of range')
+
+        return {
+            'coin': self.coin(index),
+            'to': self.address(index),
+            'value': Amount(self.values[index])
+        }
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, MultiSendRecipients):
+            other = other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+
+        return NotImplemented
+
+    def __repr__(self):
+        return f'<MultiSendRecipients: {len(self)}>'
+
+    def coin(self, index):
+        """
+        Args:
+            index (int)
+        Returns:
+            str: coin symbol
+        """
+        return self.coins[self.coin_ids[index]]
+
+    def address_bytes(self, index):
+        """
+        Args:
+            index (int)
+        Returns:
+            bytes: raw address
+        """
+        start = index * self.ADDRESS_LEN
+        return self.addresses[start:start + self.ADDRESS_LEN]
+
+    def address(self, index):
+        """
+        Args:
+            index (int)
+        Returns:
+            str: Minter address (Mx...)
+        """
+        return ADDRESS.decode(self.address_bytes(index))
+
+    def total(self):
+        """
+        Sum of values by coin
+        Returns:
+            dict: {coin: value in PIP}
+        """
+        totals = {}
+        for coin_id, value in zip(self.coin_ids, self.values):
+            coin = self.coins[coin_id]
+            totals[coin] = totals.get(coin, 0) + value
+
+        return totals
+
+    def to_list(self):
+        """
+        Returns:
+            list[dict]: verbose recipients
+        """
+        return list(self)
+
+
+class RecipientsField(ListField):
+    """
+    MultiSend recipients list.
+    Can be decoded to compact `MultiSendRecipients`.
+    """
+
+    def __init__(self):
+        super().__init__(StructField((
+            ('coin', COIN),
+            ('to', ADDRESS),
+            ('value', AMOUNT)
+        )))
+
+    def encode(self, value):
+        if not isinstance(value, MultiSendRecipients):
+            return super().encode(value)
+
+        # Encode from arrays without creating verbose items
+        coins = [COIN.encode(coin) for coin in value.coins]
+        items = []
+        for index, (coin_id, pip) in enumerate(
+                zip(value.coin_ids, value.values)):
+            items.append(encode_list([
+                coins[coin_id],
+                encode_bytes(value.address_bytes(index)),
+                encode_int(pip)
+            ]))
+
+        return encode_list(items)
+
+    def decode_compact(self, item):
+        return MultiSendRecipients.from_items(item)
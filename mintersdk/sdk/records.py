@@ -0,0 +1,157 @@
+"""
+@author: Roman Matusevich
+"""
+
+
+class MinterTxRecord(object):
+    """
+    Compact immutable decoded tx.
+    Values are stored in slots, so record doesn't have per-instance dict.
+    Record class is created for each tx class by `make_record_class`.
+    Pickled record is tx class reference and tuple of values.
+    """
+
+    __slots__ = ()
+
+    # Value names in slots order
+    FIELDS = ()
+
+    # Tx class, which record is created for
+    TX_CLASS = None
+
+    # Header values, every record has them
+    HEADER_FIELDS = (
+        'nonce', 'chain_id', 'gas_price', 'gas_coin', 'type', 'payload',
+        'service_data', 'signature_type', 'signature_data'
+    )
+
+    # Values, which are known only after sign or decode
+    SIGNED_FIELDS = ('from_mx', 'signed_bytes')
+
+    def __init__(self, *values):
+        """
+        Args:
+            values: values in `FIELDS` order
+        """
+        if len(values) != len(self.FIELDS):
+            raise ValueError(
+                f"'{self.__class__.__name__}' takes {len(self.FIELDS)} values"
+            )
+
+        for name, value in zip(self.FIELDS, values):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, values):
+        """
+        Create record from tx dict (see `MinterTx.decode_to_dict`).
+        Missing values are set to None.
+        Args:
+            values (dict)
+        Returns:
+            MinterTxRecord
+        """
+        return cls(*[values.get(name) for name in cls.FIELDS])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{self.__class__.__name__}' is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{self.__class__.__name__}' is immutable")
+
+    def __reduce__(self):
+        return _restore_record, (self.TX_CLASS, self.values())
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.values() == other.values()
+
+    def __hash__(self):
+        return hash((self.TX_CLASS, self.signed_bytes))
+
+    def __repr__(self):
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in self.FIELDS
+        )
+        return f'{self.__class__.__name__}({values})'
+
+    def values(self):
+        """
+        Returns:
+            tuple: values in `FIELDS` order
+        """
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def to_dict(self):
+        """
+        Returns:
+            dict
+        """
+        return dict(zip(self.FIELDS, self.values()))
+
+    def to_tx(self):
+        """
+        Create tx object from record.
+        Returns:
+            MinterTx child instance
+        """
+        kwargs = self.to_dict()
+        signed_bytes = kwargs.pop('signed_bytes')
+        from_mx = kwargs.pop('from_mx')
+
+        # Decoded tx object has tx data dict too
+        if 'data' not in kwargs:
+            kwargs['data'] = {
+                name: kwargs[name] for name, _ in self.TX_CLASS.FIELDS
+            }
+
+        tx = self.TX_CLASS(**kwargs)
+        tx._set_signed(signed_bytes)
+        if from_mx is not None:
+            tx.from_mx = from_mx
+
+        return tx
+
+
+def make_record_class(tx_class, data_fields=None):
+    """
+    Create record class for tx class.
+    Args:
+        tx_class (type): MinterTx child class
+        data_fields (tuple(str)|None): tx data value names.
+                                       Defaults to tx class schema names.
+    Returns:
+        type: MinterTxRecord child class
+    """
+    if data_fields is None:
+        data_fields = tuple(name for name, _ in tx_class.FIELDS)
+
+    fields = (
+        MinterTxRecord.HEADER_FIELDS + tuple(data_fields) +
+        MinterTxRecord.SIGNED_FIELDS
+    )
+
+    return type(
+        tx_class.__name__ + 'Record',
+        (MinterTxRecord,),
+        {
+            '__slots__': fields,
+            '__module__': tx_class.__module__,
+            'FIELDS': fields,
+            'TX_CLASS': tx_class
+        }
+    )
+
+
+def _restore_record(tx_class, values):
+    """
+    Unpickle record
+    Args:
+        tx_class (type): MinterTx child class
+        values (tuple): record values
+    Returns:
+        MinterTxRecord
+    """
+    return tx_class.RECORD(*values)
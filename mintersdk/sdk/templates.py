@@ -0,0 +1,262 @@
+"""
+@author: Roman Matusevich
+"""
+import itertools
+import numbers
+
+from mintersdk import MinterHelper
+from mintersdk.sdk import ECDSA
+from mintersdk.sdk.encoding import (
+    COIN, AmountField, encode, encode_bytes, encode_int, encode_length,
+    encode_list, encode_text
+)
+from mintersdk.sdk.transactions import MinterTx
+from mintersdk.sdk.workers import map_ordered as workers_map
+
+
+class MinterTxTemplate(object):
+    """
+    Template of many txs of one type with the same header.
+    Header items and fixed tx data values are encoded once, then txs are
+    built or signed from columns of varying values.
+    """
+
+    def __init__(self, tx_class, gas_coin, chain_id=1, gas_price=1,
+                 payload='', service_data='', **fixed):
+        """
+        Args:
+            tx_class (type): MinterTx child class
+            gas_coin (str)
+            chain_id (int)
+            gas_price (int)
+            payload (str)
+            service_data (str)
+            fixed: tx data values, which are the same for all txs
+        """
+        names = [name for name, _ in tx_class.FIELDS]
+        unknown = set(fixed) - set(names)
+        if unknown:
+            raise ValueError(
+                f"'{tx_class.__name__}' has no fields {sorted(unknown)}"
+            )
+
+        self.tx_class = tx_class
+        self.header = {
+            'chain_id': chain_id,
+            'gas_coin': MinterHelper.upper_coin_name(gas_coin),
+            'gas_price': gas_price,
+            'payload': payload,
+            'service_data': service_data
+        }
+        self.fixed = fixed
+
+        # Encoded header items
+        self._header_items = {
+            'chain_id': encode_int(chain_id),
+            'gas_price': encode_int(gas_price),
+            'gas_coin': COIN.encode(self.header['gas_coin']),
+            'type': tx_class._TYPE_RLP,
+            'payload': encode_text(payload),
+            'service_data': encode_text(service_data),
+            'signature_type': encode_int(MinterTx.SIGNATURE_SINGLE_TYPE)
+        }
+
+        # Tx data fields: encoded item for fixed values or field to encode
+        # column values
+        self._fields = [
+            (name, field.encode(fixed[name]) if name in fixed else field)
+            for name, field in tx_class.FIELDS
+        ]
+        self.columns = [
+            name for name, field in tx_class.FIELDS if name not in fixed
+        ]
+
+    @staticmethod
+    def _to_list(column):
+        """
+        Args:
+            column (list|tuple|numpy.ndarray)
+        Returns:
+            list: column values as python objects
+        """
+        if hasattr(column, 'tolist'):
+            return column.tolist()
+
+        return list(column)
+
+    def _rows(self, nonce, columns, in_pip):
+        """
+        Encode unsigned txs payloads row by row.
+        Args:
+            nonce (int|numpy.integer|list): nonce of first tx or nonce
+                                            column
+            columns (dict): column name to values
+            in_pip (bool): amount columns are in PIP
+        Returns:
+            iterator: RLP payload of unsigned tx (9 items without list
+                      prefix)
+        """
+        missing = set(self.columns) - set(columns)
+        if missing:
+            raise ValueError(f'Columns {sorted(missing)} are missing')
+
+        columns = {
+            name: self._to_list(values) for name, values in columns.items()
+        }
+        lengths = {len(values) for values in columns.values()}
+        # Any integer scalar (e.g. numpy integer) is first nonce
+        if isinstance(nonce, numbers.Integral):
+            if len(lengths) > 1:
+                raise ValueError('Columns should have the same length')
+            count = lengths.pop() if lengths else 1
+            nonces = range(int(nonce), int(nonce) + count)
+        else:
+            nonces = self._to_list(nonce)
+            lengths.add(len(nonces))
+            if len(lengths) > 1:
+                raise ValueError('Columns should have the same length')
+
+        # Column value encoders in schema order
+        encoders = []
+        for name, field in self._fields:
+            if type(field) is bytes:
+                encoders.append((None, field))
+            elif in_pip and isinstance(field, AmountField):
+                encoders.append((columns[name], encode_int))
+            else:
+                encoders.append((columns[name], field.encode))
+
+        head = self._header_items
+        after_nonce = head['chain_id'] + head['gas_price'] + \
+            head['gas_coin'] + head['type']
+        after_data = head['payload'] + head['service_data'] + \
+            head['signature_type']
+
+        for index, _nonce in enumerate(nonces):
+            data = encode_list([
+                item if values is None else item(values[index])
+                for values, item in encoders
+            ])
+            yield (
+                encode_int(_nonce) + after_nonce + encode_bytes(data) +
+                after_data
+            )
+
+    def build(self, nonce, **values):
+        """
+        Create tx object with prepared header items.
+        Signature type isn't set until tx is signed, as for tx created
+        directly, so it's item is encoded by tx.
+        Args:
+            nonce (int)
+            values: varying tx data values
+        Returns:
+            MinterTx child instance
+        """
+        tx = self.tx_class(nonce=nonce, **self.header, **self.fixed, **values)
+        tx._rlp_cache = {
+            name: self._header_items[name] for name in self.header
+        }
+
+        return tx
+
+    def sign(self, private_key, nonce, in_pip=False, **columns):
+        """
+        Sign txs from columns in current process.
+        Args:
+            private_key (str|MinterSigningKey)
+            nonce (int|list): nonce of first tx or nonce column
+            in_pip (bool): amount columns are in PIP instead of BIP
+            columns: varying tx data values by field name
+        Returns:
+            list[str]: signed txs in hex, as `MinterTx.signed_tx`
+        """
+        return [
+            signed.hex() for signed in self.sign_bytes(
+                private_key, nonce, in_pip=in_pip, **columns
+            )
+        ]
+
+    def sign_bytes(self, private_key, nonce, in_pip=False, **columns):
+        """
+        Sign txs from columns in current process and get raw signed txs.
+        Args are the same as for `sign()`.
+        Returns:
+            list[bytes]: raw signed txs, as `MinterTx.signed_bytes`
+        """
+        return [
+            _sign_payload(payload, private_key)
+            for payload in self._rows(nonce, columns, in_pip)
+        ]
+
+    def sign_many(self, private_key, nonce, in_pip=False, workers=None,
+                  chunksize=None, **columns):
+        """
+        Sign txs from columns over persistent process pool.
+        Txs are encoded in current process, only hashing and signing
+        are made in workers.
+        Args:
+            private_key (str|MinterSigningKey)
+            nonce (int|list): nonce of first tx or nonce column
+            in_pip (bool): amount columns are in PIP instead of BIP
+            workers (int|None): number of worker processes.
+                                Defaults to number of CPUs.
+            chunksize (int|None): txs per task sent to worker
+            columns: varying tx data values by field name
+        Returns:
+            list[str|Exception]: signed tx in hex or error for each row,
+                                 as `MinterTx.sign_many`
+        """
+        return [
+            result if isinstance(result, Exception) else result.hex()
+            for result in self.sign_many_bytes(
+                private_key, nonce, in_pip=in_pip, workers=workers,
+                chunksize=chunksize, **columns
+            )
+        ]
+
+    def sign_many_bytes(self, private_key, nonce, in_pip=False, workers=None,
+                        chunksize=None, **columns):
+        """
+        Sign txs from columns over persistent process pool and get raw
+        signed txs.
+        Args are the same as for `sign_many()`.
+        Returns:
+            list[bytes|Exception]: raw signed tx or error for each row
+        """
+        payloads = self._rows(nonce, columns, in_pip)
+
+        return [
+            result for _, result in workers_map(
+                _sign_worker, zip(payloads, itertools.repeat(private_key)),
+                workers=workers, chunksize=chunksize
+            )
+        ]
+
+def _sign_payload(payload, private_key):
+    """
+    Sign unsigned tx payload.
+    Args:
+        payload (bytes): RLP payload of unsigned tx (9 items)
+        private_key (str|MinterSigningKey)
+    Returns:
+        bytes: raw signed tx
+    """
+    keccak = MinterHelper.keccak_digest(
+        encode_length(len(payload), 0xc0) + payload
+    )
+    signature = encode_bytes(encode(ECDSA.sign(keccak, private_key)))
+
+    return encode_length(len(payload) + len(signature), 0xc0) + \
+        payload + signature
+
+
+def _sign_worker(task):
+    """
+    Sign unsigned tx payload in worker process.
+    Args:
+        task (tuple(bytes, str|MinterSigningKey)): payload and private key
+    Returns:
+        bytes: raw signed tx
+    """
+    return _sign_payload(*task)
@@ -1,14 +1,30 @@
 """
 @author: Roman Matusevich
 """
-import rlp
 import hashlib
 import copy
-from mintersdk import (
-    MinterHelper, PREFIX_ADDR, PREFIX_TX, PREFIX_PUBKEY, PREFIX_CHECK
-)
+
+from deprecated import deprecated
+
+from mintersdk import MinterHelper, MinterAddress, PREFIX_TX, to_bytes
 from mintersdk.sdk import ECDSA
-from mintersdk.sdk.wallet import MinterWallet
+from mintersdk.sdk.encoding import (
+    encode, decode, decode_strings, encode_int, encode_bytes, encode_text, encode_list,
+    UINT, AMOUNT, COIN, TEXT, HEX, ADDRESS, PUBKEY, CHECK, SIGNATURE,
+    ListField, StructField, DecodingError, DecodingLimitError, validate_item
+)
+from mintersdk.sdk.recipients import RecipientsField
+from mintersdk.sdk.records import make_record_class
+from mintersdk.sdk.wallet import MinterSigningKey
+from mintersdk.sdk.workers import map_ordered as workers_map
+
+
+class UnknownTxTypeError(DecodingError):
+    """
+    Raised when raw tx has type, which isn't registered, or when type
+    specific value (e.g. fee) is requested for tx of unknown type
+    """
+    pass
 
 
 class MinterTx(object):
@@ -35,6 +51,18 @@ class MinterTx(object):
     # Test net chain id
     TESTNET_CHAIN_ID = 2
 
+    # Max raw tx size in bytes, accepted by network.
+    # Larger raw txs are rejected by decoder before RLP decoding.
+    MAX_TX_SIZE = 7168
+
+    # Decoder limits for nested RLP of tx data and signature data.
+    # Multi signature data is the deepest structure (3 levels of lists).
+    MAX_RLP_ITEMS = 1024
+    MAX_RLP_DEPTH = 3
+
+    # Max number of signatures in multi signature data
+    MAX_SIGNATURES = 32
+
     # Each minter transaction has:
     # Nonce - int, used for prevent transaction reply.
     # Gas Price - big int, used for managing transaction fees.
@@ -60,6 +88,107 @@ class MinterTx(object):
         'signature_data': ''
     }
 
+    # Tx data schema: tuple of (attribute name, field) pairs in RLP order.
+    # Each child class declares it's own schema, data encoder and decoder
+    # are built from it once per class.
+    FIELDS = ()
+
+    # Registry of tx classes by tx type.
+    # Child classes with own TYPE are registered automatically.
+    _TYPES = {}
+
+    # Encoders of unsigned tx items in RLP order.
+    # Encoded items are cached per instance (see `_encode_unsigned`).
+    _HEADER_ENCODERS = (
+        ('nonce', lambda tx: encode_int(tx.nonce)),
+        ('chain_id', lambda tx: encode_int(tx.chain_id)),
+        ('gas_price', lambda tx: encode_int(tx.gas_price)),
+        ('gas_coin', lambda tx: COIN.encode(tx.gas_coin)),
+        ('type', lambda tx: tx._TYPE_RLP),
+        ('data', lambda tx: encode_bytes(tx._encode_data())),
+        ('payload', lambda tx: encode_text(tx.payload)),
+        ('service_data', lambda tx: encode_text(tx.service_data)),
+        ('signature_type', lambda tx: encode_int(tx.signature_type))
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Build data encoder and decoder from class schema and register
+        class by it's tx type.
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls._DATA_ENCODERS = tuple(
+            (name, field.encode) for name, field in cls.FIELDS
+        )
+        cls._DATA_DECODERS = tuple(
+            (name, field.decode) for name, field in cls.FIELDS
+        )
+        cls._COMPACT_DECODERS = tuple(
+            (name, field.decode_compact) for name, field in cls.FIELDS
+        )
+
+        # Map attributes to cached RLP item, which depends on attribute.
+        # Data is cached only if all it's values are immutable, because
+        # in place change of list can't be tracked.
+        cls._CACHE_KEYS = {name: name for name, _ in cls._HEADER_ENCODERS}
+        cls._CACHE_DATA = not any(
+            isinstance(field, (ListField, StructField))
+            for _, field in cls.FIELDS
+        )
+        for name, _ in cls.FIELDS:
+            cls._CACHE_KEYS[name] = 'data'
+
+        # Compact record class for decoded txs of this class
+        cls.RECORD = make_record_class(cls)
+
+        if 'TYPE' in cls.__dict__:
+            cls._TYPE_RLP = encode_int(cls.TYPE)
+            MinterTx._TYPES[cls.TYPE] = cls
+
+    @classmethod
+    def register_type(cls, tx_class):
+        """
+        Register tx class for it's tx type. Class registered before
+        for the same type is replaced.
+        Can be used as class decorator.
+        Args:
+            tx_class (type): MinterTx child class with TYPE and FIELDS
+        Returns:
+            type: registered class
+        """
+        if not issubclass(tx_class, MinterTx) or \
+                type(getattr(tx_class, 'TYPE', None)) is not int:
+            raise ValueError(
+                'Only MinterTx child class with integer TYPE can be registered'
+            )
+
+        MinterTx._TYPES[tx_class.TYPE] = tx_class
+
+        return tx_class
+
+    @classmethod
+    def unregister_type(cls, tx_type):
+        """
+        Remove tx type from registry
+        Args:
+            tx_type (int)
+        Returns:
+            type|None: removed class
+        """
+        return MinterTx._TYPES.pop(tx_type, None)
+
+    @classmethod
+    def get_type_class(cls, tx_type):
+        """
+        Get tx class registered for tx type
+        Args:
+            tx_type (int)
+        Returns:
+            type|None
+        """
+        return MinterTx._TYPES.get(tx_type)
+
     def __init__(self, nonce, gas_coin, payload='', service_data='',
                  chain_id=1, gas_price=1, **kwargs):
         if self.__class__ is MinterTx:
@@ -70,7 +199,7 @@ class MinterTx(object):
         # Set every tx attributes
         self.nonce = nonce
         self.chain_id = chain_id
-        self.gas_coin = gas_coin.upper()
+        self.gas_coin = MinterHelper.upper_coin_name(gas_coin)
         self.gas_price = gas_price
         self.payload = payload
         self.service_data = service_data
@@ -82,26 +211,83 @@ class MinterTx(object):
 
         self.validate_attrs()
 
+    def __setattr__(self, name, value):
+        """ Drop cached RLP item, which depends on changed attribute """
+        key = self._CACHE_KEYS.get(name)
+        if key is not None:
+            cache = self.__dict__.get('_rlp_cache')
+            if cache:
+                cache.pop(key, None)
+
+        super().__setattr__(name, value)
+
     def validate_attrs(self):
         """ Validate init arguments """
         if type(self.nonce) is not int:
             raise ValueError(f"'nonce' should be 'int'")
 
+    def _encode_data(self):
+        """
+        RLP encode tx data by class schema
+        Returns:
+            bytes
+        """
+        return encode_list([
+            _encode(getattr(self, name))
+            for name, _encode in self._DATA_ENCODERS
+        ])
+
+    def _encode_unsigned(self):
+        """
+        RLP encode each tx item, except signature data.
+        Encoded items are cached, so only items of changed attributes
+        are encoded again on next call.
+        Returns:
+            list[bytes]
+        """
+        cache = self.__dict__.get('_rlp_cache')
+        if cache is None:
+            cache = self._rlp_cache = {}
+
+        items = []
+        for name, _encode in self._HEADER_ENCODERS:
+            item = cache.get(name)
+            if item is None:
+                item = _encode(self)
+                if name != 'data' or self._CACHE_DATA:
+                    cache[name] = item
+            items.append(item)
+
+        return items
+
+    @staticmethod
+    def _unsigned_hash(items):
+        """
+        Get keccak hash of unsigned tx, which is signed
+        Args:
+            items (list[bytes]): RLP encoded tx items
+        Returns:
+            bytes: raw digest
+        """
+        return MinterHelper.keccak_digest(encode_list(items))
+
     def generate_tx_rlp(self):
         """
         Create structure from instance and prepare rlp structure
         Returns:
             tx_struct (dict)
         """
-        # Get structure populated with instance data
-        tx_struct = self._structure_from_instance()
-        # Remove signature data, it's not needed before getting Keccak
-        tx_struct.pop('signature_data')
-
-        # Encode tx data to RLP
-        tx_struct['data'] = rlp.encode(list(tx_struct['data'].values()))
-
-        return tx_struct
+        return {
+            'nonce': self.nonce,
+            'chain_id': self.chain_id,
+            'gas_price': self.gas_price,
+            'gas_coin': MinterHelper.encode_coin_name(self.gas_coin),
+            'type': self.TYPE,
+            'data': self._encode_data(),
+            'payload': self.payload,
+            'service_data': self.service_data,
+            'signature_type': self.signature_type
+        }
 
     @staticmethod
     def generate_signed_tx(tx_struct):
@@ -112,27 +298,22 @@ class MinterTx(object):
         Returns:
             signed_tx hash (str)
         """
-        tx_rlp = rlp.encode(list(tx_struct.values()))
-        return tx_rlp.hex()
+        return encode(list(tx_struct.values())).hex()
 
     def generate_signature(self, private_key):
         """
         Create signature for transaction
         Args:
-            private_key (str): private key to sign with
+            private_key (str|MinterSigningKey): private key to sign with
         Returns:
             hex_signature (str)
         """
-        # Get structure populated with instance data and rlp encoded
-        tx_struct = self.generate_tx_rlp()
-
-        # Create keccak hash
-        tx_rlp = rlp.encode(list(tx_struct.values()))
-        keccak = MinterHelper.keccak_hash(tx_rlp)
+        # Create keccak hash of rlp encoded tx
+        keccak = self._unsigned_hash(self._encode_unsigned())
 
         # Create signature
         signature = ECDSA.sign(keccak, private_key)
-        signature = rlp.encode(signature).hex()
+        signature = encode(signature).hex()
 
         return signature
 
@@ -142,16 +323,19 @@ class MinterTx(object):
         This method can be called only from instances of inherited
         classes.
         Args:
-            private_key (string|list[string]): private key to sign with
+            private_key (string|MinterSigningKey|list): private key(s) to
+                                                        sign with
             signature (string|list[string]): signature to sign with
-            ms_address (string): Multi signature address to sign tx by
+            ms_address (str|MinterAddress): Multi signature address to sign
+                                            tx by
         """
         # Check arguments validity
         if not private_key and not signature:
             raise Exception(
                 'Please, provide either `private_key(s)` or `signature(s)`'
             )
-        if not ms_address and private_key and type(private_key) is not str:
+        if not ms_address and private_key and \
+                not isinstance(private_key, (str, MinterSigningKey)):
             raise Exception(
                 '''
                 Please, provide a single `private_key` or set `ms_address` 
@@ -169,14 +353,15 @@ class MinterTx(object):
         # Set tx signature type
         self.signature_type = self.SIGNATURE_SINGLE_TYPE
         if ms_address:
-            if type(private_key) is str:
+            if isinstance(private_key, (str, MinterSigningKey)):
                 private_key = [private_key]
             if type(signature) is str:
                 signature = [signature]
             self.signature_type = self.SIGNATURE_MULTI_TYPE
 
-        # Get populated and rlp encoded tx structure
-        tx_struct = self.generate_tx_rlp()
+        # Get rlp encoded tx items and hash to sign
+        tx_items = self._encode_unsigned()
+        keccak = self._unsigned_hash(tx_items)
 
         # Signature data
         if self.signature_type == self.SIGNATURE_SINGLE_TYPE:
@@ -192,78 +377,201 @@ class MinterTx(object):
 
             # Set signature_data
             if private_key:
-                signature_data = self.generate_signature(private_key)
+                signature_data = ECDSA.sign(keccak, private_key)
             else:
-                signature_data = signature
-            signature_data = self.decode_signature(signature_data)
+                signature_data = self.decode_signature(signature)
         else:
             # Add multisig address to signature
             signature_data = [
-                bytes.fromhex(MinterHelper.prefix_remove(ms_address)),
+                to_bytes(ms_address),
                 []
             ]
 
             # Sign by each private key and add to total signature data
             if private_key:
                 for pk in private_key:
-                    _signature = self.generate_signature(pk)
-                    signature_data[1].append(self.decode_signature(_signature))
+                    signature_data[1].append(ECDSA.sign(keccak, pk))
 
             # Sign by each signature and add to total signature data
             if signature:
                 for _signature in signature:
                     signature_data[1].append(self.decode_signature(_signature))
-        tx_struct['signature_data'] = rlp.encode(signature_data)
+        tx_items.append(encode_bytes(encode(signature_data)))
+
+        self.signed_bytes = encode_list(tx_items)
+
+    def sign_bytes(self, private_key=None, signature=None, ms_address=None):
+        """
+        Sign transaction and get raw signed tx.
+        Args are the same as for `sign()`.
+        Returns:
+            bytes
+        """
+        self.sign(
+            private_key=private_key, signature=signature, ms_address=ms_address
+        )
+
+        return self.signed_bytes
+
+    @classmethod
+    def sign_many(cls, txs, private_key, workers=None, chunksize=None,
+                  threads=False):
+        """
+        Sign many single signature type transactions over persistent
+        process or thread pool.
+        Each transaction object gets `signed_tx` and `signature_type`
+        attributes, like after `sign()` call.
+        Args:
+            txs (list[MinterTx]): transactions to sign
+            private_key (str|MinterSigningKey|list): private key to sign
+                                                     every tx with or list
+                                                     of private keys,
+                                                     one per tx
+            workers (int|None): number of worker processes.
+                                Defaults to number of CPUs.
+            chunksize (int|None): txs per task sent to worker
+            threads (bool): sign in thread pool instead of process pool.
+                            Signing is parallel only if ECDSA backend
+                            releases the GIL (`ECDSABackend.releases_gil`).
+        Returns:
+            list[str|Exception]: signed tx or error for each tx,
+                                 in input order
+        """
+        txs = list(txs)
+
+        # Pair each tx with it's private key
+        if isinstance(private_key, (str, MinterSigningKey)):
+            private_keys = [private_key] * len(txs)
+        else:
+            private_keys = list(private_key)
+            if len(private_keys) != len(txs):
+                raise ValueError(
+                    "'private_key' list should have the same length as 'txs'"
+                )
+
+        results = workers_map(
+            _sign_worker, zip(txs, private_keys), workers=workers,
+            chunksize=chunksize, threads=threads
+        )
+
+        # Update tx objects with signed data, which was received from workers
+        signed = []
+        for tx, (success, result) in zip(txs, results):
+            if success:
+                tx.signature_type = cls.SIGNATURE_SINGLE_TYPE
+                tx.signed_bytes = result
+                result = tx.signed_tx
+            signed.append(result)
+
+        return signed
 
-        self.signed_tx = self.generate_signed_tx(tx_struct)
+    @property
+    def signed_tx(self):
+        """
+        Signed tx in hex.
+        Converted from `signed_bytes` on first access.
+        Returns:
+            str|None
+        """
+        signed_tx = self.__dict__.get('_signed_tx')
+        if signed_tx is None and self.signed_bytes is not None:
+            signed_tx = self._signed_tx = self.signed_bytes.hex()
+
+        return signed_tx
+
+    @signed_tx.setter
+    def signed_tx(self, value):
+        self._set_signed(
+            bytes.fromhex(value) if value is not None else None, value
+        )
+
+    @property
+    def signed_bytes(self):
+        """
+        Raw signed tx.
+        Returns:
+            bytes|None
+        """
+        return self.__dict__.get('_signed_bytes')
+
+    @signed_bytes.setter
+    def signed_bytes(self, value):
+        self._set_signed(bytes(value) if value is not None else None)
+
+    def _set_signed(self, signed_bytes, signed_tx=None):
+        """
+        Set raw signed tx and reset values cached from previous one.
+        Args:
+            signed_bytes (bytes|None): raw signed tx
+            signed_tx (str|None): the same tx in hex, if it is known
+        """
+        self._signed_bytes = signed_bytes
+        self._signed_tx = signed_tx
+        self._hash = None
 
     def get_hash(self):
         """
-        Generate tx hash with prefix
+        Generate tx hash with prefix.
+        Hash is computed once and cached until signed tx is changed.
         Returns:
             string
         """
-        if not hasattr(self, 'signed_tx') or not self.signed_tx:
+        if not self.signed_bytes:
             raise AttributeError('You need to sign transaction before')
 
-        # Create SHA256
-        sha = hashlib.sha256()
-        sha.update(bytes.fromhex(self.signed_tx))
+        if self.__dict__.get('_hash') is None:
+            self._hash = MinterHelper.prefix_add(
+                hashlib.sha256(self.signed_bytes).hexdigest(), PREFIX_TX
+            )
 
-        # Return first 64 symbols with prefix
-        return MinterHelper.prefix_add(sha.hexdigest()[:64], PREFIX_TX)
+        return self._hash
 
-    def _structure_from_instance(self):
+    @classmethod
+    def _raw_to_bytes(cls, raw_tx):
         """
-        Populating structure dict by instance values.
-        Prepare values for signing process.
+        Convert raw tx to bytes. Size is checked before hex is parsed.
+        Args:
+            raw_tx (str|bytes|memoryview): raw tx in hex or bytes
+        Returns:
+            bytes
         """
+        size = len(raw_tx) // 2 if isinstance(raw_tx, str) else len(raw_tx)
+        if size > cls.MAX_TX_SIZE:
+            raise DecodingLimitError(
+                f'Raw tx is {size} bytes, max is {cls.MAX_TX_SIZE}'
+            )
 
-        struct = copy.copy(self._STRUCTURE_DICT)
-
-        struct.update({
-            'nonce': self.nonce,
-            'chain_id': self.chain_id,
-            'gas_price': self.gas_price,
-            'gas_coin': MinterHelper.encode_coin_name(self.gas_coin),
-            'payload': self.payload,
-            'service_data': self.service_data,
-            'signature_type': self.signature_type
-        })
+        if isinstance(raw_tx, str):
+            try:
+                return bytes.fromhex(raw_tx)
+            except ValueError:
+                raise DecodingError('Raw tx is not valid hex') from None
 
-        return struct
+        return bytes(raw_tx)
 
     @classmethod
-    def _structure_to_kwargs(cls, structure):
+    def _structure_to_kwargs(cls, structure, compact=False):
         """
         Works with already populated structure and prepare **kwargs for
         creating new instance of tx.
+        Tx data values are decoded to verbose by class schema
+        or to compact values, if `compact` is set.
         """
 
         structure.update({
             'gas_coin': MinterHelper.decode_coin_name(structure['gas_coin'])
         })
 
+        # Convert data values to verbose.
+        # Data will be passed as additional kwarg
+        data = structure['data']
+        decoders = cls._COMPACT_DECODERS if compact else cls._DATA_DECODERS
+        for name, _decode in decoders:
+            data[name] = _decode(data[name])
+
+        # Populate data key values as kwargs
+        structure.update(data)
+
         return structure
 
     def get_fee(self):
@@ -286,17 +594,78 @@ class MinterTx(object):
 
         return commission
 
+    @staticmethod
+    def peek(raw_tx):
+        """
+        Read tx header without full decoding.
+        Tx data isn't decoded and sender isn't recovered, so it is cheap
+        way to route or filter incoming txs.
+        Args:
+            raw_tx (str|bytes|memoryview)
+        Returns:
+            dict: nonce, chain_id, gas_price, gas_coin, type,
+                  payload_len, signature_type, hash
+        """
+        raw_tx = MinterTx._raw_to_bytes(raw_tx)
+        tx = decode_strings(raw_tx)
+        if len(tx) != 10:
+            raise DecodingError('Raw tx should have 10 RLP items')
+        validate_item(COIN, tx[3], 'gas_coin')
+
+        return {
+            'nonce': int.from_bytes(tx[0], 'big'),
+            'chain_id': int.from_bytes(tx[1], 'big'),
+            'gas_price': int.from_bytes(tx[2], 'big'),
+            'gas_coin': MinterHelper.decode_coin_name(tx[3]),
+            'type': int.from_bytes(tx[4], 'big'),
+            'payload_len': len(tx[6]),
+            'signature_type': int.from_bytes(tx[8], 'big'),
+            'hash': MinterHelper.prefix_add(
+                hashlib.sha256(raw_tx).hexdigest(), PREFIX_TX
+            )
+        }
+
     @classmethod
-    def from_raw(cls, raw_tx):
+    def _decode_raw(cls, raw_tx, allow_unknown=False):
         """
-        Generate tx object from raw tx
+        Decode raw tx to populated structure dict.
+        Tx data values are left raw.
         Args:
-            raw_tx (string)
+            raw_tx (bytes)
+            allow_unknown (bool): use `MinterUnknownTx` class for tx of
+                                  unregistered type
         Returns:
-            MinterTx child instance
+            tuple(type, dict, bytes): tx class, structure and RLP encoded
+                                      unsigned tx for sender recovery
         """
 
-        tx = rlp.decode(bytes.fromhex(raw_tx))
+        # Raw tx is flat list of 10 strings. All items are checked before
+        # tx data is decoded and sender is recovered.
+        tx = decode_strings(raw_tx, max_size=cls.MAX_TX_SIZE)
+        if len(tx) != 10:
+            raise DecodingError(
+                f'Raw tx should have 10 RLP items, got {len(tx)}'
+            )
+        validate_item(COIN, tx[3], 'gas_coin')
+
+        signature_type = int.from_bytes(tx[8], 'big')
+        signature_data = cls._decode_nested(tx[9])
+        if signature_type == cls.SIGNATURE_SINGLE_TYPE:
+            validate_item(SIGNATURE, signature_data, 'signature_data')
+            signature_data = SIGNATURE.decode(signature_data)
+        elif signature_type == cls.SIGNATURE_MULTI_TYPE:
+            validate_item(_MULTISIG_DATA, signature_data, 'signature_data')
+
+            # Create decoded signature data
+            signature_data = {
+                'from_mx': ADDRESS.decode(signature_data[0]),
+                'signatures': [
+                    SIGNATURE.decode(signature)
+                    for signature in signature_data[1]
+                ]
+            }
+        else:
+            raise DecodingError(f"Undefined signature type '{signature_type}'")
 
         # Try to decode payload
         try:
@@ -320,92 +689,285 @@ class MinterTx(object):
             'type': int.from_bytes(tx[4], 'big'),
             'payload': payload,
             'service_data': service_data,
-            'signature_type': int.from_bytes(tx[8], 'big')
+            'signature_type': signature_type,
+            'signature_data': signature_data
         })
 
-        # Get signature data
-        signature_data = rlp.decode(tx[9])
-        if struct['signature_type'] == cls.SIGNATURE_SINGLE_TYPE:
-            signature_data = {
-                'v': int.from_bytes(signature_data[0], 'big'),
-                'r': signature_data[1].hex(),
-                's': signature_data[2].hex()
-            }
+        # Find out which of tx instance need to create depending on it's type
+        _class = cls._TYPES.get(struct['type'])
+        if _class is None:
+            if not allow_unknown:
+                raise UnknownTxTypeError(
+                    f"Undefined tx type '{struct['type']}'"
+                )
+            _class = MinterUnknownTx
+
+        # Set tx data. Data of unknown tx type is kept as raw bytes.
+        if _class is MinterUnknownTx:
+            struct['data'] = tx[5]
         else:
-            # Decode signatures
-            signatures = []
-            for signature in signature_data[1]:
-                signatures.append({
-                    'v': int.from_bytes(signature[0], 'big'),
-                    'r': signature[1].hex(),
-                    's': signature[2].hex()
-                })
+            struct['data'] = _class._data_from_raw(cls._decode_nested(tx[5]))
 
-            # Create decoded signature data
-            signature_data = {
-                'from_mx': MinterHelper.prefix_add(
-                    signature_data[0].hex(), PREFIX_ADDR
-                ),
-                'signatures': signatures
-            }
-        struct['signature_data'] = signature_data
+        # Unsigned tx is rebuilt from already decoded first 9 items.
+        # Decoder accepts canonical RLP only, so encoding is the same as
+        # in raw tx.
+        unsigned = encode_list([encode_bytes(item) for item in tx[:9]])
 
-        # Find out which of tx instance need to create depending on it's type
-        data = rlp.decode(tx[5])
-        if struct['type'] == MinterDelegateTx.TYPE:
-            _class = MinterDelegateTx
-        elif struct['type'] == MinterSendCoinTx.TYPE:
-            _class = MinterSendCoinTx
-        elif struct['type'] == MinterBuyCoinTx.TYPE:
-            _class = MinterBuyCoinTx
-        elif struct['type'] == MinterCreateCoinTx.TYPE:
-            _class = MinterCreateCoinTx
-        elif struct['type'] == MinterDeclareCandidacyTx.TYPE:
-            _class = MinterDeclareCandidacyTx
-        elif struct['type'] == MinterRedeemCheckTx.TYPE:
-            _class = MinterRedeemCheckTx
-        elif struct['type'] == MinterSellAllCoinTx.TYPE:
-            _class = MinterSellAllCoinTx
-        elif struct['type'] == MinterSellCoinTx.TYPE:
-            _class = MinterSellCoinTx
-        elif struct['type'] == MinterSetCandidateOffTx.TYPE:
-            _class = MinterSetCandidateOffTx
-        elif struct['type'] == MinterSetCandidateOnTx.TYPE:
-            _class = MinterSetCandidateOnTx
-        elif struct['type'] == MinterUnbondTx.TYPE:
-            _class = MinterUnbondTx
-        elif struct['type'] == MinterEditCandidateTx.TYPE:
-            _class = MinterEditCandidateTx
-        elif struct['type'] == MinterMultiSendCoinTx.TYPE:
-            _class = MinterMultiSendCoinTx
-        elif struct['type'] == MinterCreateMultisigTx.TYPE:
-            _class = MinterCreateMultisigTx
-        else:
-            raise Exception('Undefined tx type.')
+        return _class, struct, unsigned
 
-        # Set tx data
-        struct['data'] = _class._data_from_raw(data)
+    @classmethod
+    def _decode_nested(cls, item):
+        """
+        Decode double encoded RLP item (tx data or signature data)
+        within decoder limits.
+        Args:
+            item (bytes)
+        Returns:
+            bytes|list
+        """
+        return decode(
+            item, max_items=cls.MAX_RLP_ITEMS, max_depth=cls.MAX_RLP_DEPTH
+        )
 
-        # Set sender address and raw tx to minter dict
-        # ONLY AFTER tx data was set
-        struct.update({
-            'from_mx': cls.get_sender_address(tx=copy.copy(struct)),
-            'signed_tx': raw_tx
-        })
+    @classmethod
+    def from_raw(cls, raw_tx, allow_unknown=False, recover_sender=False,
+                 compact=False):
+        """
+        Generate tx object from raw tx.
+        Sender address (`from_mx`) of single signature type tx is
+        recovered on first access, unless `recover_sender` is set.
+        Args:
+            raw_tx (str|bytes|memoryview): raw tx in hex or bytes
+            allow_unknown (bool): return header only `MinterUnknownTx`
+                                  object for tx of unregistered type instead
+                                  of raising `UnknownTxTypeError`
+            recover_sender (bool): recover sender address right now
+            compact (bool): decode tx data to compact values, where it is
+                            supported (e.g. MultiSend recipients)
+        Returns:
+            MinterTx child instance
+        Raises:
+            DecodingError: raw tx is malformed, exceeds decoder limits or
+                           has field of wrong length
+        """
+        raw = cls._raw_to_bytes(raw_tx)
+        _class, struct, unsigned = cls._decode_raw(raw, allow_unknown)
 
         # Prepare **kwargs for creating _class instance.
         # Pass copy of the struct.
-        kwargs = _class._structure_to_kwargs(copy.copy(struct))
+        kwargs = _class._structure_to_kwargs(copy.copy(struct), compact)
+        tx = _class(**kwargs)
+        tx._set_signed(raw, raw_tx if isinstance(raw_tx, str) else None)
+
+        # Multi signature tx has sender address in signature data
+        if struct['signature_type'] == cls.SIGNATURE_MULTI_TYPE:
+            tx.from_mx = struct['signature_data']['from_mx']
+        else:
+            tx._sender_source = (unsigned, struct['signature_data'])
+            if recover_sender:
+                tx.from_mx
+
+        return tx
+
+    @classmethod
+    def decode_to_dict(cls, raw_tx, allow_unknown=False,
+                       recover_sender=False, compact=False):
+        """
+        Decode raw tx to plain dict without creating tx object.
+        Dict has the same keys as attributes of object from `from_raw`.
+        Args:
+            raw_tx (str|bytes|memoryview): raw tx in hex or bytes
+            allow_unknown (bool): keep data of unregistered tx type as raw
+                                  bytes instead of raising
+                                  `UnknownTxTypeError`
+            recover_sender (bool): recover sender address (`from_mx`)
+            compact (bool): decode tx data to compact values
+        Returns:
+            dict
+        """
+        raw = cls._raw_to_bytes(raw_tx)
+        _class, values = cls._decode_values(
+            raw, allow_unknown, recover_sender, compact
+        )
+        values['signed_tx'] = raw_tx if isinstance(raw_tx, str) else raw.hex()
+
+        return values
+
+    @classmethod
+    def decode_to_record(cls, raw_tx, allow_unknown=False,
+                         recover_sender=False, compact=False):
+        """
+        Decode raw tx to compact immutable record without creating
+        tx object.
+        Args:
+            raw_tx (str|bytes|memoryview): raw tx in hex or bytes
+            allow_unknown (bool): decode tx of unregistered type to
+                                  `MinterUnknownTx` record instead of
+                                  raising `UnknownTxTypeError`
+            recover_sender (bool): recover sender address (`from_mx`)
+            compact (bool): decode tx data to compact values
+        Returns:
+            MinterTxRecord
+        """
+        _class, values = cls._decode_values(
+            cls._raw_to_bytes(raw_tx), allow_unknown, recover_sender, compact
+        )
+
+        return _class.RECORD.from_dict(values)
+
+    @classmethod
+    def _decode_values(cls, raw, allow_unknown, recover_sender,
+                       compact=False):
+        """
+        Decode raw tx to verbose values.
+        Sender address of multi signature tx is always set.
+        Args:
+            raw (bytes): raw tx
+            allow_unknown (bool)
+            recover_sender (bool)
+            compact (bool)
+        Returns:
+            tuple(type, dict): tx class and values
+        """
+        _class, struct, unsigned = cls._decode_raw(raw, allow_unknown)
+        struct['signed_bytes'] = raw
+
+        signature_data = struct['signature_data']
+        if struct['signature_type'] == cls.SIGNATURE_MULTI_TYPE:
+            struct['from_mx'] = signature_data['from_mx']
+        elif recover_sender:
+            struct['from_mx'] = cls._recover_sender(unsigned, signature_data)
+
+        return _class, _class._structure_to_kwargs(struct, compact)
+
+    def to_record(self):
+        """
+        Create compact immutable record from tx object.
+        Sender address is recovered, if tx is signed.
+        Returns:
+            MinterTxRecord
+        """
+        try:
+            from_mx = self.from_mx
+        except AttributeError:
+            from_mx = None
+
+        values = dict(self.__dict__, from_mx=from_mx)
+        values.update({
+            'type': self.__dict__.get('type', getattr(self, 'TYPE', None)),
+            'signed_bytes': self.signed_bytes
+        })
+
+        return self.RECORD.from_dict(values)
+
+    @classmethod
+    def from_raw_many(cls, raw_txs, workers=None, recover_sender=True,
+                      allow_unknown=False, chunksize=None, records=False,
+                      compact=False, threads=False):
+        """
+        Decode many raw txs over persistent process or thread pool.
+        Decoding and sender recovery are made in workers.
+        Args:
+            raw_txs (list[str|bytes|memoryview]): raw txs in hex or bytes
+            workers (int|None): number of worker processes.
+                                Defaults to number of CPUs.
+            recover_sender (bool): recover sender address (`from_mx`)
+            allow_unknown (bool): keep data of unregistered tx type as raw
+                                  bytes instead of error
+            chunksize (int|None): txs per task sent to worker
+            records (bool): return compact records (see `decode_to_record`)
+                            instead of dicts
+            compact (bool): decode tx data to compact values
+            threads (bool): decode in thread pool instead of process pool.
+                            Only sender recovery is parallel and only if
+                            ECDSA backend releases the GIL.
+        Returns:
+            list[dict|MinterTxRecord|Exception]: decoded tx or error for
+                                                 each tx, in input order
+        """
+        raw_txs = list(raw_txs)
+
+        # Txs are sent to workers as bytes, which are half size of hex.
+        # Oversized or invalid hex txs are rejected here and aren't sent.
+        raws = []
+        for raw_tx in raw_txs:
+            try:
+                raws.append(cls._raw_to_bytes(raw_tx))
+            except DecodingError as exc:
+                raws.append(exc)
+
+        results = iter(workers_map(
+            _decode_worker,
+            [
+                (raw, recover_sender, allow_unknown, records, compact)
+                for raw in raws if not isinstance(raw, Exception)
+            ],
+            workers=workers, chunksize=chunksize, threads=threads
+        ))
+
+        # Raw tx isn't sent back from worker, set it here
+        decoded = []
+        for raw_tx, raw in zip(raw_txs, raws):
+            if isinstance(raw, Exception):
+                decoded.append(raw)
+                continue
+
+            success, result = next(results)
+            if success and not records:
+                result.update({
+                    'signed_tx': (
+                        raw_tx if isinstance(raw_tx, str) else raw.hex()
+                    ),
+                    'signed_bytes': raw
+                })
+            decoded.append(result)
+
+        return decoded
+
+    @property
+    def from_mx(self):
+        """
+        Sender address.
+        For decoded tx it is recovered from signature on first access
+        and then cached.
+        Returns:
+            str
+        """
+        try:
+            return self.__dict__['_from_mx']
+        except KeyError:
+            pass
+
+        sender_source = self.__dict__.get('_sender_source')
+        if sender_source is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute "
+                f"'from_mx'"
+            )
+
+        self._from_mx = self._recover_sender(*sender_source)
+        self._sender_source = None
 
-        return _class(**kwargs)
+        return self._from_mx
+
+    @from_mx.setter
+    def from_mx(self, value):
+        self._from_mx = value
 
     @classmethod
+    @deprecated(
+        "Use 'MinterTx.from_raw(raw_tx).from_mx' or "
+        "'MinterTx.decode_to_dict(raw_tx, recover_sender=True)' instead"
+    )
     def get_sender_address(cls, tx):
         """
         Get sender address from tx.
         Recover public key from tx and then get address from public key,
         if tx has single signature type, or get decoded sender address,
         if tx has multi signature type.
+        Tx dict is re-encoded with guess-based hexdigit detection, so it is
+        kept only for compatibility. Decoders recover sender from raw tx
+        items by tx schema.
         Args:
             tx (dict): transaction dict
         Returns:
@@ -420,25 +982,41 @@ class MinterTx(object):
         if signature_data.get('from_mx'):
             return signature_data['from_mx']
 
-        # Otherwise (single signature tx), recover public key and get
-        # address from public key
+        # Otherwise (single signature tx), recover public key from
+        # signature of RLP encoded unsigned tx.
         # Unhexlify hexdigit dict values to bytes
         tx = MinterHelper.hex2bin_recursive(tx)
 
-        # Encode tx data to RLP
-        tx['data'] = rlp.encode(list(tx['data'].values()))
+        # Encode tx data to RLP, if it isn't encoded yet
+        if type(tx['data']) is dict:
+            tx['data'] = encode(list(tx['data'].values()))
 
-        # Message
-        tx_rlp = rlp.encode(list(tx.values()))
-        _keccak = MinterHelper.keccak_hash(tx_rlp)
+        return cls._recover_sender(encode(list(tx.values())), signature_data)
 
-        # Recover public key
-        public_key = MinterHelper.prefix_add(
-            ECDSA.recover(_keccak, tuple(signature_data.values())),
-            PREFIX_PUBKEY
-        )
+    @staticmethod
+    def _recover_sender(unsigned, signature_data):
+        """
+        Recover sender address of single signature tx.
+        Args:
+            unsigned (bytes): RLP encoded unsigned tx (first 9 items)
+            signature_data (dict): decoded signature (v, r, s)
+        Returns:
+            Minter address (string)
+        Raises:
+            DecodingError: public key can't be recovered from signature
+        """
+        _keccak = MinterHelper.keccak_digest(unsigned)
+
+        # Recover public key and address, recovered before are cached.
+        # Backend error for invalid signature values is a plain ValueError.
+        try:
+            _, address = ECDSA.recover_address(_keccak, (
+                signature_data['v'], signature_data['r'], signature_data['s']
+            ))
+        except ValueError as exc:
+            raise DecodingError(f"Can't recover sender: {exc}") from None
 
-        return MinterWallet.get_address_from_public_key(public_key)
+        return address
 
     @classmethod
     def add_signature(cls, signed_tx, private_key):
@@ -446,60 +1024,18 @@ class MinterTx(object):
         Add signature to already signed tx. Method is available only for multisig txs
         Args:
             signed_tx (str): signed tx
-            private_key (str): private key
+            private_key (str|MinterSigningKey): private key
         Returns:
             tx object
         """
+        # Imported here, because multisig module depends on this module
+        from mintersdk.sdk.multisig import MultisigSession
 
-        # Create tx instance from raw tx
-        tx = cls.from_raw(signed_tx)
+        session = MultisigSession.from_raw(signed_tx)
+        session.sign(private_key)
+        session.finalize()
 
-        # Check tx to be multi signature type
-        if tx.signature_type != cls.SIGNATURE_MULTI_TYPE:
-            raise Exception(
-                'Signature can be added only to tx with multi signature type'
-            )
-
-        # Convert signature data from verbose dict to needed list of
-        # signatures
-        signature_data = [
-            bytes.fromhex(
-                MinterHelper.prefix_remove(tx.signature_data['from_mx'])
-            ),
-            []
-        ]
-        for item in tx.signature_data['signatures']:
-            # Create raw signature (values as integers)
-            raw = [
-                item['v'],
-                int(item['r'], 16),
-                int(item['s'], 16)
-            ]
-            # Append raw signature to total signature data
-            signature_data[1].append(raw)
-
-        # Get tx populated structure and keccak hash from this structure
-        tx_struct = tx.generate_tx_rlp()
-
-        # Create new signature and update signatures list and signatures
-        # attribute of tx
-        signature = cls.decode_signature(
-            signature=tx.generate_signature(private_key)
-        )
-        signature_data[1].append(signature)
-        tx.signature_data['signatures'].append({
-            'v': signature[0],
-            'r': format(signature[1], 'x'),
-            's': format(signature[2], 'x')
-        })
-
-        # Update resulting struct signature data
-        tx_struct['signature_data'] = rlp.encode(signature_data)
-
-        # Generate new signed tx and update tx object attribute
-        tx.signed_tx = cls.generate_signed_tx(tx_struct)
-
-        return tx
+        return session.tx
 
     @classmethod
     def decode_signature(cls, signature):
@@ -511,7 +1047,7 @@ class MinterTx(object):
             signature (list[int])
         """
         signature = bytes.fromhex(signature)
-        signature = rlp.decode(signature)
+        signature = decode(signature)
         signature = [int.from_bytes(item, 'big') for item in signature]
 
         return signature
@@ -519,15 +1055,28 @@ class MinterTx(object):
     @classmethod
     def _data_from_raw(cls, raw_data):
         """
-        Decoding tx data to tx attributes.
-        Decoding depends on tx type, so this method
-        must be implemented in each child class.
+        Map decoded tx data items to tx attributes names by class schema.
+        Items are checked by schema fields.
         """
-        raise NotImplementedError
+        if type(raw_data) is not list or len(raw_data) != len(cls.FIELDS):
+            raise DecodingError(
+                f"'{cls.__name__}' data should be RLP list of "
+                f"{len(cls.FIELDS)} items"
+            )
 
+        data = {}
+        try:
+            for (name, field), item in zip(cls.FIELDS, raw_data):
+                field.validate(item)
+                data[name] = item
+        except DecodingError as exc:
+            raise type(exc)(f"'{name}': {exc}") from None
 
-class MinterBuyCoinTx(MinterTx):
-    """ Buy coin transaction """
+        return data
+
+
+class MinterBuyCoinTx(MinterTx):
+    """ Buy coin transaction """
 
     # Type of transaction
     TYPE = 4
@@ -535,6 +1084,14 @@ class MinterBuyCoinTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('coin_to_buy', COIN),
+        ('value_to_buy', AMOUNT),
+        ('coin_to_sell', COIN),
+        ('max_value_to_sell', AMOUNT)
+    )
+
     def __init__(self, coin_to_buy, value_to_buy, coin_to_sell,
                  max_value_to_sell, **kwargs):
         """
@@ -547,66 +1104,11 @@ class MinterBuyCoinTx(MinterTx):
 
         super().__init__(**kwargs)
 
-        self.coin_to_buy = coin_to_buy.upper()
+        self.coin_to_buy = MinterHelper.upper_coin_name(coin_to_buy)
         self.value_to_buy = value_to_buy
-        self.coin_to_sell = coin_to_sell.upper()
+        self.coin_to_sell = MinterHelper.upper_coin_name(coin_to_sell)
         self.max_value_to_sell = max_value_to_sell
 
-    def _structure_from_instance(self):
-        """ Override parent method. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'coin_to_buy': MinterHelper.encode_coin_name(self.coin_to_buy),
-                'value_to_buy': MinterHelper.to_pip(self.value_to_buy),
-                'coin_to_sell': MinterHelper.encode_coin_name(self.coin_to_sell),
-                'max_value_to_sell': MinterHelper.to_pip(self.max_value_to_sell)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'coin_to_buy': MinterHelper.decode_coin_name(
-                kwargs['data']['coin_to_buy']
-            ),
-            'value_to_buy': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['value_to_buy'], 'big')
-            ),
-            'coin_to_sell': MinterHelper.decode_coin_name(
-                kwargs['data']['coin_to_sell']
-            ),
-            'max_value_to_sell': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['max_value_to_sell'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'coin_to_buy': raw_data[0],
-            'value_to_buy': raw_data[1],
-            'coin_to_sell': raw_data[2],
-            'max_value_to_sell': raw_data[3]
-        }
-
 
 class MinterCreateCoinTx(MinterTx):
     """ Create coin transaction """
@@ -617,6 +1119,16 @@ class MinterCreateCoinTx(MinterTx):
     # Fee units
     COMMISSION = 1000
 
+    # Tx data schema
+    FIELDS = (
+        ('name', TEXT),
+        ('symbol', COIN),
+        ('initial_amount', AMOUNT),
+        ('initial_reserve', AMOUNT),
+        ('crr', UINT),
+        ('max_supply', AMOUNT)
+    )
+
     def __init__(self, name, symbol, initial_amount, initial_reserve, crr,
                  max_supply, **kwargs):
         """
@@ -631,71 +1143,12 @@ class MinterCreateCoinTx(MinterTx):
         super().__init__(**kwargs)
 
         self.name = name
-        self.symbol = symbol.upper()
+        self.symbol = MinterHelper.upper_coin_name(symbol)
         self.initial_amount = initial_amount
         self.initial_reserve = initial_reserve
         self.crr = crr
         self.max_supply = max_supply
 
-    def _structure_from_instance(self):
-        """ Override parent method. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'name': self.name,
-                'symbol': MinterHelper.encode_coin_name(self.symbol),
-                'initial_amount': MinterHelper.to_pip(self.initial_amount),
-                'initial_reserve': MinterHelper.to_pip(self.initial_reserve),
-                'crr': '' if self.crr == 0 else self.crr,
-                'max_supply': MinterHelper.to_pip(self.max_supply)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'name': kwargs['data']['name'].decode(),
-            'symbol': MinterHelper.decode_coin_name(kwargs['data']['symbol']),
-            'initial_amount': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['initial_amount'], 'big')
-            ),
-            'initial_reserve': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['initial_reserve'], 'big')
-            ),
-            'crr': int.from_bytes(kwargs['data']['crr'], 'big'),
-            'max_supply': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['max_supply'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'name': raw_data[0],
-            'symbol': raw_data[1],
-            'initial_amount': raw_data[2],
-            'initial_reserve': raw_data[3],
-            'crr': raw_data[4],
-            'max_supply': raw_data[5]
-        }
-
 
 class MinterDeclareCandidacyTx(MinterTx):
     """ Declare candidacy transaction """
@@ -706,11 +1159,20 @@ class MinterDeclareCandidacyTx(MinterTx):
     # Fee units
     COMMISSION = 10000
 
+    # Tx data schema
+    FIELDS = (
+        ('address', ADDRESS),
+        ('pub_key', PUBKEY),
+        ('commission', UINT),
+        ('coin', COIN),
+        ('stake', AMOUNT)
+    )
+
     def __init__(self, address, pub_key, commission, coin, stake, **kwargs):
         """
         Args:
-            address (str): candidate address
-            pub_key (str): candidate public key
+            address (str|MinterAddress): candidate address
+            pub_key (str|MinterPubKey): candidate public key
             commission (int): candidate commission
             coin (str): coin name
             stake (float|int): stake in BIP
@@ -721,69 +1183,9 @@ class MinterDeclareCandidacyTx(MinterTx):
         self.address = address
         self.pub_key = pub_key
         self.commission = '' if commission == 0 else commission
-        self.coin = coin.upper()
+        self.coin = MinterHelper.upper_coin_name(coin)
         self.stake = stake
 
-    def _structure_from_instance(self):
-        """ Override parent method. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'address': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.address)
-                ),
-                'pub_key': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.pub_key)
-                ),
-                'commission': '' if self.commission == 0 else self.commission,
-                'coin': MinterHelper.encode_coin_name(self.coin),
-                'stake': MinterHelper.to_pip(self.stake)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'address': MinterHelper.prefix_add(
-                kwargs['data']['address'].hex(), PREFIX_ADDR
-            ),
-            'pub_key': MinterHelper.prefix_add(
-                kwargs['data']['pub_key'].hex(), PREFIX_PUBKEY
-            ),
-            'commission': int.from_bytes(kwargs['data']['commission'], 'big'),
-            'coin': MinterHelper.decode_coin_name(kwargs['data']['coin']),
-            'stake': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['stake'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'address': raw_data[0],
-            'pub_key': raw_data[1],
-            'commission': raw_data[2],
-            'coin': raw_data[3],
-            'stake': raw_data[4]
-        }
-
 
 class MinterDelegateTx(MinterTx):
     """ Delegate transaction """
@@ -794,62 +1196,20 @@ class MinterDelegateTx(MinterTx):
     # Fee units
     COMMISSION = 200
 
+    # Tx data schema
+    FIELDS = (
+        ('pub_key', PUBKEY),
+        ('coin', COIN),
+        ('stake', AMOUNT)
+    )
+
     def __init__(self, pub_key, coin, stake, **kwargs):
         super().__init__(**kwargs)
 
         self.pub_key = pub_key
-        self.coin = coin.upper()
+        self.coin = MinterHelper.upper_coin_name(coin)
         self.stake = stake
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'pub_key': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.pub_key)
-                ),
-                'coin': MinterHelper.encode_coin_name(self.coin),
-                'stake': MinterHelper.to_pip(self.stake)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'pub_key': MinterHelper.prefix_add(
-                kwargs['data']['pub_key'].hex(), PREFIX_PUBKEY
-            ),
-            'coin': MinterHelper.decode_coin_name(kwargs['data']['coin']),
-            'stake': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['stake'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'pub_key': raw_data[0],
-            'coin': raw_data[1],
-            'stake': raw_data[2]
-        }
-
 
 class MinterRedeemCheckTx(MinterTx):
     """ Redeem check transaction """
@@ -860,10 +1220,16 @@ class MinterRedeemCheckTx(MinterTx):
     # Fee units
     COMMISSION = 10
 
+    # Tx data schema
+    FIELDS = (
+        ('check', CHECK),
+        ('proof', HEX)
+    )
+
     def __init__(self, check, proof, **kwargs):
         """
         Args:
-            check (str)
+            check (str|MinterCheckId)
             proof (str)
         """
 
@@ -872,49 +1238,6 @@ class MinterRedeemCheckTx(MinterTx):
         self.check = check
         self.proof = proof
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'check': bytes.fromhex(MinterHelper.prefix_remove(self.check)),
-                'proof': bytes.fromhex(self.proof)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'check': MinterHelper.prefix_add(
-                kwargs['data']['check'].hex(), PREFIX_CHECK
-            ),
-            'proof': kwargs['data']['proof'].hex()
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'check': raw_data[0],
-            'proof': raw_data[1]
-        }
-
 
 class MinterSellAllCoinTx(MinterTx):
     """ Sell all coin transaction """
@@ -925,6 +1248,13 @@ class MinterSellAllCoinTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('coin_to_sell', COIN),
+        ('coin_to_buy', COIN),
+        ('min_value_to_buy', AMOUNT)
+    )
+
     def __init__(self, coin_to_sell, coin_to_buy, min_value_to_buy, **kwargs):
         """
         Args:
@@ -935,60 +1265,10 @@ class MinterSellAllCoinTx(MinterTx):
 
         super().__init__(**kwargs)
 
-        self.coin_to_sell = coin_to_sell.upper()
-        self.coin_to_buy = coin_to_buy.upper()
+        self.coin_to_sell = MinterHelper.upper_coin_name(coin_to_sell)
+        self.coin_to_buy = MinterHelper.upper_coin_name(coin_to_buy)
         self.min_value_to_buy = min_value_to_buy
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'coin_to_sell': MinterHelper.encode_coin_name(self.coin_to_sell),
-                'coin_to_buy': MinterHelper.encode_coin_name(self.coin_to_buy),
-                'min_value_to_buy': MinterHelper.to_pip(self.min_value_to_buy)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'coin_to_sell': MinterHelper.decode_coin_name(
-                kwargs['data']['coin_to_sell']
-            ),
-            'coin_to_buy': MinterHelper.decode_coin_name(
-                kwargs['data']['coin_to_buy']
-            ),
-            'min_value_to_buy': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['min_value_to_buy'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'coin_to_sell': raw_data[0],
-            'coin_to_buy': raw_data[1],
-            'min_value_to_buy': raw_data[2]
-        }
-
 
 class MinterSellCoinTx(MinterTx):
     """ Sell coin transaction """
@@ -999,6 +1279,14 @@ class MinterSellCoinTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('coin_to_sell', COIN),
+        ('value_to_sell', AMOUNT),
+        ('coin_to_buy', COIN),
+        ('min_value_to_buy', AMOUNT)
+    )
+
     def __init__(self, coin_to_sell, value_to_sell, coin_to_buy,
                  min_value_to_buy, **kwargs):
         """
@@ -1011,66 +1299,11 @@ class MinterSellCoinTx(MinterTx):
 
         super().__init__(**kwargs)
 
-        self.coin_to_sell = coin_to_sell.upper()
+        self.coin_to_sell = MinterHelper.upper_coin_name(coin_to_sell)
         self.value_to_sell = value_to_sell
-        self.coin_to_buy = coin_to_buy.upper()
+        self.coin_to_buy = MinterHelper.upper_coin_name(coin_to_buy)
         self.min_value_to_buy = min_value_to_buy
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'coin_to_sell': MinterHelper.encode_coin_name(self.coin_to_sell),
-                'value_to_sell': MinterHelper.to_pip(self.value_to_sell),
-                'coin_to_buy': MinterHelper.encode_coin_name(self.coin_to_buy),
-                'min_value_to_buy': MinterHelper.to_pip(self.min_value_to_buy)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'coin_to_sell': MinterHelper.decode_coin_name(
-                kwargs['data']['coin_to_sell']
-            ),
-            'value_to_sell': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['value_to_sell'], 'big')
-            ),
-            'coin_to_buy': MinterHelper.decode_coin_name(
-                kwargs['data']['coin_to_buy']
-            ),
-            'min_value_to_buy': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['min_value_to_buy'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'coin_to_sell': raw_data[0],
-            'value_to_sell': raw_data[1],
-            'coin_to_buy': raw_data[2],
-            'min_value_to_buy': raw_data[3]
-        }
-
 
 class MinterSendCoinTx(MinterTx):
     """ Send coin transaction """
@@ -1081,61 +1314,20 @@ class MinterSendCoinTx(MinterTx):
     # Fee units
     COMMISSION = 10
 
+    # Tx data schema
+    FIELDS = (
+        ('coin', COIN),
+        ('to', ADDRESS),
+        ('value', AMOUNT)
+    )
+
     def __init__(self, coin, to, value, **kwargs):
         super().__init__(**kwargs)
 
-        self.coin = coin.upper()
+        self.coin = MinterHelper.upper_coin_name(coin)
         self.to = to
         self.value = value
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'coin': MinterHelper.encode_coin_name(self.coin),
-                'to': bytes.fromhex(MinterHelper.prefix_remove(self.to)),
-                'value': MinterHelper.to_pip(self.value)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'coin': MinterHelper.decode_coin_name(kwargs['data']['coin']),
-            'to': MinterHelper.prefix_add(
-                kwargs['data']['to'].hex(), PREFIX_ADDR
-            ),
-            'value': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['value'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'coin': raw_data[0],
-            'to': raw_data[1],
-            'value': raw_data[2]
-        }
-
 
 class MinterMultiSendCoinTx(MinterTx):
     """ Multi send transaction """
@@ -1147,6 +1339,15 @@ class MinterMultiSendCoinTx(MinterTx):
     COMMISSION = 10
     COMMISSION_PER_RECIPIENT = 5
 
+    # Max number of recipients in one tx, accepted by network
+    MAX_RECIPIENTS = 100
+
+    # Tx data schema. Each send item is encoded as [coin, to, value] list.
+    # Recipients can be decoded to compact `MultiSendRecipients`.
+    FIELDS = (
+        ('txs', RecipientsField()),
+    )
+
     def __init__(self, txs, **kwargs):
         """
         Args:
@@ -1169,57 +1370,6 @@ class MinterMultiSendCoinTx(MinterTx):
 
         return base_fee + recipients_fee
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'txs': []
-            }
-        })
-
-        # Populate multi data from each single tx.
-        for item in self.txs:
-            struct['data']['txs'].append([
-                MinterHelper.encode_coin_name(item['coin'].upper()),
-                bytes.fromhex(MinterHelper.prefix_remove(item['to'])),
-                MinterHelper.to_pip(item['value'])
-            ])
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        for index, item in enumerate(kwargs['data']['txs']):
-            kwargs['data']['txs'][index] = {
-                'coin': MinterHelper.decode_coin_name(item[0]),
-                'to': MinterHelper.prefix_add(item[1].hex(), PREFIX_ADDR),
-                'value': MinterHelper.to_bip(int.from_bytes(item[2], 'big'))
-            }
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        data = {'txs': []}
-        for item in raw_data[0]:
-            data['txs'].append([item[0], item[1], item[2]])
-
-        return data
-
 
 class MinterSetCandidateOffTx(MinterTx):
     """ Set candidate OFF transaction """
@@ -1230,58 +1380,21 @@ class MinterSetCandidateOffTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('pub_key', PUBKEY),
+    )
+
     def __init__(self, pub_key, **kwargs):
         """
         Args:
-            pub_key (str)
+            pub_key (str|MinterPubKey)
         """
 
         super().__init__(**kwargs)
 
         self.pub_key = pub_key
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'pub_key': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.pub_key)
-                )
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'pub_key': MinterHelper.prefix_add(
-                kwargs['data']['pub_key'].hex(), PREFIX_PUBKEY
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'pub_key': raw_data[0]
-        }
-
 
 class MinterSetCandidateOnTx(MinterTx):
     """ Set candidate ON transaction """
@@ -1292,58 +1405,21 @@ class MinterSetCandidateOnTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('pub_key', PUBKEY),
+    )
+
     def __init__(self, pub_key, **kwargs):
         """
         Args:
-            pub_key (str)
+            pub_key (str|MinterPubKey)
         """
 
         super().__init__(**kwargs)
 
         self.pub_key = pub_key
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'pub_key': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.pub_key)
-                )
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'pub_key': MinterHelper.prefix_add(
-                kwargs['data']['pub_key'].hex(), PREFIX_PUBKEY
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'pub_key': raw_data[0]
-        }
-
 
 class MinterUnbondTx(MinterTx):
     """ Unbond transaction """
@@ -1354,10 +1430,17 @@ class MinterUnbondTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('pub_key', PUBKEY),
+        ('coin', COIN),
+        ('value', AMOUNT)
+    )
+
     def __init__(self, pub_key, coin, value, **kwargs):
         """
         Args:
-            pub_key (str)
+            pub_key (str|MinterPubKey)
             coin (str)
             value (float|int): BIP
         """
@@ -1365,59 +1448,9 @@ class MinterUnbondTx(MinterTx):
         super().__init__(**kwargs)
 
         self.pub_key = pub_key
-        self.coin = coin.upper()
+        self.coin = MinterHelper.upper_coin_name(coin)
         self.value = value
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'pub_key': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.pub_key)
-                ),
-                'coin': MinterHelper.encode_coin_name(self.coin),
-                'value': MinterHelper.to_pip(self.value)
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'pub_key': MinterHelper.prefix_add(
-                kwargs['data']['pub_key'].hex(), PREFIX_PUBKEY
-            ),
-            'coin': MinterHelper.decode_coin_name(kwargs['data']['coin']),
-            'value': MinterHelper.to_bip(
-                int.from_bytes(kwargs['data']['value'], 'big')
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'pub_key': raw_data[0],
-            'coin': raw_data[1],
-            'value': raw_data[2]
-        }
-
 
 class MinterEditCandidateTx(MinterTx):
     """ Edit candidate transaction """
@@ -1428,12 +1461,19 @@ class MinterEditCandidateTx(MinterTx):
     # Fee units
     COMMISSION = 10000
 
+    # Tx data schema
+    FIELDS = (
+        ('pub_key', PUBKEY),
+        ('reward_address', ADDRESS),
+        ('owner_address', ADDRESS)
+    )
+
     def __init__(self, pub_key, reward_address, owner_address, **kwargs):
         """
         Args:
-            pub_key (str): candidate public key
-            reward_address (str)
-            owner_address (str)
+            pub_key (str|MinterPubKey): candidate public key
+            reward_address (str|MinterAddress)
+            owner_address (str|MinterAddress)
         """
 
         super().__init__(**kwargs)
@@ -1442,62 +1482,6 @@ class MinterEditCandidateTx(MinterTx):
         self.reward_address = reward_address
         self.owner_address = owner_address
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-
-        struct = super()._structure_from_instance()
-
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'pub_key': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.pub_key)
-                ),
-                'reward_address': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.reward_address)
-                ),
-                'owner_address': bytes.fromhex(
-                    MinterHelper.prefix_remove(self.owner_address)
-                )
-            }
-        })
-
-        return struct
-
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-
-        kwargs = super()._structure_to_kwargs(structure)
-
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'pub_key': MinterHelper.prefix_add(
-                kwargs['data']['pub_key'].hex(), PREFIX_PUBKEY
-            ),
-            'reward_address': MinterHelper.prefix_add(
-                kwargs['data']['reward_address'].hex(), PREFIX_ADDR
-            ),
-            'owner_address': MinterHelper.prefix_add(
-                kwargs['data']['owner_address'].hex(), PREFIX_ADDR
-            )
-        })
-
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
-
-        return kwargs
-
-    @classmethod
-    def _data_from_raw(cls, raw_data):
-        """ Parent method implementation """
-        return {
-            'pub_key': raw_data[0],
-            'reward_address': raw_data[1],
-            'owner_address': raw_data[2]
-        }
-
 
 class MinterCreateMultisigTx(MinterTx):
     """ Create multi signature address transaction """
@@ -1507,12 +1491,19 @@ class MinterCreateMultisigTx(MinterTx):
     # Fee units
     COMMISSION = 100
 
+    # Tx data schema
+    FIELDS = (
+        ('threshold', UINT),
+        ('weights', ListField(UINT)),
+        ('addresses', ListField(ADDRESS, 32))
+    )
+
     def __init__(self, threshold, weights, addresses, **kwargs):
         """
         Args:
             threshold (int): Address threshold
             weights (list(int)): List ow weights
-            addresses (list(str)): List of addresses
+            addresses (list(str|MinterAddress)): List of addresses
             **kwargs: MinterTx kwargs
         """
         self.threshold = threshold
@@ -1539,56 +1530,109 @@ class MinterCreateMultisigTx(MinterTx):
 
         if type(self.addresses) not in (list, tuple) or \
                 1 > len(self.addresses) > 32 or \
-                any(type(a) is not str for a in self.addresses):
-            raise ValueError("'addresses' should be a list of max 32 strings")
+                any(not isinstance(a, (str, MinterAddress))
+                    for a in self.addresses):
+            raise ValueError(
+                "'addresses' should be a list of max 32 strings or "
+                "'MinterAddress' values"
+            )
 
         if len(self.weights) != len(self.addresses):
             raise ValueError("'weights' and 'addresses' have different length")
 
-    def _structure_from_instance(self):
-        """ Override parent method to add tx special data. """
-        struct = super()._structure_from_instance()
-        struct.update({
-            'type': self.TYPE,
-            'data': {
-                'threshold': self.threshold if self.threshold else '',
-                'weights': [w if w else '' for w in self.weights],
-                'addresses': [
-                    bytes.fromhex(MinterHelper.prefix_remove(address))
-                    for address in self.addresses
-                ]
-            }
-        })
 
-        return struct
+class MinterUnknownTx(MinterTx):
+    """
+    Transaction of unregistered type.
+    Only tx header is decoded, tx data is kept as raw RLP bytes.
+    """
 
-    @classmethod
-    def _structure_to_kwargs(cls, structure):
-        """ Prepare decoded structure data to instance kwargs. """
-        kwargs = super()._structure_to_kwargs(structure)
+    def __init__(self, type, data, **kwargs):
+        """
+        Args:
+            type (int): tx type
+            data (bytes): RLP encoded tx data
+        """
+        super().__init__(**kwargs)
 
-        # Convert data values to verbose.
-        # Data will be passed as additional kwarg
-        kwargs['data'].update({
-            'threshold': int.from_bytes(kwargs['data']['threshold'], 'big'),
-            'weights': [
-                int.from_bytes(w, 'big') for w in kwargs['data']['weights']
-            ],
-            'addresses': [
-                MinterHelper.prefix_add(address.hex(), PREFIX_ADDR)
-                for address in kwargs['data']['addresses']
-            ]
-        })
+        self.type = type
+        self.data = data
 
-        # Populate data key values as kwargs
-        kwargs.update(kwargs['data'])
+    @property
+    def _TYPE_RLP(self):
+        return encode_int(self.type)
 
-        return kwargs
+    def _encode_data(self):
+        """ Override parent method. Data is already encoded. """
+        return self.data
 
     @classmethod
-    def _data_from_raw(cls, raw_data):
-        return {
-            'threshold': raw_data[0],
-            'weights': raw_data[1],
-            'addresses': raw_data[2]
-        }
+    def _structure_to_kwargs(cls, structure, compact=False):
+        """ Override parent method. Data is kept as is. """
+        structure.update({
+            'gas_coin': MinterHelper.decode_coin_name(structure['gas_coin'])
+        })
+
+        return structure
+
+    def get_fee(self):
+        """
+        Fee of unknown tx type can't be calculated
+        Raises:
+            UnknownTxTypeError
+        """
+        raise UnknownTxTypeError(
+            f"Fee of undefined tx type '{self.type}' can't be calculated"
+        )
+
+
+# Record of unknown tx keeps raw tx data
+MinterUnknownTx.RECORD = make_record_class(
+    MinterUnknownTx, data_fields=('data',)
+)
+
+
+# Multi signature data: [sender address, [signature, ...]]
+_MULTISIG_DATA = StructField((
+    ('from_mx', ADDRESS),
+    ('signatures', ListField(SIGNATURE, MinterTx.MAX_SIGNATURES))
+))
+
+
+def _sign_worker(task):
+    """
+    Sign tx in worker process.
+    Args:
+        task (tuple(MinterTx, str|MinterSigningKey)): tx and private key
+    Returns:
+        bytes: raw signed tx
+    """
+    tx, private_key = task
+
+    return tx.sign_bytes(private_key=private_key)
+
+
+def _decode_worker(task):
+    """
+    Decode raw tx in worker process.
+    Args:
+        task (tuple(bytes, bool, bool, bool, bool)): raw tx, recover_sender,
+                                                     allow_unknown, records,
+                                                     compact
+    Returns:
+        dict|MinterTxRecord: tx dict without raw tx or tx record
+    """
+    raw_tx, recover_sender, allow_unknown, records, compact = task
+    if records:
+        return MinterTx.decode_to_record(
+            raw_tx, allow_unknown=allow_unknown,
+            recover_sender=recover_sender, compact=compact
+        )
+
+    tx = MinterTx.decode_to_dict(
+        raw_tx, allow_unknown=allow_unknown, recover_sender=recover_sender,
+        compact=compact
+    )
+    del tx['signed_tx'], tx['signed_bytes']
+
+    return tx
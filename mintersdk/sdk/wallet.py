@@ -6,7 +6,8 @@ import hmac
 
 import sslcrypto
 from mnemonic.mnemonic import Mnemonic
-from mintersdk import MinterHelper, PREFIX_PUBKEY, PREFIX_ADDR
+from mintersdk import MinterHelper, PREFIX_PUBKEY, PREFIX_ADDR, to_bytes
+from mintersdk.sdk import ECDSA
 
 
 class MinterWallet(object):
@@ -81,7 +82,7 @@ class MinterWallet(object):
             str
         """
         # Get public key from private
-        public_key = cls.curve.private_to_public(
+        public_key = ECDSA.private_to_public(
             int(private_key, 16).to_bytes(length=32, byteorder='big')
         )
         public_key = public_key.hex()[2:]
@@ -92,16 +93,14 @@ class MinterWallet(object):
     def get_address_from_public_key(cls, public_key):
         """
         Args:
-            public_key (str)
+            public_key (str|MinterPubKey)
         Returns:
             str
         """
         # Create keccak hash
-        _keccak = MinterHelper.keccak_hash(
-            bytes.fromhex(MinterHelper.prefix_remove(public_key))
-        )
+        _keccak = MinterHelper.keccak_digest(to_bytes(public_key))
 
-        return MinterHelper.prefix_add(_keccak[-40:], PREFIX_ADDR)
+        return MinterHelper.prefix_add(_keccak[-20:].hex(), PREFIX_ADDR)
 
     @staticmethod
     def parse_path(path):
@@ -150,12 +149,12 @@ class MinterWallet(object):
             hmac_data = b'\x00' + parent_key.to_bytes(length=32, byteorder='big')
         else:
             # Create default curve public key from private
-            public_key = cls.curve.private_to_public(
+            public_key = ECDSA.private_to_public(
                 parent_key.to_bytes(length=32, byteorder='big')
             )
 
             # Get public key coordinates
-            x, y = cls.curve.decode_public_key(public_key)
+            x, y = ECDSA.decode_public_key(public_key)
             x = int.from_bytes(x, byteorder='big')
             y = int.from_bytes(y, byteorder='big')
 
@@ -208,3 +207,63 @@ class MinterWallet(object):
             keys.append(cls.from_parent(parent_key=k, index=index))
 
         return keys
+
+
+class MinterSigningKey(object):
+    """
+    Reusable signing key.
+    Private key is parsed only once, public key and address are derived
+    once and cached. Object can be passed everywhere private key is
+    accepted for signing.
+    """
+
+    def __init__(self, private_key):
+        """
+        Args:
+            private_key (str|bytes): hex or raw private key
+        """
+        if type(private_key) is str:
+            private_key = bytes.fromhex(private_key)
+
+        if len(private_key) != 32:
+            raise ValueError('Private key should be 32 bytes long')
+
+        # Raw private key
+        self.secret = bytes(private_key)
+        # Hex private key
+        self.private_key = self.secret.hex()
+        # Prepared ECDSA private key context and backend it was prepared by
+        self.context = None
+        self._backend = None
+        self.get_context(ECDSA.get_backend())
+
+        # Derived public key and address
+        self.public_key = MinterWallet.get_public_from_private(
+            self.private_key
+        )
+        self.address = MinterWallet.get_address_from_public_key(
+            self.public_key
+        )
+
+    def get_context(self, backend):
+        """
+        Get private key context prepared by ECDSA backend.
+        Context is re-created only if backend was changed.
+        Args:
+            backend (ECDSABackend)
+        Returns:
+            any: backend specific context
+        """
+        if self._backend is not backend:
+            self.context = backend.prepare_private_key(self.secret)
+            self._backend = backend
+
+        return self.context
+
+    def __reduce__(self):
+        # Only hex private key is pickled, context is re-created
+        # in the receiving process
+        return self.__class__, (self.private_key,)
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.address}>'
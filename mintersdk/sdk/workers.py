@@ -0,0 +1,190 @@
+"""
+@author: Roman Matusevich
+"""
+import atexit
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+# Persistent process pools, one per workers count.
+# Pools are created on first use and live until interpreter exit,
+# so SDK import and curve setup are paid only once per worker process.
+_POOLS = {}
+
+# Worker config (see `_worker_config`) each process pool was started with
+_POOL_CONFIGS = {}
+
+# Persistent thread pools, one per workers count.
+# Threads run in parallel only while ECDSA backend is inside native code,
+# which releases the GIL (see `ECDSABackend.releases_gil`).
+_THREAD_POOLS = {}
+
+
+def _worker_config():
+    """
+    State of current process, which worker processes should share:
+    selected backends and registered tx types.
+    Returns:
+        tuple: ECDSA backend class, Keccak backend class,
+               tuple of (tx type, tx class)
+    """
+    from mintersdk import keccak
+    from mintersdk.sdk import ECDSA
+    from mintersdk.sdk.transactions import MinterTx
+
+    return (
+        type(ECDSA.get_backend()),
+        type(keccak.get_backend()),
+        tuple(sorted(MinterTx._TYPES.items()))
+    )
+
+
+def _init_worker(config=None):
+    """
+    Worker process initializer.
+    Import SDK modules once, so secp256k1 curve is set up before
+    the first task arrives. Then select the same backends and tx types,
+    as in parent process, since spawned worker doesn't inherit them.
+    Args:
+        config (tuple|None): parent worker config (see `_worker_config`)
+    """
+    from mintersdk import keccak
+    from mintersdk.sdk import ECDSA, backends
+    from mintersdk.sdk.transactions import MinterTx
+    import mintersdk.sdk.check  # noqa: F401
+
+    if config is None:
+        return
+
+    ecdsa_backend, keccak_backend, tx_types = config
+    backends.BACKENDS[ecdsa_backend.name] = ecdsa_backend
+    ECDSA.set_backend(ecdsa_backend.name)
+    keccak.BACKENDS[keccak_backend.name] = keccak_backend
+    keccak.set_backend(keccak_backend.name)
+
+    MinterTx._TYPES.clear()
+    MinterTx._TYPES.update(tx_types)
+
+
+def _safe_call(fn, item):
+    """
+    Call `fn` with `item` and catch any error, so one bad item doesn't
+    break the whole batch.
+    Args:
+        fn (function): module level function to call
+        item (any): function argument
+    Returns:
+        tuple(bool, any): success flag and result or exception
+    """
+    try:
+        return True, fn(item)
+    except Exception as e:
+        return False, e
+
+
+def get_pool(workers=None):
+    """
+    Get persistent process pool.
+    Pool is started again, if backend is selected or tx type is
+    registered after pool was started.
+    Args:
+        workers (int|None): number of worker processes.
+                            Defaults to number of CPUs.
+    Returns:
+        ProcessPoolExecutor
+    """
+    workers = workers or os.cpu_count() or 1
+    config = _worker_config()
+
+    pool = _POOLS.get(workers)
+    if pool is not None and _POOL_CONFIGS.get(workers) != config:
+        _POOLS.pop(workers, None)
+        pool.shutdown(wait=True)
+        pool = None
+
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers,
+                                   initializer=_init_worker,
+                                   initargs=(config,))
+        _POOLS[workers] = pool
+        _POOL_CONFIGS[workers] = config
+
+    return pool
+
+
+def get_thread_pool(workers=None):
+    """
+    Get persistent thread pool.
+    Args:
+        workers (int|None): number of threads.
+                            Defaults to number of CPUs.
+    Returns:
+        ThreadPoolExecutor
+    """
+    workers = workers or os.cpu_count() or 1
+
+    pool = _THREAD_POOLS.get(workers)
+    if pool is None:
+        # Pool can be requested from several threads at once. Threads are
+        # started lazily, so extra pool is dropped without cost.
+        pool = _THREAD_POOLS.setdefault(
+            workers, ThreadPoolExecutor(max_workers=workers)
+        )
+
+    return pool
+
+
+def shutdown_pools():
+    """ Shutdown all persistent process and thread pools """
+    for pools in (_POOLS, _THREAD_POOLS):
+        while pools:
+            _, pool = pools.popitem()
+            pool.shutdown(wait=True)
+    _POOL_CONFIGS.clear()
+
+
+atexit.register(shutdown_pools)
+
+
+def map_ordered(fn, items, workers=None, chunksize=None, threads=False):
+    """
+    Apply `fn` to each item over persistent process or thread pool.
+    Results are returned in input order. Errors are reported per item.
+    Args:
+        fn (function): module level (picklable) function
+        items (list): function arguments
+        workers (int|None): number of worker processes or threads
+        chunksize (int|None): items per task sent to worker process.
+                              By default items are split into 4 chunks
+                              per worker. Ignored by thread pool.
+        threads (bool): use thread pool instead of process pool, e.g. if
+                        process can't fork. Items and results aren't
+                        pickled.
+    Returns:
+        list(tuple(bool, any)): success flag and result or exception
+                                for each item
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    if threads:
+        pool = get_thread_pool(workers)
+        return list(pool.map(functools.partial(_safe_call, fn), items))
+
+    if not chunksize:
+        chunksize = max(1, len(items) // (workers * 4))
+
+    pool = get_pool(workers)
+    try:
+        return list(
+            pool.map(functools.partial(_safe_call, fn), items,
+                     chunksize=chunksize)
+        )
+    except BrokenProcessPool:
+        # Drop broken pool, so next call creates a new one
+        _POOLS.pop(workers, None)
+        raise
@@ -7,3 +7,11 @@ def to_pip(value):
 
 def to_bip(value):
     return MinterHelper.to_bip(value)
+
+
+def to_pip_many(values):
+    return MinterHelper.to_pip_many(values)
+
+
+def to_bip_many(values, scale=None):
+    return MinterHelper.to_bip_many(values, scale=scale)
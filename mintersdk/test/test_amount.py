@@ -0,0 +1,129 @@
+import unittest
+import decimal
+import pickle
+
+from mintersdk import Amount, MinterHelper
+from mintersdk.sdk.transactions import MinterTx, MinterSendCoinTx
+
+
+class TestAmount(unittest.TestCase):
+
+    def test_parse(self):
+        values = [
+            ('1', 10 ** 18),
+            ('1.5', 15 * 10 ** 17),
+            ('0.000000000000000001', 1),
+            ('0.0000000000000000019', 1),
+            ('123456789012.123456789012345678',
+             123456789012123456789012345678),
+            ('.5', 5 * 10 ** 17),
+            ('2.', 2 * 10 ** 18),
+            (' 3 ', 3 * 10 ** 18),
+            ('-1.5', -15 * 10 ** 17),
+            ('1E+2', 100 * 10 ** 18),
+            (7, 7 * 10 ** 18),
+            (0.1, 10 ** 17),
+            (1e-05, 10 ** 13),
+            (decimal.Decimal('0.10'), 10 ** 17),
+            (decimal.Decimal('1E+2'), 100 * 10 ** 18),
+            (Amount(5), 5)
+        ]
+        for value, pip in values:
+            self.assertEqual(Amount.parse(value), pip, value)
+            self.assertEqual(MinterHelper.to_pip(value), pip, value)
+
+        for value in ['', '.', 'abc', '1.2.3']:
+            with self.assertRaises(decimal.InvalidOperation):
+                Amount.parse(value)
+
+    def test_str(self):
+        self.assertEqual(str(Amount(0)), '0')
+        self.assertEqual(str(Amount(10 ** 18)), '1')
+        self.assertEqual(str(Amount(15 * 10 ** 17)), '1.5')
+        self.assertEqual(str(Amount(-1)), '-0.000000000000000001')
+        self.assertEqual(repr(Amount.from_bip('2.5')), "Amount('2.5')")
+        self.assertEqual(f"{Amount.from_bip('1.5'):.2f}", '1.50')
+        self.assertEqual(
+            Amount.from_bip('1.5').to_decimal(), decimal.Decimal('1.5')
+        )
+        self.assertEqual(
+            MinterHelper.to_bip(Amount.from_bip('1.5')), decimal.Decimal('1.5')
+        )
+
+    def test_compare(self):
+        amount = Amount.from_bip('1.5')
+
+        self.assertEqual(amount, decimal.Decimal('1.5'))
+        self.assertEqual(amount, 1.5)
+        self.assertEqual(amount, Amount(15 * 10 ** 17))
+        self.assertEqual(Amount.from_bip(2), 2)
+        self.assertNotEqual(amount, '1.5')
+        self.assertLess(amount, 2)
+        self.assertGreater(amount, decimal.Decimal('1.4'))
+        self.assertEqual(sorted([2, amount, Amount(0)]), [0, amount, 2])
+
+        # Hash is the same as of equal int and Decimal
+        self.assertEqual(hash(Amount.from_bip(2)), hash(2))
+        self.assertEqual(hash(amount), hash(decimal.Decimal('1.5')))
+        self.assertIn(decimal.Decimal('1.5'), {amount})
+
+        # Float and Decimal are compared by exact value, as by Decimal,
+        # so equal values have equal hashes
+        pairs = [
+            (Amount.from_bip('0.5'), 0.5, True),
+            (Amount.from_bip('0.1'), 0.1, False),
+            (Amount.from_bip('0.1'), decimal.Decimal('0.1'), True),
+            (Amount.from_bip('0.1'),
+             decimal.Decimal('0.1000000000000000001'), False)
+        ]
+        for amount, value, equal in pairs:
+            self.assertEqual(amount == value, equal)
+            self.assertEqual(value in {amount}, equal)
+            if equal:
+                self.assertEqual(hash(amount), hash(value))
+        self.assertLess(Amount.from_bip('0.1'), 0.1)
+
+    def test_arithmetic(self):
+        amount = Amount.from_bip('1.5')
+
+        self.assertEqual(amount + 1, Amount.from_bip('2.5'))
+        self.assertEqual(1 - amount, Amount.from_bip('-0.5'))
+        self.assertEqual(amount * 2, 3)
+        self.assertEqual(amount * decimal.Decimal('0.5'), decimal.Decimal('0.75'))
+        self.assertEqual(amount / 3, decimal.Decimal('0.5'))
+        self.assertEqual(amount / Amount.from_bip(3), decimal.Decimal('0.5'))
+        self.assertEqual(Amount(10) / 3, Amount(3))
+        self.assertEqual(sum([amount, amount]), 3)
+        self.assertEqual(-amount, Amount.from_bip('-1.5'))
+        self.assertEqual(float(amount), 1.5)
+        self.assertEqual(int(-amount), -1)
+        self.assertFalse(Amount(0))
+        self.assertIsInstance(amount + 1, Amount)
+
+    def test_pickle(self):
+        amount = Amount.from_bip('1.5')
+        self.assertEqual(pickle.loads(pickle.dumps(amount)), amount)
+
+    def test_tx(self):
+        tx = MinterSendCoinTx(
+            nonce=1, chain_id=MinterTx.TESTNET_CHAIN_ID, gas_coin='MNT',
+            to='Mxd82558ea00eb81d35f2654953598f5d51737d31d', coin='MNT',
+            value=Amount.from_bip('1.5')
+        )
+        same = MinterSendCoinTx(
+            nonce=1, chain_id=MinterTx.TESTNET_CHAIN_ID, gas_coin='MNT',
+            to='Mxd82558ea00eb81d35f2654953598f5d51737d31d', coin='MNT',
+            value='1.5'
+        )
+        self.assertEqual(tx._encode_data(), same._encode_data())
+
+        tx.sign('07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142')
+        decoded = MinterTx.from_raw(tx.signed_tx)
+
+        self.assertIsInstance(decoded.value, Amount)
+        self.assertEqual(decoded.value.pip, 15 * 10 ** 17)
+        self.assertEqual(decoded.value, decimal.Decimal('1.5'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,12 @@
 import unittest
 
 from mintersdk.sdk.check import MinterCheck
+from mintersdk.sdk.encoding import (
+    DecodingError, DecodingLimitError, FieldLengthError, decode_strings,
+    encode
+)
 from mintersdk.sdk.transactions import MinterTx
+from mintersdk.sdk.wallet import MinterSigningKey
 
 
 class TestMinterCheck(unittest.TestCase):
@@ -27,6 +32,11 @@ class TestMinterCheck(unittest.TestCase):
 
         self.assertEqual(check, self.VALID_CHECK)
 
+    def test_check_signing_key(self):
+        check = self.CHECK.sign(MinterSigningKey(self.PRIVATE_KEY))
+
+        self.assertEqual(check, self.VALID_CHECK)
+
     def test_proof(self):
         proof = MinterCheck.proof(
             address=self.ADDRESS,
@@ -43,3 +53,61 @@ class TestMinterCheck(unittest.TestCase):
             'Mxce931863b9c94a526d94acd8090c1c5955a6eb4b'
         )
         self.assertEqual(check.gas_coin, self.CHECK.gas_coin)
+
+    def test_fromraw_invalid(self):
+        items = decode_strings(bytes.fromhex(self.VALID_CHECK[2:]))
+
+        def raw(index, item):
+            check = list(items)
+            check[index] = item
+            return 'Mc' + encode(check).hex()
+
+        with self.assertRaises(DecodingLimitError):
+            MinterCheck.from_raw('Mc' + '00' * (MinterCheck.MAX_CHECK_SIZE + 1))
+        with self.assertRaises(DecodingError):
+            MinterCheck.from_raw('Mcxyz')
+        with self.assertRaises(DecodingError):
+            MinterCheck.from_raw('Mc' + encode(items[:9]).hex())
+        with self.assertRaises(DecodingError):
+            MinterCheck.from_raw(raw(0, b'abc'))
+        with self.assertRaises(FieldLengthError):
+            MinterCheck.from_raw(raw(3, b'MNT'))
+        with self.assertRaises(FieldLengthError):
+            MinterCheck.from_raw(raw(6, items[6][:64]))
+        with self.assertRaises(DecodingError):
+            MinterCheck.from_raw(raw(7, b'\x1d'))
+
+        # r isn't x of a curve point
+        with self.assertRaises(DecodingError):
+            MinterCheck.from_raw(raw(8, b'\x05'))
+
+    def test_sign_many(self):
+        checks = [
+            MinterCheck(
+                nonce=nonce, due_block=999999, coin='MNT', value=10,
+                passphrase=self.PASSPHRASE,
+                chain_id=MinterTx.TESTNET_CHAIN_ID, gas_coin='MNT'
+            )
+            for nonce in (480, 481, 482)
+        ]
+        expected = [check.sign(self.PRIVATE_KEY) for check in checks]
+        for check in checks:
+            del check.lock, check.signature
+
+        for threads in (False, True):
+            signed = MinterCheck.sign_many(
+                checks, self.PRIVATE_KEY, workers=2, threads=threads
+            )
+            self.assertEqual(signed, expected)
+            self.assertEqual(signed[0], self.VALID_CHECK)
+            self.assertEqual(
+                MinterCheck.from_raw(signed[1]).lock, checks[1].lock.hex()
+            )
+
+        signed = MinterCheck.sign_many(
+            checks, [self.PRIVATE_KEY, 'not a private key', self.PRIVATE_KEY],
+            workers=2, threads=True
+        )
+        self.assertIsInstance(signed[1], Exception)
+        self.assertEqual(signed[2], expected[2])
+
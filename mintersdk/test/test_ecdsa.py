@@ -0,0 +1,220 @@
+import unittest
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import mintersdk
+from mintersdk import MinterAddress, MinterPubKey, keccak
+from mintersdk.sdk import ECDSA, backends, workers
+from mintersdk.sdk.encoding import AMOUNT
+from mintersdk.sdk.transactions import MinterTx, MinterSendCoinTx
+
+
+class MinterWorkerTestTx(MinterTx):
+    """ Tx type, which is registered only while test runs """
+    TYPE = 98
+    FIELDS = (('value', AMOUNT),)
+
+
+MinterTx.unregister_type(MinterWorkerTestTx.TYPE)
+
+
+def _worker_state(_):
+    """ Backends and tx type, which are used by worker process """
+    return (
+        ECDSA.get_backend().name,
+        keccak.get_backend().name,
+        MinterTx.get_type_class(MinterWorkerTestTx.TYPE) is not None
+    )
+
+
+class TestECDSABackends(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.FROM = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        self.SIGNED_TX = 'f8840102018a4d4e540000000000000001aae98a4d4e540000000000000094d82558ea00eb81d35f2654953598f5d51737d31d880de0b6b3a7640000808001b845f8431ba02e6ee857c494930df7f7163677a1c4ca9b03c6f9550e596c7644832024ec83e2a008915382583aa165445e6cdbfd28dbceb00ea136a899d0d3cb1890d93129b0a0'
+        self.TX = MinterSendCoinTx(
+            nonce=1, chain_id=MinterTx.TESTNET_CHAIN_ID, gas_coin='MNT',
+            to='Mxd82558ea00eb81d35f2654953598f5d51737d31d', coin='MNT',
+            value=1
+        )
+
+    def tearDown(self):
+        ECDSA.set_backend('default')
+
+    def test_available(self):
+        available = backends.available_backends()
+
+        self.assertIn('sslcrypto', [backend.name for backend in available])
+        for backend in available:
+            self.assertTrue(backends.self_test(backend))
+
+    def test_every_backend(self):
+        for backend in backends.available_backends():
+            ECDSA.set_backend(backend.name)
+            self.TX.sign(self.PRIVATE_KEY)
+
+            self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
+            self.assertEqual(
+                MinterTx.from_raw(self.TX.signed_tx).from_mx, self.FROM
+            )
+
+    def test_fastest(self):
+        backend = mintersdk.set_ecdsa_backend('fastest')
+
+        self.assertIs(ECDSA.get_backend(), backend)
+        self.assertTrue(backends.self_test(backend))
+
+    def test_releases_gil(self):
+        self.assertFalse(backends.ECDSABackend.releases_gil)
+        self.assertTrue(backends.CoincurveBackend.releases_gil)
+
+        # sslcrypto releases the GIL only over OpenSSL
+        backend = backends.load_backend('sslcrypto')
+        self.assertEqual(
+            backend.releases_gil,
+            'openssl' in type(backend.curve._backend).__module__
+        )
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            ECDSA.set_backend('unknown')
+
+    def test_broken_backend(self):
+        class BrokenBackend(backends.SslcryptoBackend):
+            name = 'broken'
+
+            def sign(self, digest, private_key):
+                v, r, s = super().sign(digest, private_key)
+                return v, r, s + 1
+
+        backends.register_backend(BrokenBackend)
+        try:
+            with self.assertRaisesRegex(ValueError, 'self test'):
+                ECDSA.set_backend('broken')
+            self.assertNotIn(
+                'broken',
+                [backend.name for backend in backends.available_backends()]
+            )
+        finally:
+            backends.BACKENDS.pop('broken')
+
+
+class TestECDSAVerify(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.PUBLIC_KEY = 'Mp5ecb93ea4368127b6311fd73fb86df0b63c38162fd564a204611a9549059c89bd91e63be5ee1341c43e0a692fdae1da7894ab91969e13aa4cb15a5e59d2dbdee'
+        self.ADDRESS = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        self.MESSAGE = 'a75a6dfdd271971f8c2994e3ee8a4f2c9b6949aa27d4aa32fd87617b22b4e67b'
+        v, r, s = ECDSA.sign(self.MESSAGE, self.PRIVATE_KEY)
+        self.VRS = (v, format(r, 'x'), format(s, 'x'))
+        ECDSA.clear_recover_cache()
+
+    def tearDown(self):
+        ECDSA.recover_cache_size = 4096
+        ECDSA.clear_recover_cache()
+
+    def test_verify(self):
+        self.assertTrue(ECDSA.verify(self.MESSAGE, self.VRS, self.ADDRESS))
+        self.assertTrue(ECDSA.verify(self.MESSAGE, self.VRS, self.PUBLIC_KEY))
+        self.assertFalse(ECDSA.verify(
+            self.MESSAGE, self.VRS, 'Mxd82558ea00eb81d35f2654953598f5d51737d31d'
+        ))
+        self.assertFalse(ECDSA.verify(self.MESSAGE, (27, '0', '0'), self.ADDRESS))
+        self.assertFalse(ECDSA.verify(self.MESSAGE, (27, 'zz', '0'), self.ADDRESS))
+
+    def test_verify_typed(self):
+        address = MinterAddress.parse(self.ADDRESS)
+        public_key = MinterPubKey.parse(self.PUBLIC_KEY)
+
+        self.assertTrue(ECDSA.verify(self.MESSAGE, self.VRS, address))
+        self.assertTrue(ECDSA.verify(self.MESSAGE, self.VRS, public_key))
+
+        # Signer is compared by raw bytes, hex case doesn't matter
+        signers = [
+            address, 'Mx' + self.ADDRESS[2:].upper(), address.raw,
+            public_key.raw, self.PUBLIC_KEY[2:]
+        ]
+        for signer in signers:
+            self.assertTrue(ECDSA.verify(self.MESSAGE, self.VRS, signer))
+        for signer in ['Mxzz', None, b'\x01' * 20]:
+            self.assertFalse(ECDSA.verify(self.MESSAGE, self.VRS, signer))
+
+        items = [(self.MESSAGE, self.VRS, signer) for signer in signers]
+        items.append((self.MESSAGE, self.VRS, 'Mxzz'))
+        expected = [True] * len(signers) + [False]
+        self.assertEqual(ECDSA.verify_many(items), expected)
+        ECDSA.clear_recover_cache()
+        self.assertEqual(ECDSA.verify_many(items, workers=2), expected)
+
+    def test_verify_many(self):
+        other = 'b' * 64
+        items = [
+            (self.MESSAGE, self.VRS, self.ADDRESS),
+            (other, self.VRS, self.ADDRESS),
+            (self.MESSAGE, (27, '0', '0'), self.ADDRESS),
+            # Malformed r is not verified, batch isn't failed
+            (self.MESSAGE, (27, 'zz', '0'), self.ADDRESS)
+        ]
+
+        self.assertEqual(ECDSA.verify_many(items), [True, False, False, False])
+        ECDSA.clear_recover_cache()
+        self.assertEqual(
+            ECDSA.verify_many(items, workers=2), [True, False, False, False]
+        )
+        self.assertEqual(len(ECDSA._recover_cache), 2)
+
+    def test_cache(self):
+        result = ECDSA.recover_address(self.MESSAGE, self.VRS)
+
+        self.assertEqual(result, (self.PUBLIC_KEY, self.ADDRESS))
+        self.assertIs(ECDSA.recover_address(self.MESSAGE, self.VRS), result)
+
+        # Cache is bounded
+        ECDSA.recover_cache_size = 1
+        ECDSA.recover_address('b' * 64, self.VRS)
+        self.assertEqual(len(ECDSA._recover_cache), 1)
+        self.assertIsNot(ECDSA.recover_address(self.MESSAGE, self.VRS), result)
+
+
+class TestWorkerBackends(unittest.TestCase):
+
+    def tearDown(self):
+        MinterTx.unregister_type(MinterWorkerTestTx.TYPE)
+        mintersdk.set_ecdsa_backend()
+
+    def test_backend_change(self):
+        if not backends.CoincurveBackend.is_available():
+            self.skipTest('coincurve is not installed')
+
+        # Pool started before backend is changed is started again
+        mintersdk.set_ecdsa_backend('sslcrypto')
+        self.assertEqual(
+            workers.map_ordered(_worker_state, [0], workers=1),
+            [(True, ('sslcrypto', 'pysha3', False))]
+        )
+
+        mintersdk.set_ecdsa_backend('coincurve')
+        MinterTx.register_type(MinterWorkerTestTx)
+        self.assertEqual(
+            workers.map_ordered(_worker_state, [0], workers=1),
+            [(True, ('coincurve', 'pysha3', True))]
+        )
+
+    def test_spawn(self):
+        if not backends.CoincurveBackend.is_available():
+            self.skipTest('coincurve is not installed')
+
+        # Spawned worker doesn't inherit state of parent process
+        mintersdk.set_ecdsa_backend('coincurve')
+        MinterTx.register_type(MinterWorkerTestTx)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+                max_workers=1, mp_context=context,
+                initializer=workers._init_worker,
+                initargs=(workers._worker_config(),)) as pool:
+            name, _, registered = pool.submit(_worker_state, 0).result()
+
+        self.assertEqual(name, 'coincurve')
+        self.assertTrue(registered)
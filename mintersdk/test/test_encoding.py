@@ -0,0 +1,150 @@
+import unittest
+
+import rlp
+
+from mintersdk.sdk.encoding import (
+    encode, decode, decode_strings, encode_int, encode_list, DecodingError,
+    DecodingLimitError, FieldLengthError, ListField, StructField, UINT,
+    AMOUNT, COIN, ADDRESS, PUBKEY, SIGNATURE
+)
+
+
+class TestRLP(unittest.TestCase):
+
+    def setUp(self):
+        self.VALUES = [
+            b'', b'\x00', b'\x7f', b'\x80', b'a' * 55, b'b' * 56, b'c' * 1024,
+            0, 1, 127, 128, 256, 10 ** 18, 2 ** 256 - 1,
+            'MNT', '🔳',
+            [], [b'', 0], [[b'abc', [1, 2]], b'd' * 100, [[]]],
+            [b'x' * 30, b'y' * 30], [b'z' * 53], [b'z' * 54]
+        ]
+
+    def test_encode(self):
+        for value in self.VALUES:
+            self.assertEqual(encode(value), rlp.encode(value))
+
+    def test_decode(self):
+        for value in self.VALUES:
+            encoded = rlp.encode(value)
+            self.assertEqual(decode(encoded), rlp.decode(encoded))
+
+    def test_encode_int(self):
+        self.assertEqual(encode_int(0), b'\x80')
+        with self.assertRaises(ValueError):
+            encode_int(-1)
+
+    def test_non_canonical(self):
+        invalid = [
+            b'',  # empty input
+            b'\x81\x05',  # single byte with prefix
+            b'\xb8\x05abcde',  # long prefix for short string
+            b'\xb9\x00\x38' + b'a' * 56,  # leading zeros in length
+            b'\x83ab',  # truncated string
+            b'\xc3\x01\x02',  # truncated list
+            b'\x01\x02',  # trailing bytes
+        ]
+        for data in invalid:
+            with self.assertRaises(DecodingError):
+                decode(data)
+
+    def test_decode_strings(self):
+        value = [b'', b'\x01', b'a' * 100]
+        self.assertEqual(decode_strings(rlp.encode(value)), value)
+
+        for value in [b'abc', [b'a', [b'b']]]:
+            with self.assertRaises(DecodingError):
+                decode_strings(rlp.encode(value))
+
+
+    def test_limits(self):
+        data = rlp.encode([[b'a', [b'b']], b'c'])
+        self.assertEqual(
+            decode(data, max_size=len(data), max_items=6, max_depth=3),
+            [[b'a', [b'b']], b'c']
+        )
+
+        with self.assertRaises(DecodingLimitError):
+            decode(data, max_size=len(data) - 1)
+        with self.assertRaises(DecodingLimitError):
+            decode(data, max_items=5)
+        with self.assertRaises(DecodingLimitError):
+            decode(data, max_depth=2)
+        with self.assertRaises(DecodingLimitError):
+            decode_strings(rlp.encode([b'a' * 10]), max_size=10)
+
+        # Deep nesting is rejected without recursion to the end
+        data = b'\xc1' * 10000 + b'\xc0'
+        with self.assertRaises(DecodingLimitError):
+            decode(data, max_depth=8)
+
+
+class TestFields(unittest.TestCase):
+
+    def test_struct(self):
+        field = ListField(StructField((
+            ('coin', COIN),
+            ('to', ADDRESS),
+            ('value', AMOUNT)
+        )))
+        value = [{
+            'coin': 'MNT',
+            'to': 'Mxfe60014a6e9ac91618f5d1cab3fd58cded61ee99',
+            'value': 1
+        }]
+
+        encoded = field.encode(value)
+        self.assertEqual(
+            encoded,
+            rlp.encode([[
+                'MNT' + '\x00' * 7,
+                bytes.fromhex('fe60014a6e9ac91618f5d1cab3fd58cded61ee99'),
+                10 ** 18
+            ]])
+        )
+        self.assertEqual(field.decode(decode(encoded)), value)
+
+    def test_uint(self):
+        self.assertEqual(UINT.encode(''), UINT.encode(0))
+        self.assertEqual(UINT.decode(decode(UINT.encode(1023))), 1023)
+
+    def test_validate(self):
+        COIN.validate(COIN.encode('MNT')[1:])
+        ADDRESS.validate(b'\x01' * 20)
+        PUBKEY.validate(b'\x01' * 32)
+        UINT.validate(b'')
+
+        with self.assertRaises(FieldLengthError):
+            COIN.validate(b'MNT')
+        with self.assertRaises(DecodingError):
+            COIN.validate(b'MN\xff' + b'\x00' * 7)
+        with self.assertRaises(FieldLengthError):
+            ADDRESS.validate(b'\x01' * 21)
+        with self.assertRaises(FieldLengthError):
+            PUBKEY.validate(b'\x01' * 31)
+        with self.assertRaises(DecodingError):
+            UINT.validate([b''])
+
+        field = ListField(StructField((('to', ADDRESS), ('value', UINT))), 2)
+        field.validate([[b'\x01' * 20, b'\x05']])
+        for item in [b'', [[b'\x01' * 20]], [[b'\x01' * 20, b'']] * 3]:
+            with self.assertRaises(DecodingError):
+                field.validate(item)
+
+    def test_signature(self):
+        value = {'v': 28, 'r': 'ab' * 32, 's': '01'}
+        item = decode(SIGNATURE.encode(value))
+
+        SIGNATURE.validate(item)
+        self.assertEqual(SIGNATURE.decode(item), value)
+
+        with self.assertRaises(DecodingError):
+            SIGNATURE.validate([b'\x1d', b'\x01', b'\x01'])
+        with self.assertRaises(DecodingError):
+            SIGNATURE.validate([b'\x1b', b'\x01'])
+        with self.assertRaises(FieldLengthError):
+            SIGNATURE.validate([b'\x1b', b'\x01' * 33, b'\x01'])
+
+    def test_list(self):
+        self.assertEqual(encode_list([encode(1), encode(b'ab')]),
+                         rlp.encode([1, b'ab']))
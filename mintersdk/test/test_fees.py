@@ -0,0 +1,94 @@
+import unittest
+
+from mintersdk.sdk.fees import plan_fees, sale_amount, sell_return
+from mintersdk.sdk.transactions import (
+    MinterSendCoinTx, MinterMultiSendCoinTx, MinterDelegateTx
+)
+
+
+class TestPlanFees(unittest.TestCase):
+
+    def setUp(self):
+        self.TO = 'Mxd82558ea00eb81d35f2654953598f5d51737d31d'
+        self.TXS = [
+            MinterSendCoinTx(
+                nonce=1, gas_coin='MNT', to=self.TO, coin='MNT', value=1,
+                payload='🔳 payload'
+            ),
+            MinterMultiSendCoinTx(
+                nonce=1, gas_coin='MNT', service_data='data',
+                txs=[{'coin': 'MNT', 'to': self.TO, 'value': 1}] * 3
+            ),
+            MinterDelegateTx(
+                nonce=1, gas_coin='MNT', coin='MNT', stake=1,
+                pub_key='Mp0eb98ea04ae466d8d38f490db3c99b3996a90e24243952ce9822c6dc1e2c1a43'
+            )
+        ]
+
+    def test_same_as_get_fee(self):
+        rows = [
+            (tx.TYPE, tx.payload, tx.service_data, len(getattr(tx, 'txs', [])))
+            for tx in self.TXS
+        ]
+        fees, total = plan_fees(rows)
+
+        self.assertEqual(fees, [tx.get_fee() for tx in self.TXS])
+        self.assertEqual(total, sum(fees))
+
+    def test_lengths_and_classes(self):
+        fees, _ = plan_fees([
+            (MinterSendCoinTx, 12, None, 0),
+            (MinterMultiSendCoinTx, '', b'data', 3)
+        ])
+
+        self.assertEqual(fees, [tx.get_fee() for tx in self.TXS[:2]])
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            plan_fees([(99, '', '', 0)])
+
+    def test_coin(self):
+        coin = {'supply': 10 ** 24, 'reserve': 10 ** 22, 'crr': 100}
+        fees, total = plan_fees([(MinterSendCoinTx, '', '', 0)] * 2, coin)
+
+        # 0.01 BIP fee costs 1 coin with 100% crr and price 0.01
+        self.assertEqual(fees, [10 ** 18] * 2)
+        self.assertEqual(total, 2 * 10 ** 18)
+
+    def test_sale_amount(self):
+        self.assertEqual(sale_amount(0, 10 ** 24, 10 ** 22, 50), 0)
+
+        # Price is 0.02 with 50% crr, so 0.01 BIP costs about 0.5 coin
+        amount = sale_amount(10 ** 16, 10 ** 24, 10 ** 22, 50)
+        self.assertGreater(amount, 5 * 10 ** 17)
+        self.assertLess(amount, 5 * 10 ** 17 * 1001 // 1000)
+
+        # No jump at 100% crr special case: price differs by 1%
+        self.assertEqual(
+            sale_amount(10 ** 16, 10 ** 24, 10 ** 22, 100), 10 ** 18
+        )
+        amount = sale_amount(10 ** 16, 10 ** 24, 10 ** 22, 99)
+        self.assertGreater(amount, 99 * 10 ** 16)
+        self.assertLess(amount, 10 ** 18)
+
+        with self.assertRaises(ValueError):
+            sale_amount(10 ** 22, 10 ** 24, 10 ** 22, 50)
+
+    def test_sell_return_round_trip(self):
+        coins = [
+            (10 ** 24, 10 ** 22, 50), (10 ** 24, 10 ** 22, 10),
+            (10 ** 24, 10 ** 22, 99), (10 ** 24, 10 ** 22, 100),
+            (123456789 * 10 ** 15, 987654321 * 10 ** 12, 37)
+        ]
+        for supply, reserve, crr in coins:
+            for want in [1, 10 ** 16, 10 ** 18, reserve // 2]:
+                amount = sale_amount(want, supply, reserve, crr)
+                received = sell_return(amount, supply, reserve, crr)
+
+                # Selling amount returns want, one PIP less doesn't
+                self.assertGreaterEqual(received, want)
+                self.assertLess(
+                    sell_return(amount - 1, supply, reserve, crr), want
+                )
+
+        self.assertEqual(sell_return(0, 10 ** 24, 10 ** 22, 50), 0)
@@ -0,0 +1,124 @@
+import unittest
+import array
+import decimal
+import threading
+
+from mintersdk import Amount, MinterHelper, MinterConvertor
+
+
+class TestConvert(unittest.TestCase):
+
+    def test_to_pip(self):
+        self.assertEqual(MinterHelper.to_pip(1), 10 ** 18)
+        self.assertEqual(MinterHelper.to_pip(0.1), 10 ** 17)
+        self.assertEqual(MinterHelper.to_pip('1.5'), 15 * 10 ** 17)
+
+        # All digits are kept, whatever precision current context has
+        self.assertEqual(
+            MinterHelper.to_pip('1234567890123.123456789012345678'),
+            1234567890123123456789012345678
+        )
+
+    def test_to_bip(self):
+        self.assertEqual(MinterHelper.to_bip(10 ** 18), decimal.Decimal(1))
+        self.assertEqual(
+            MinterHelper.to_bip(1234567890123123456789012345678),
+            decimal.Decimal('1234567890123.123456789012345678')
+        )
+        with self.assertRaises(ValueError):
+            MinterHelper.to_bip(-1)
+
+    def test_to_pip_many(self):
+        values = ['1.5', 2, 0.1, decimal.Decimal('0.000000000000000001'),
+                  Amount(7)]
+        self.assertEqual(
+            MinterHelper.to_pip_many(values),
+            [15 * 10 ** 17, 2 * 10 ** 18, 10 ** 17, 1, 7]
+        )
+        self.assertEqual(MinterHelper.to_pip_many(tuple(values)),
+                         MinterHelper.to_pip_many(values))
+        self.assertEqual(MinterHelper.to_pip_many(array.array('q', [1, 2])),
+                         [10 ** 18, 2 * 10 ** 18])
+        self.assertEqual(MinterHelper.to_pip_many([]), [])
+
+    def test_to_bip_many(self):
+        values = [10 ** 18, 15 * 10 ** 17, 1, 0,
+                  1234567890123123456789012345678]
+        amounts = MinterHelper.to_bip_many(values)
+        self.assertTrue(all(type(amount) is Amount for amount in amounts))
+        self.assertEqual(
+            amounts, [MinterHelper.to_bip(value) for value in values]
+        )
+
+        # Array, digit strings and amounts
+        self.assertEqual(
+            MinterHelper.to_bip_many(array.array('q', [10 ** 18, 5])),
+            [Amount(10 ** 18), Amount(5)]
+        )
+        self.assertEqual(
+            MinterHelper.to_bip_many(['1500000000000000000', Amount(1)]),
+            [Amount(15 * 10 ** 17), Amount(1)]
+        )
+        self.assertEqual(MinterHelper.to_bip_many([]), [])
+
+        # Fixed scale strings, extra digits are dropped
+        self.assertEqual(
+            MinterHelper.to_bip_many(values, scale=2),
+            ['1.00', '1.50', '0.00', '0.00', '1234567890123.12']
+        )
+        self.assertEqual(
+            MinterHelper.to_bip_many(values, scale=0),
+            ['1', '1', '0', '0', '1234567890123']
+        )
+        self.assertEqual(
+            MinterHelper.to_bip_many([1, 10 ** 18], scale=18),
+            ['0.000000000000000001', '1.000000000000000000']
+        )
+
+        for invalid in [[-1], [1, '-1'], ['1.5'], [1.0], ['abc']]:
+            with self.assertRaises(ValueError):
+                MinterHelper.to_bip_many(invalid)
+        for scale in [-1, 19]:
+            with self.assertRaises(ValueError):
+                MinterHelper.to_bip_many([1], scale=scale)
+
+    def test_context_untouched(self):
+        with decimal.localcontext() as ctx:
+            ctx.prec = 5
+            ctx.rounding = decimal.ROUND_UP
+
+            self.assertEqual(
+                MinterHelper.to_bip(123456789 * 10 ** 18 + 1),
+                decimal.Decimal('123456789.000000000000000001')
+            )
+            self.assertEqual(MinterHelper.to_pip('123456.789'),
+                             123456789 * 10 ** 15)
+            self.assertEqual(
+                MinterConvertor.convert_value(10 ** 18 + 1, 'bip'),
+                decimal.Decimal('1.000000000000000001')
+            )
+
+            self.assertEqual(decimal.getcontext().prec, 5)
+            self.assertEqual(decimal.getcontext().rounding, decimal.ROUND_UP)
+
+    def test_threads(self):
+        values = [10 ** 18 * n + n for n in range(1, 200)]
+        errors = []
+
+        def convert():
+            decimal.getcontext().prec = 3
+            for value in values:
+                if MinterHelper.to_pip(MinterHelper.to_bip(value)) != value:
+                    errors.append(value)
+
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+from mintersdk import MinterHelper, interning
+from mintersdk.interning import InternTable
+from mintersdk.sdk.check import MinterCheck
+from mintersdk.sdk.transactions import MinterTx, MinterSendCoinTx
+
+
+class TestInternTable(unittest.TestCase):
+
+    def test_get(self):
+        table = InternTable('test', 2)
+        first = table.get(b'\x01', lambda key: 'Mx' + key.hex())
+        same = table.get(b'\x01', lambda key: 'Mx' + key.hex())
+
+        self.assertEqual(first, 'Mx01')
+        self.assertIs(first, same)
+        self.assertEqual(len(table), 1)
+
+        # Table is cleared when it is full
+        table.get(b'\x02', bytes.hex)
+        table.get(b'\x03', bytes.hex)
+        self.assertEqual(len(table), 1)
+
+        stats = table.stats()
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(stats['max_size'], 2)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 3)
+        self.assertEqual(stats['resets'], 1)
+        self.assertGreater(stats['memory'], 0)
+
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.stats()['misses'], 0)
+
+    def test_disabled(self):
+        table = InternTable('test', 0)
+        self.assertEqual(table.get(b'\x01', bytes.hex), '01')
+        self.assertEqual(len(table), 0)
+
+    def test_string_key(self):
+        # Value got by raw bytes and by string is one object
+        table = InternTable('test', 10)
+        by_bytes = table.get(b'\xab\xcd', lambda key: 'Mx' + key.hex())
+        by_str = table.get(''.join(['Mx', 'abcd']), str)
+
+        self.assertIs(by_bytes, by_str)
+
+
+class TestDecoders(unittest.TestCase):
+    TO = 'Mx1b685a7c1e78726c48f619c497a07ed75fe00483'
+    PRIVATE_KEY = (
+        '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+    )
+
+    def setUp(self):
+        interning.clear()
+
+    def test_tx(self):
+        txs = []
+        for nonce in [1, 2]:
+            tx = MinterSendCoinTx(
+                nonce=nonce, chain_id=MinterTx.TESTNET_CHAIN_ID,
+                gas_coin='MNT', to=self.TO, coin='MNT', value=1
+            )
+            tx.sign(self.PRIVATE_KEY)
+            txs.append(MinterTx.from_raw(tx.signed_tx))
+
+        first, second = txs
+        self.assertEqual(first.to, self.TO)
+        self.assertIs(first.to, second.to)
+        self.assertIs(first.coin, second.coin)
+        self.assertIs(first.gas_coin, second.coin)
+        self.assertIs(first.from_mx, second.from_mx)
+
+        stats = interning.stats()
+        self.assertGreater(stats['coins']['hits'], 0)
+        self.assertGreater(stats['addresses']['hits'], 0)
+
+    def test_check(self):
+        checks = []
+        for nonce in [1, 2]:
+            check = MinterCheck(
+                nonce=nonce, chain_id=MinterTx.TESTNET_CHAIN_ID,
+                due_block=999999, coin='MNT', value=1, gas_coin='MNT',
+                passphrase='pass'
+            )
+            checks.append(MinterCheck.from_raw(check.sign(self.PRIVATE_KEY)))
+
+        first, second = checks
+        self.assertIs(first.coin, second.gas_coin)
+        self.assertIs(first.owner, second.owner)
+
+    def test_coin_name(self):
+        self.assertEqual(MinterHelper.decode_coin_name(b'MNT\x00\x00'), 'MNT')
+        self.assertIs(
+            MinterHelper.decode_coin_name(b'MNT\x00\x00'),
+            MinterHelper.decode_coin_name(''.join(['M', 'NT']))
+        )
+
+        # Result doesn't depend on which function cached symbol first
+        self.assertEqual(MinterHelper.upper_coin_name('mnt\x00'), 'MNT\x00')
+        self.assertEqual(MinterHelper.decode_coin_name('MNT\x00'), 'MNT')
+        self.assertEqual(MinterHelper.upper_coin_name('mnt'), 'MNT')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from mintersdk import MinterHelper, keccak, set_keccak_backend
+from mintersdk.keccak import KeccakBackend
+from mintersdk.sdk import ECDSA
+from mintersdk.sdk.wallet import MinterWallet
+
+
+class TestKeccak(unittest.TestCase):
+
+    def tearDown(self):
+        keccak.set_backend()
+
+    def test_digest(self):
+        digest = MinterHelper.keccak_digest(b'abc')
+        self.assertEqual(
+            digest.hex(),
+            '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45'
+        )
+        self.assertEqual(MinterHelper.keccak_hash(b'abc'), digest.hex())
+        self.assertEqual(keccak.keccak_256(b'abc'), digest)
+
+        with self.assertRaises(NotImplementedError):
+            MinterHelper.keccak_digest(b'abc', digest_bits=512)
+
+    def test_backends(self):
+        available = [
+            name for name, backend_cls in keccak.BACKENDS.items()
+            if backend_cls.is_available()
+        ]
+        self.assertTrue(available)
+
+        for name in available:
+            backend = set_keccak_backend(name)
+            self.assertEqual(backend.name, name)
+            self.assertTrue(keccak.self_test(backend))
+            self.assertEqual(
+                MinterHelper.keccak_hash(b''),
+                'c5d2460186f7233c927e7db2dcc703c0e500b653'
+                'ca82273b7bfad8045d85a470'
+            )
+
+        with self.assertRaises(ValueError):
+            keccak.set_backend('unknown')
+
+    def test_broken_backend(self):
+        class BrokenBackend(KeccakBackend):
+            name = 'broken'
+
+            def digest(self, data):
+                return bytes(32)
+
+        keccak.register_backend(BrokenBackend)
+        try:
+            with self.assertRaises(ValueError):
+                keccak.set_backend('broken')
+        finally:
+            del keccak.BACKENDS['broken']
+
+    def test_raw_digest(self):
+        private_key = (
+            '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        )
+        digest = MinterHelper.keccak_digest(b'message')
+
+        # Raw and hex digests give the same signature and signer
+        signature = ECDSA.sign(digest, private_key)
+        self.assertEqual(signature, ECDSA.sign(digest.hex(), private_key))
+
+        vrs = (signature[0], hex(signature[1]), hex(signature[2]))
+        public_key, address = ECDSA.recover_address(digest, vrs)
+        self.assertEqual(ECDSA.recover_address(digest.hex(), vrs),
+                         (public_key, address))
+        self.assertEqual(
+            public_key, MinterWallet.get_public_from_private(private_key)
+        )
+        self.assertEqual(
+            MinterWallet.get_address_from_public_key(public_key), address
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
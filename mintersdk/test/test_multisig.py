@@ -0,0 +1,64 @@
+import unittest
+
+from mintersdk.sdk.multisig import MultisigSession
+from mintersdk.sdk.transactions import MinterTx, MinterSendCoinTx
+
+
+class TestMultisigSession(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEYS = [
+            'b354c3d1d456d5a1ddd65ca05fd710117701ec69d82dac1858986049a0385af9',
+            '38b7dfb77426247aed6081f769ed8f62aaec2ee2b38336110ac4f7484478dccb',
+            '94c0915734f92dd66acfdc48f82b1d0b208efd544fe763386160ec30c968b4af'
+        ]
+        self.FROM = 'Mxdb4f4b6942cb927e8d7e3a1f602d0f1fb43b5bd2'
+        self.SIGNED_TX = 'f901270102018a4d4e540000000000000001aae98a4d4e540000000000000094d82558ea00eb81d35f2654953598f5d51737d31d880de0b6b3a7640000808002b8e8f8e694db4f4b6942cb927e8d7e3a1f602d0f1fb43b5bd2f8cff8431ca0a116e33d2fea86a213577fc9dae16a7e4cadb375499f378b33cddd1d4113b6c1a021ee1e9eb61bbd24233a0967e1c745ab23001cf8816bb217d01ed4595c6cb2cdf8431ca0f7f9c7a6734ab2db210356161f2d012aa9936ee506d88d8d0cba15ad6c84f8a7a04b71b87cbbe7905942de839211daa984325a15bdeca6eea75e5d0f28f9aaeef8f8431ba0d8c640d7605034eefc8870a6a3d1c22e2f589a9319288342632b1c4e6ce35128a055fe3f93f31044033fe7b07963d547ac50bccaac38a057ce61665374c72fb454'
+        self.TX = MinterSendCoinTx(**{
+            'nonce': 1,
+            'chain_id': MinterTx.TESTNET_CHAIN_ID,
+            'gas_coin': 'MNT',
+            'to': 'Mxd82558ea00eb81d35f2654953598f5d51737d31d',
+            'coin': 'MNT',
+            'value': 1
+        })
+
+    def test_sign(self):
+        session = MultisigSession(self.TX, self.FROM)
+        for pk in self.PRIVATE_KEYS:
+            session.sign(pk)
+
+        self.assertEqual(session.finalize(), self.SIGNED_TX)
+        self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
+        self.assertEqual(self.TX.from_mx, self.FROM)
+
+    def test_detached_signatures(self):
+        # Co-signer creates signature for the same tx
+        self.TX.signature_type = MinterTx.SIGNATURE_MULTI_TYPE
+        signature = self.TX.generate_signature(self.PRIVATE_KEYS[2])
+
+        session = MultisigSession(self.TX, self.FROM)
+        session.sign_many(self.PRIVATE_KEYS[:2], workers=2)
+        session.add_signature(signature)
+
+        self.assertEqual(session.finalize(), self.SIGNED_TX)
+
+    def test_from_raw(self):
+        session = MultisigSession(self.TX, self.FROM)
+        session.sign(self.PRIVATE_KEYS[0])
+
+        session = MultisigSession.from_raw(session.finalize())
+        session.sign_many(self.PRIVATE_KEYS[1:], workers=2)
+
+        self.assertEqual(session.finalize(), self.SIGNED_TX)
+        self.assertEqual(
+            MinterTx.from_raw(self.SIGNED_TX).signature_data,
+            session.tx.signature_data
+        )
+
+    def test_invalid_key(self):
+        session = MultisigSession(self.TX, self.FROM)
+
+        with self.assertRaises(Exception):
+            session.sign_many([self.PRIVATE_KEYS[0], 'not a key'], workers=2)
+        self.assertEqual(session.signatures, [])
@@ -0,0 +1,97 @@
+import unittest
+import decimal
+
+from mintersdk import MinterAddress
+from mintersdk.sdk.payouts import payout, chunk_recipients, merge_recipients
+from mintersdk.sdk.transactions import MinterTx, MinterMultiSendCoinTx
+
+
+class TestPayouts(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.FROM = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        self.ROWS = [
+            ('MNT', 'Mx' + format(index, '040x'), decimal.Decimal('0.1'))
+            for index in range(250)
+        ]
+
+    def test_merge(self):
+        rows = list(merge_recipients(self.ROWS[:2] + self.ROWS[:1]))
+
+        self.assertEqual(rows, [
+            ('MNT', self.ROWS[0][1], 2 * 10 ** 17),
+            ('MNT', self.ROWS[1][1], 10 ** 17)
+        ])
+
+    def test_merge_address_forms(self):
+        address = 'Mxd82558ea00eb81d35f2654953598f5d51737d31d'
+        rows = list(merge_recipients([
+            ('MNT', address, 1),
+            ('mnt', MinterAddress.parse(address), 1),
+            ('MNT', address[2:].upper(), 1),
+            ('MNT', 'Mx' + address[2:].upper(), 1)
+        ]))
+
+        self.assertEqual(rows, [('MNT', address, 4 * 10 ** 18)])
+
+    def test_chunk(self):
+        chunks = list(chunk_recipients(self.ROWS))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+        self.assertEqual(
+            chunks[0][0],
+            {'coin': 'MNT', 'to': self.ROWS[0][1], 'value': decimal.Decimal('0.1')}
+        )
+
+        # Split by raw tx size, each item is 42 bytes
+        chunks = list(chunk_recipients(self.ROWS, max_tx_size=1300))
+        self.assertEqual([len(chunk) for chunk in chunks], [23] * 10 + [20])
+
+        # Payload and service data take part of tx size
+        chunks = list(chunk_recipients(
+            self.ROWS, max_tx_size=1300, payload='p' * 200,
+            service_data=b's' * 200
+        ))
+        self.assertEqual(len(chunks[0]), 14)
+
+        with self.assertRaises(ValueError):
+            next(chunk_recipients(
+                self.ROWS, max_tx_size=1300, payload='p' * 1000
+            ))
+
+    def test_payout_payload(self):
+        payload = 'p' * 1024
+        txs = list(payout(
+            self.ROWS[:150], self.PRIVATE_KEY, nonce=1, gas_coin='MNT',
+            payload=payload, max_tx_size=4096, workers=2
+        ))
+
+        for tx in txs:
+            self.assertEqual(tx.payload, payload)
+            self.assertLessEqual(len(tx.signed_bytes), 4096)
+
+    def test_payout(self):
+        rows = iter(self.ROWS + self.ROWS[:10])
+        txs = list(payout(
+            rows, self.PRIVATE_KEY, nonce=5, gas_coin='MNT',
+            chain_id=MinterTx.TESTNET_CHAIN_ID, workers=2, batch_size=2
+        ))
+
+        self.assertEqual([tx.nonce for tx in txs], [5, 6, 7])
+        self.assertEqual(
+            [len(tx.txs) for tx in txs], [100, 100, 50]
+        )
+
+        decoded = MinterTx.from_raw(txs[0].signed_tx)
+        self.assertIsInstance(decoded, MinterMultiSendCoinTx)
+        self.assertEqual(decoded.from_mx, self.FROM)
+        self.assertEqual(decoded.txs[0]['value'], decimal.Decimal('0.2'))
+        self.assertEqual(decoded.txs[10]['value'], decimal.Decimal('0.1'))
+        for tx in txs:
+            self.assertLessEqual(len(tx.signed_bytes), MinterTx.MAX_TX_SIZE)
+
+    def test_payout_invalid_key(self):
+        with self.assertRaises(Exception):
+            list(payout(
+                self.ROWS, 'not a key', nonce=1, gas_coin='MNT', workers=2
+            ))
@@ -0,0 +1,123 @@
+import unittest
+import pickle
+
+from mintersdk import (
+    MinterHelper, MinterAddress, MinterPubKey, MinterCheckId, MinterTxHash
+)
+from mintersdk.sdk.transactions import (
+    MinterTx, MinterSendCoinTx, MinterDelegateTx, MinterCreateMultisigTx,
+    MinterMultiSendCoinTx
+)
+from mintersdk.sdk.wallet import MinterWallet
+
+
+class TestPrefixed(unittest.TestCase):
+    ADDRESS = 'Mx1b685a7c1e78726c48f619c497a07ed75fe00483'
+    PUBKEY = (
+        'Mp0eb98ea04ae466d8d38f490db3c99b3996a90e24243952ce9822c6dc1e2c1a43'
+    )
+
+    def test_parse(self):
+        address = MinterAddress.parse(self.ADDRESS)
+
+        self.assertEqual(address.raw, bytes.fromhex(self.ADDRESS[2:]))
+        self.assertEqual(str(address), self.ADDRESS)
+        self.assertEqual(address.hex(), self.ADDRESS[2:])
+        self.assertEqual(bytes(address), address.raw)
+        self.assertEqual(repr(address), f"MinterAddress('{self.ADDRESS}')")
+
+        # Without prefix, from raw bytes and from the same type
+        self.assertEqual(MinterAddress.parse(self.ADDRESS[2:]), address)
+        self.assertEqual(MinterAddress.parse(address.raw), address)
+        self.assertIs(MinterAddress.parse(address), address)
+
+        self.assertEqual(str(MinterPubKey.parse(self.PUBKEY)), self.PUBKEY)
+        self.assertEqual(
+            str(MinterTxHash(bytes(32))), 'Mt' + '00' * 32
+        )
+        self.assertEqual(str(MinterCheckId(b'\x01\x02')), 'Mc0102')
+
+    def test_invalid(self):
+        values = [
+            self.PUBKEY, self.ADDRESS[:-2], 'Mx' + 'zz' * 20,
+            # Prefix in the middle isn't removed
+            self.ADDRESS[:10] + 'Mx' + self.ADDRESS[10:]
+        ]
+        for value in values:
+            with self.assertRaises(ValueError):
+                MinterAddress.parse(value)
+        with self.assertRaises(TypeError):
+            MinterAddress.parse(1)
+
+    def test_hashable(self):
+        address = MinterAddress.parse(self.ADDRESS)
+        same = MinterAddress.parse(self.ADDRESS.upper()[2:])
+
+        self.assertEqual({address: 1}[same], 1)
+        self.assertNotEqual(address, self.ADDRESS)
+        self.assertNotEqual(
+            MinterTxHash(bytes(32)), MinterPubKey(bytes(32))
+        )
+        with self.assertRaises(AttributeError):
+            address.raw = b''
+        self.assertEqual(pickle.loads(pickle.dumps(address)), address)
+
+    def test_prefix_remove(self):
+        self.assertEqual(MinterHelper.prefix_remove(self.ADDRESS),
+                         self.ADDRESS[2:])
+        self.assertEqual(MinterHelper.prefix_remove('abMxcd'), 'abMxcd')
+        self.assertEqual(
+            MinterHelper.prefix_remove(MinterAddress.parse(self.ADDRESS)),
+            self.ADDRESS[2:]
+        )
+
+    def test_tx(self):
+        private_key = (
+            '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        )
+        header = {
+            'nonce': 1, 'chain_id': MinterTx.TESTNET_CHAIN_ID,
+            'gas_coin': 'MNT'
+        }
+        address = MinterAddress.parse(self.ADDRESS)
+        pub_key = MinterPubKey.parse(self.PUBKEY)
+        pairs = [
+            (MinterSendCoinTx(to=address, coin='MNT', value=1, **header),
+             MinterSendCoinTx(to=self.ADDRESS, coin='MNT', value=1,
+                              **header)),
+            (MinterDelegateTx(pub_key=pub_key, coin='MNT', stake=1, **header),
+             MinterDelegateTx(pub_key=self.PUBKEY, coin='MNT', stake=1,
+                              **header)),
+            (MinterCreateMultisigTx(threshold=1, weights=[1],
+                                    addresses=[address], **header),
+             MinterCreateMultisigTx(threshold=1, weights=[1],
+                                    addresses=[self.ADDRESS], **header)),
+            (MinterMultiSendCoinTx(
+                txs=[{'coin': 'MNT', 'to': address, 'value': 1}], **header),
+             MinterMultiSendCoinTx(
+                txs=[{'coin': 'MNT', 'to': self.ADDRESS, 'value': 1}],
+                **header))
+        ]
+        for typed, plain in pairs:
+            typed.sign(private_key)
+            plain.sign(private_key)
+            self.assertEqual(typed.signed_tx, plain.signed_tx)
+
+        # Multisig address
+        typed = MinterSendCoinTx(to=address, coin='MNT', value=1, **header)
+        plain = MinterSendCoinTx(to=address, coin='MNT', value=1, **header)
+        typed.sign(private_key=[private_key], ms_address=address)
+        plain.sign(private_key=[private_key], ms_address=self.ADDRESS)
+        self.assertEqual(typed.signed_tx, plain.signed_tx)
+
+    def test_wallet(self):
+        self.assertEqual(
+            MinterWallet.get_address_from_public_key(
+                MinterPubKey.parse(self.PUBKEY)
+            ),
+            MinterWallet.get_address_from_public_key(self.PUBKEY)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
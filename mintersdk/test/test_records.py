@@ -0,0 +1,85 @@
+import unittest
+import pickle
+import sys
+
+from mintersdk.sdk.transactions import (
+    MinterTx, MinterSendCoinTx, MinterMultiSendCoinTx, MinterUnknownTx
+)
+
+
+class TestMinterTxRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.FROM = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        self.SIGNED_TX = 'f8840102018a4d4e540000000000000001aae98a4d4e5400000000000000941b685a7c1e78726c48f619c497a07ed75fe00483880de0b6b3a7640000808001b845f8431ca01f36e51600baa1d89d2bee64def9ac5d88c518cdefe45e3de66a3cf9fe410de4a01bc2228dc419a97ded0efe6848de906fbe6c659092167ef0e7dcb8d15024123a'
+
+    def test_decode_to_record(self):
+        record = MinterTx.decode_to_record(self.SIGNED_TX, recover_sender=True)
+
+        self.assertIsInstance(record, MinterSendCoinTx.RECORD)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(record.to, 'Mx1b685a7c1e78726c48f619c497a07ed75fe00483')
+        self.assertEqual(record.value, 1)
+        self.assertEqual(record.from_mx, self.FROM)
+        self.assertEqual(record.signed_bytes, bytes.fromhex(self.SIGNED_TX))
+
+        with self.assertRaises(AttributeError):
+            record.value = 2
+
+    def test_to_tx(self):
+        record = MinterTx.decode_to_record(self.SIGNED_TX, recover_sender=True)
+        tx = record.to_tx()
+
+        self.assertIsInstance(tx, MinterSendCoinTx)
+        self.assertEqual(tx.from_mx, self.FROM)
+        self.assertEqual(tx.signed_tx, self.SIGNED_TX)
+        self.assertEqual(tx.to_record(), record)
+
+        # Tx can be signed again
+        tx.sign(self.PRIVATE_KEY)
+        self.assertEqual(tx.signed_tx, self.SIGNED_TX)
+
+    def test_pickle(self):
+        record = MinterTx.decode_to_record(self.SIGNED_TX)
+        data = pickle.dumps(record)
+
+        self.assertEqual(pickle.loads(data), record)
+        self.assertLess(
+            len(data), len(pickle.dumps(MinterTx.decode_to_dict(self.SIGNED_TX)))
+        )
+        self.assertLess(
+            sys.getsizeof(record),
+            sys.getsizeof(MinterTx.from_raw(self.SIGNED_TX).__dict__)
+        )
+
+    def test_unsigned_tx(self):
+        tx = MinterMultiSendCoinTx(
+            nonce=1, gas_coin='MNT',
+            txs=[{'coin': 'MNT', 'to': self.FROM, 'value': 1}]
+        )
+        record = tx.to_record()
+
+        self.assertEqual(record.type, MinterMultiSendCoinTx.TYPE)
+        self.assertEqual(record.txs, tx.txs)
+        self.assertIsNone(record.from_mx)
+        self.assertIsNone(record.signed_bytes)
+
+    def test_unknown(self):
+        raw = bytearray.fromhex(self.SIGNED_TX)
+        raw[16] = 99  # tx type
+        record = MinterTx.decode_to_record(bytes(raw), allow_unknown=True)
+
+        self.assertIsInstance(record, MinterUnknownTx.RECORD)
+        self.assertEqual(record.type, 99)
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(record.to_tx().data, record.data)
+
+    def test_from_raw_many(self):
+        records = MinterTx.from_raw_many(
+            [self.SIGNED_TX] * 3, workers=2, records=True
+        )
+
+        for record in records:
+            self.assertEqual(record.from_mx, self.FROM)
+            self.assertEqual(record.signed_bytes, bytes.fromhex(self.SIGNED_TX))
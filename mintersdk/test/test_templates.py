@@ -0,0 +1,104 @@
+import numbers
+import unittest
+
+from mintersdk.sdk.templates import MinterTxTemplate
+from mintersdk.sdk.transactions import MinterTx, MinterSendCoinTx
+
+
+class IntegerScalar(object):
+    """ Integer, which isn't int (as numpy integer) """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __int__(self):
+        return self.value
+
+    __index__ = __int__
+
+
+numbers.Integral.register(IntegerScalar)
+
+
+class TestMinterTxTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.TO = [
+            'Mxd82558ea00eb81d35f2654953598f5d51737d31d',
+            'Mx1b685a7c1e78726c48f619c497a07ed75fe00483',
+            'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        ]
+        self.VALUES = [1, '0.5', 3]
+        self.TEMPLATE = MinterTxTemplate(
+            MinterSendCoinTx, gas_coin='mnt', payload='withdrawal',
+            chain_id=MinterTx.TESTNET_CHAIN_ID, coin='mnt'
+        )
+
+    def expected(self, nonce=10):
+        signed = []
+        for index, (to, value) in enumerate(zip(self.TO, self.VALUES)):
+            tx = MinterSendCoinTx(
+                nonce=nonce + index, chain_id=MinterTx.TESTNET_CHAIN_ID,
+                gas_coin='MNT', payload='withdrawal', coin='MNT', to=to,
+                value=value
+            )
+            signed.append(tx.sign_bytes(self.PRIVATE_KEY))
+
+        return signed
+
+    def test_columns(self):
+        self.assertEqual(self.TEMPLATE.columns, ['to', 'value'])
+
+        with self.assertRaises(ValueError):
+            MinterTxTemplate(MinterSendCoinTx, gas_coin='MNT', unknown=1)
+        with self.assertRaises(ValueError):
+            self.TEMPLATE.sign(self.PRIVATE_KEY, nonce=1, to=self.TO)
+        with self.assertRaises(ValueError):
+            self.TEMPLATE.sign(
+                self.PRIVATE_KEY, nonce=1, to=self.TO, value=self.VALUES[:2]
+            )
+
+    def test_sign(self):
+        signed = self.TEMPLATE.sign_bytes(
+            self.PRIVATE_KEY, nonce=10, to=self.TO, value=self.VALUES
+        )
+        self.assertEqual(signed, self.expected())
+
+        # Hex, as MinterTx.signed_tx
+        signed = self.TEMPLATE.sign(
+            self.PRIVATE_KEY, nonce=10, to=self.TO, value=self.VALUES
+        )
+        self.assertEqual(signed, [raw.hex() for raw in self.expected()])
+
+        # Integer scalar nonce isn't a column
+        signed = self.TEMPLATE.sign_bytes(
+            self.PRIVATE_KEY, nonce=IntegerScalar(10), to=self.TO,
+            value=self.VALUES
+        )
+        self.assertEqual(signed, self.expected())
+
+    def test_sign_many_in_pip(self):
+        columns = {
+            'nonce': (10, 11, 12), 'to': tuple(self.TO),
+            'value': [10 ** 18, 5 * 10 ** 17, 3 * 10 ** 18]
+        }
+        signed = self.TEMPLATE.sign_many_bytes(
+            self.PRIVATE_KEY, in_pip=True, workers=2, **columns
+        )
+        self.assertEqual(signed, self.expected())
+
+        signed = self.TEMPLATE.sign_many(
+            self.PRIVATE_KEY, in_pip=True, workers=2, **columns
+        )
+        self.assertEqual(signed, [raw.hex() for raw in self.expected()])
+
+    def test_build(self):
+        tx = self.TEMPLATE.build(nonce=10, to=self.TO[0], value=1)
+
+        self.assertIsInstance(tx, MinterSendCoinTx)
+
+        # Built tx is the same as tx created directly until it is signed
+        self.assertIsNone(tx.signature_type)
+        self.assertNotIn('signature_type', tx._rlp_cache)
+        self.assertEqual(tx.sign_bytes(self.PRIVATE_KEY), self.expected()[0])
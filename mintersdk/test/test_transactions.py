@@ -1,5 +1,6 @@
 import unittest
 import base64
+import copy
 import decimal
 
 from mintersdk.sdk.transactions import (
@@ -7,8 +8,16 @@ from mintersdk.sdk.transactions import (
     MinterCreateCoinTx, MinterDeclareCandidacyTx, MinterEditCandidateTx,
     MinterRedeemCheckTx, MinterSellAllCoinTx, MinterSellCoinTx,
     MinterSetCandidateOffTx, MinterSetCandidateOnTx, MinterUnbondTx,
-    MinterMultiSendCoinTx, MinterCreateMultisigTx
+    MinterMultiSendCoinTx, MinterCreateMultisigTx, MinterUnknownTx,
+    UnknownTxTypeError
 )
+from mintersdk.sdk import ECDSA
+from mintersdk.sdk.encoding import (
+    COIN, AMOUNT, DecodingError, DecodingLimitError, FieldLengthError,
+    decode, decode_strings, encode, encode_bytes, encode_list
+)
+from mintersdk.sdk.recipients import MultiSendRecipients
+from mintersdk.sdk.wallet import MinterSigningKey
 
 
 class TestMinterTx(unittest.TestCase):
@@ -76,6 +85,13 @@ class TestMinterBuyCoinTx(unittest.TestCase):
 
         self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
 
+    def test_sign_signing_key(self):
+        key = MinterSigningKey(self.PRIVATE_KEY)
+        self.TX.sign(key)
+
+        self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
+        self.assertEqual(key.address, self.FROM)
+
     def test_from_raw(self):
         tx = MinterTx.from_raw(raw_tx=self.SIGNED_TX)
 
@@ -368,6 +384,32 @@ class TestMinterSellCoinTx(unittest.TestCase):
         self.assertEqual(tx.coin_to_buy, self.TX.coin_to_buy)
         self.assertEqual(tx.min_value_to_buy, self.TX.min_value_to_buy)
 
+    def test_resign_cache(self):
+        self.TX.sign(self.PRIVATE_KEY)
+        self.assertIn('data', self.TX._rlp_cache)
+
+        # Changed attribute drops only it's own cached item
+        self.TX.nonce = 2
+        self.assertNotIn('nonce', self.TX._rlp_cache)
+        self.assertIn('data', self.TX._rlp_cache)
+
+        self.TX.value_to_sell = 2
+        self.assertNotIn('data', self.TX._rlp_cache)
+        self.assertIn('chain_id', self.TX._rlp_cache)
+
+        self.TX.sign(self.PRIVATE_KEY)
+        tx = MinterSellCoinTx(**{
+            'nonce': 2,
+            'chain_id': MinterTx.TESTNET_CHAIN_ID,
+            'gas_coin': 'MNT',
+            'coin_to_sell': 'MNT',
+            'value_to_sell': 2,
+            'coin_to_buy': 'TEST',
+            'min_value_to_buy': 1
+        })
+        tx.sign(self.PRIVATE_KEY)
+        self.assertEqual(self.TX.signed_tx, tx.signed_tx)
+
 
 class TestMinterSendTx(unittest.TestCase):
 
@@ -415,6 +457,109 @@ class TestMinterSendTx(unittest.TestCase):
         self.assertEqual(tx.coin, self.TX.coin)
         self.assertEqual(tx.value, self.TX.value)
 
+    def test_get_sender_address(self):
+        # Tx dict with hexdigit values, address is got by 1.0.34 release
+        tx = {
+            'nonce': 1, 'chain_id': 2, 'gas_price': 1,
+            'gas_coin': 'MNT\x00\x00\x00\x00\x00\x00\x00', 'type': 1,
+            'data': {
+                'coin': 'MNT\x00\x00\x00\x00\x00\x00\x00',
+                'to': 'd82558ea00eb81d35f2654953598f5d51737d31d',
+                'value': '0de0b6b3a7640000'
+            },
+            'payload': 'hello', 'service_data': '', 'signature_type': 1,
+            'signature_data': {
+                'v': 27,
+                'r': '92355eabb9489ee8da70efa24e32814429a4ce997e003cfb8ed7b9d2b3dcb314',
+                's': '0165f93a68d1b86855b91c6e9239d056b82e06702942aa1e97bd480b6e250b3b'
+            }
+        }
+        address = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(
+                MinterTx.get_sender_address(copy.deepcopy(tx)), address
+            )
+
+        # Data values as bytes
+        tx['data'] = {
+            name: value if name == 'coin' else bytes.fromhex(value)
+            for name, value in tx['data'].items()
+        }
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(MinterTx.get_sender_address(tx), address)
+
+    def test_from_raw_lazy_sender(self):
+        tx = MinterTx.from_raw(self.SIGNED_TX)
+        self.assertNotIn('_from_mx', tx.__dict__)
+        self.assertEqual(tx.from_mx, self.FROM)
+        self.assertEqual(tx.__dict__['_from_mx'], self.FROM)
+
+        tx = MinterTx.from_raw(self.SIGNED_TX, recover_sender=True)
+        self.assertEqual(tx.__dict__['_from_mx'], self.FROM)
+
+    def test_sign_bytes(self):
+        signed = self.TX.sign_bytes(self.PRIVATE_KEY)
+
+        self.assertEqual(signed, bytes.fromhex(self.SIGNED_TX))
+        self.assertEqual(self.TX.signed_bytes, signed)
+        self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
+
+    def test_from_raw_bytes(self):
+        raw = bytes.fromhex(self.SIGNED_TX)
+
+        for raw_tx in (raw, memoryview(raw)):
+            tx = MinterTx.from_raw(raw_tx)
+            self.assertEqual(tx.from_mx, self.FROM)
+            self.assertEqual(tx.value, self.TX.value)
+            self.assertEqual(tx.signed_bytes, raw)
+            self.assertEqual(tx.signed_tx, self.SIGNED_TX)
+
+    def test_hash_cache(self):
+        tx = MinterTx.from_raw(self.SIGNED_TX)
+        tx_hash = tx.get_hash()
+        self.assertIs(tx.get_hash(), tx_hash)
+
+        # Hash is reset after tx is signed again
+        tx.payload = 'abc'
+        tx.sign(self.PRIVATE_KEY)
+        self.assertNotEqual(tx.get_hash(), tx_hash)
+        self.assertEqual(tx.get_hash(), MinterTx.peek(tx.signed_bytes)['hash'])
+
+    def test_from_raw_hex_payload(self):
+        self.TX.payload = 'abcdef'
+        self.TX.sign(self.PRIVATE_KEY)
+        tx = MinterTx.from_raw(self.TX.signed_tx)
+
+        self.assertEqual(tx.payload, 'abcdef')
+        self.assertEqual(tx.from_mx, self.FROM)
+
+    def test_decode_to_dict(self):
+        tx = MinterTx.decode_to_dict(self.SIGNED_TX)
+
+        self.assertNotIn('from_mx', tx)
+        self.assertEqual(tx['to'], self.TX.to)
+        self.assertEqual(tx['coin'], self.TX.coin)
+        self.assertEqual(tx['value'], self.TX.value)
+        self.assertEqual(tx['signed_tx'], self.SIGNED_TX)
+
+        tx = MinterTx.decode_to_dict(self.SIGNED_TX, recover_sender=True)
+        self.assertEqual(tx['from_mx'], self.FROM)
+
+    def test_peek(self):
+        tx = MinterTx.from_raw(self.SIGNED_TX)
+
+        self.assertEqual(MinterTx.peek(self.SIGNED_TX), {
+            'nonce': 1,
+            'chain_id': MinterTx.TESTNET_CHAIN_ID,
+            'gas_price': 1,
+            'gas_coin': 'MNT',
+            'type': MinterSendCoinTx.TYPE,
+            'payload_len': 0,
+            'signature_type': MinterTx.SIGNATURE_SINGLE_TYPE,
+            'hash': tx.get_hash()
+        })
+
 
 class TestMinterSetCandidateOffTx(unittest.TestCase):
 
@@ -625,6 +770,34 @@ class TestMinterMultiSendCoinTx(unittest.TestCase):
 
         self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
 
+    def test_from_raw_compact(self):
+        tx = MinterTx.from_raw(raw_tx=self.SIGNED_TX, compact=True)
+
+        self.assertIsInstance(tx.txs, MultiSendRecipients)
+        self.assertEqual(len(tx.txs), 2)
+        self.assertEqual(tx.txs.values, [10 ** 17, 2 * 10 ** 17])
+        self.assertEqual(
+            tx.txs.address_bytes(1),
+            bytes.fromhex('ddab6281766ad86497741ff91b6b48fe85012e3c')
+        )
+        self.assertEqual(tx.txs.total(), {'MNT': 3 * 10 ** 17})
+        self.assertEqual(tx.txs[-1], self.TX.txs[-1])
+        self.assertEqual(tx.txs, self.TX.txs)
+        self.assertEqual(tx.from_mx, self.FROM)
+
+        # Tx with compact recipients is encoded the same way
+        tx.sign(self.PRIVATE_KEY)
+        self.assertEqual(tx.signed_tx, self.SIGNED_TX)
+
+    def test_resign_list_changed(self):
+        self.TX.sign(self.PRIVATE_KEY)
+        self.TX.txs.pop()
+        self.TX.sign(self.PRIVATE_KEY)
+
+        self.assertEqual(
+            MinterTx.from_raw(self.TX.signed_tx).txs, self.TX.txs
+        )
+
     def test_from_raw(self):
         tx = MinterTx.from_raw(raw_tx=self.SIGNED_TX)
 
@@ -738,6 +911,14 @@ class TestMinterSendMultisigTx(unittest.TestCase):
 
         self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
 
+    def test_signing_keys(self):
+        keys = [MinterSigningKey(pk) for pk in self.PRIVATE_KEYS]
+
+        self.TX.sign(private_key=keys[:2], ms_address=self.FROM)
+        self.TX = MinterTx.add_signature(self.TX.signed_tx, keys[2])
+
+        self.assertEqual(self.TX.signed_tx, self.SIGNED_TX)
+
     def test_sign_with_signature(self):
         # Set signature type for transaction
         self.TX.signature_type = MinterTx.SIGNATURE_MULTI_TYPE
@@ -897,5 +1078,298 @@ class TestMinterCreateMultisigTx(unittest.TestCase):
         self.assertEqual(tx.addresses, self.TX.addresses)
 
 
+class TestSignMany(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.TO = 'Mxd82558ea00eb81d35f2654953598f5d51737d31d'
+        self.TXS = [
+            MinterSendCoinTx(
+                nonce=nonce, chain_id=MinterTx.TESTNET_CHAIN_ID,
+                gas_coin='MNT', to=self.TO, coin='MNT', value=nonce
+            )
+            for nonce in range(1, 6)
+        ]
+
+    def test_sign_many(self):
+        expected = []
+        for tx in self.TXS:
+            tx.sign(self.PRIVATE_KEY)
+            expected.append(tx.signed_tx)
+            tx.signed_tx = None
+
+        signed = MinterTx.sign_many(self.TXS, self.PRIVATE_KEY, workers=2)
+
+        self.assertEqual(signed, expected)
+        self.assertEqual([tx.signed_tx for tx in self.TXS], expected)
+
+    def test_errors_per_item(self):
+        keys = [self.PRIVATE_KEY] * len(self.TXS)
+        keys[2] = 'not a private key'
+
+        signed = MinterTx.sign_many(self.TXS, keys, workers=2)
+
+        self.assertIsInstance(signed[2], Exception)
+        self.assertIsNone(self.TXS[2].signed_tx)
+        for index in (0, 1, 3, 4):
+            self.assertEqual(signed[index], self.TXS[index].signed_tx)
+
+    def test_threads(self):
+        expected = []
+        for tx in self.TXS:
+            tx.sign(self.PRIVATE_KEY)
+            expected.append(tx.signed_tx)
+            tx.signed_tx = None
+
+        signed = MinterTx.sign_many(
+            self.TXS, self.PRIVATE_KEY, workers=2, threads=True
+        )
+
+        self.assertEqual(signed, expected)
+        self.assertEqual([tx.signed_tx for tx in self.TXS], expected)
+
+
+class TestFromRawMany(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.FROM = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        self.RAW_TXS = []
+        for nonce in range(1, 6):
+            tx = MinterSendCoinTx(
+                nonce=nonce, chain_id=MinterTx.TESTNET_CHAIN_ID,
+                gas_coin='MNT', to='Mxd82558ea00eb81d35f2654953598f5d51737d31d',
+                coin='MNT', value=nonce
+            )
+            tx.sign(self.PRIVATE_KEY)
+            self.RAW_TXS.append(tx.signed_tx)
+
+    def test_from_raw_many(self):
+        decoded = MinterTx.from_raw_many(self.RAW_TXS, workers=2)
+
+        for raw_tx, tx in zip(self.RAW_TXS, decoded):
+            self.assertEqual(tx, MinterTx.decode_to_dict(
+                raw_tx, recover_sender=True
+            ))
+            self.assertEqual(tx['from_mx'], self.FROM)
+
+    def test_errors_per_item(self):
+        raw_txs = list(self.RAW_TXS)
+        raw_txs[1] = 'f8'
+
+        decoded = MinterTx.from_raw_many(raw_txs, workers=2)
+
+        self.assertIsInstance(decoded[1], Exception)
+        self.assertEqual([tx['nonce'] for tx in decoded[2:]], [3, 4, 5])
+
+    def test_threads(self):
+        raw_txs = list(self.RAW_TXS)
+        raw_txs[1] = 'f8'
+
+        decoded = MinterTx.from_raw_many(raw_txs, workers=2, threads=True)
+
+        self.assertIsInstance(decoded[1], Exception)
+        self.assertEqual(decoded[0], MinterTx.decode_to_dict(
+            raw_txs[0], recover_sender=True
+        ))
+        self.assertEqual(
+            [tx['from_mx'] for tx in decoded[2:]], [self.FROM] * 3
+        )
+
+    def test_rejected_before_workers(self):
+        raw_txs = list(self.RAW_TXS)
+        raw_txs[0] = 'zz'
+        raw_txs[2] = '00' * (MinterTx.MAX_TX_SIZE + 1)
+
+        decoded = MinterTx.from_raw_many(raw_txs, workers=2, records=True)
+
+        self.assertIsInstance(decoded[0], DecodingError)
+        self.assertIsInstance(decoded[2], DecodingLimitError)
+        self.assertEqual([tx.nonce for tx in decoded[3:]], [4, 5])
+
+
+class TestStrictDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+        self.TX = MinterSendCoinTx(
+            nonce=1, chain_id=MinterTx.TESTNET_CHAIN_ID, gas_coin='MNT',
+            to='Mxd82558ea00eb81d35f2654953598f5d51737d31d', coin='MNT',
+            value=1
+        )
+        self.TX.sign(self.PRIVATE_KEY)
+        self.ITEMS = decode_strings(self.TX.signed_bytes)
+
+        # Junk input should be rejected before sender recovery
+        self._recover_address = ECDSA.recover_address
+        ECDSA.recover_address = self._fail
+
+    def tearDown(self):
+        ECDSA.recover_address = self._recover_address
+
+    @staticmethod
+    def _fail(*args):
+        raise AssertionError('Sender should not be recovered')
+
+    def _raw(self, **items):
+        """ Re-encode signed tx with replaced items (by index) """
+        tx = list(self.ITEMS)
+        for index, item in items.items():
+            tx[int(index[1:])] = item
+
+        return encode_list([encode_bytes(item) for item in tx])
+
+    def _assert_rejected(self, raw_tx, error=DecodingError):
+        with self.assertRaises(error):
+            MinterTx.from_raw(raw_tx, recover_sender=True)
+
+    def test_valid(self):
+        ECDSA.recover_address = self._recover_address
+        tx = MinterTx.from_raw(self._raw(), recover_sender=True)
+
+        self.assertEqual(tx.signed_tx, self.TX.signed_tx)
+        self.assertEqual(tx.from_mx, MinterSigningKey(self.PRIVATE_KEY).address)
+
+    def test_size(self):
+        self._assert_rejected(
+            '00' * (MinterTx.MAX_TX_SIZE + 1), DecodingLimitError
+        )
+        self._assert_rejected(
+            self._raw(i6=b'a' * MinterTx.MAX_TX_SIZE), DecodingLimitError
+        )
+        self._assert_rejected('xyz')
+
+    def test_structure(self):
+        self._assert_rejected(encode_list([
+            encode_bytes(item) for item in self.ITEMS[:9]
+        ]))
+        self._assert_rejected(encode(self.ITEMS[:9] + [[b'\x1b']]))
+        self._assert_rejected(self._raw(i5=encode(b'junk')))
+        self._assert_rejected(self._raw(i5=encode([b'\x01'] * 2)))
+        self._assert_rejected(self._raw(i8=b'\x03'))
+
+        # Deep nesting in tx data
+        self._assert_rejected(
+            self._raw(i5=b'\xc1' * 10 + b'\xc0'), DecodingLimitError
+        )
+
+    def test_field_length(self):
+        data = decode(self.ITEMS[5])
+
+        self._assert_rejected(self._raw(i3=b'MNT'), FieldLengthError)
+        self._assert_rejected(
+            self._raw(i5=encode([data[0], data[1][:19], data[2]])),
+            FieldLengthError
+        )
+        self._assert_rejected(
+            self._raw(i5=encode([data[0][:9], data[1], data[2]])),
+            FieldLengthError
+        )
+
+    def test_signature(self):
+        v, r, s = decode(self.ITEMS[9])
+
+        self._assert_rejected(self._raw(i9=encode([b'\x1d', r, s])))
+        self._assert_rejected(
+            self._raw(i9=encode([v, r + b'\x01', s])), FieldLengthError
+        )
+        self._assert_rejected(self._raw(i9=encode([v, r])))
+
+        # Multi signature data
+        address = bytes(20)
+        self._assert_rejected(
+            self._raw(i8=b'\x02', i9=encode([address[:19], [[v, r, s]]])),
+            FieldLengthError
+        )
+        self._assert_rejected(
+            self._raw(i8=b'\x02', i9=encode([address, [[v, r, s]] * 33])),
+            DecodingLimitError
+        )
+        tx = MinterTx.from_raw(
+            self._raw(i8=b'\x02', i9=encode([address, [[v, r, s]]]))
+        )
+        self.assertEqual(tx.from_mx, 'Mx' + address.hex())
+
+    def test_invalid_point(self):
+        # Well-formed signature with r, which isn't x of a curve point
+        ECDSA.recover_address = self._recover_address
+        v, r, s = decode(self.ITEMS[9])
+        raw_tx = self._raw(i9=encode([v, b'\x05', s]))
+
+        self._assert_rejected(raw_tx)
+        tx = MinterTx.from_raw(raw_tx)
+        with self.assertRaises(DecodingError):
+            tx.from_mx
+
+    def test_peek(self):
+        with self.assertRaises(FieldLengthError):
+            MinterTx.peek(self._raw(i3=b'MNT'))
+
+
+class TestTxTypeRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.FROM = 'Mx31e61a05adbd13c6b625262704bc305bf7725026'
+        self.PRIVATE_KEY = '07bc17abdcee8b971bb8723e36fe9d2523306d5ab2d683631693238e0f9df142'
+
+        class MinterBurnCoinTx(MinterTx):
+            TYPE = 99
+            COMMISSION = 10
+            FIELDS = (
+                ('coin', COIN),
+                ('value', AMOUNT)
+            )
+
+            def __init__(self, coin, value, **kwargs):
+                super().__init__(**kwargs)
+                self.coin = coin.upper()
+                self.value = value
+
+        self.TX_CLASS = MinterBurnCoinTx
+        self.TX = MinterBurnCoinTx(nonce=1, gas_coin='mnt', coin='mnt', value=3)
+        self.TX.sign(self.PRIVATE_KEY)
+
+    def tearDown(self):
+        MinterTx.unregister_type(self.TX_CLASS.TYPE)
+
+    def test_registry(self):
+        for tx_class in (MinterSendCoinTx, MinterMultiSendCoinTx,
+                         MinterCreateMultisigTx, MinterDelegateTx):
+            self.assertIs(MinterTx.get_type_class(tx_class.TYPE), tx_class)
+        self.assertIsNone(MinterTx.get_type_class(0))
+
+    def test_custom_type(self):
+        tx = MinterTx.from_raw(self.TX.signed_tx)
+
+        self.assertIsInstance(tx, self.TX_CLASS)
+        self.assertEqual(tx.from_mx, self.FROM)
+        self.assertEqual(tx.coin, 'MNT')
+        self.assertEqual(tx.value, 3)
+
+    def test_unknown_type(self):
+        MinterTx.unregister_type(self.TX_CLASS.TYPE)
+
+        with self.assertRaises(UnknownTxTypeError):
+            MinterTx.from_raw(self.TX.signed_tx)
+
+        tx = MinterTx.from_raw(self.TX.signed_tx, allow_unknown=True)
+        self.assertIsInstance(tx, MinterUnknownTx)
+        self.assertEqual(tx.type, self.TX_CLASS.TYPE)
+        self.assertEqual(tx.nonce, 1)
+        self.assertEqual(tx.from_mx, self.FROM)
+        self.assertEqual(tx.data, self.TX._encode_data())
+        with self.assertRaisesRegex(
+                UnknownTxTypeError, f"'{self.TX_CLASS.TYPE}'"):
+            tx.get_fee()
+
+        # Header only object can be signed again
+        tx.sign(self.PRIVATE_KEY)
+        self.assertEqual(tx.signed_tx, self.TX.signed_tx)
+
+        # Register class at runtime
+        MinterTx.register_type(self.TX_CLASS)
+        self.assertIsInstance(MinterTx.from_raw(self.TX.signed_tx), self.TX_CLASS)
+
+
 if __name__ == '__main__':
     unittest.main()
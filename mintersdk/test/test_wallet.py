@@ -1,6 +1,8 @@
 import unittest
 
-from mintersdk.sdk.wallet import MinterWallet
+import pickle
+
+from mintersdk.sdk.wallet import MinterWallet, MinterSigningKey
 
 
 class TestMinterWallet(unittest.TestCase):
@@ -21,3 +23,33 @@ class TestMinterWallet(unittest.TestCase):
     def test_creation(self):
         for _ in range(250):
             MinterWallet.create()
+
+
+class TestMinterSigningKey(unittest.TestCase):
+
+    def setUp(self):
+        self.private_key = '7ffc6bc08f2d8a0ead1d3f64e6a9862b7695dafceca24f25978341447594aa07'
+        self.address = 'Mx5a4c6c7fbd05ff8e5b09818db5ad229852784e01'
+
+    def test_derivations(self):
+        key = MinterSigningKey(self.private_key)
+
+        self.assertEqual(key.address, self.address)
+        self.assertEqual(
+            key.public_key,
+            MinterWallet.get_public_from_private(self.private_key)
+        )
+        self.assertEqual(
+            MinterSigningKey(bytes.fromhex(self.private_key)).address,
+            self.address
+        )
+
+    def test_pickle(self):
+        key = pickle.loads(pickle.dumps(MinterSigningKey(self.private_key)))
+
+        self.assertEqual(key.private_key, self.private_key)
+        self.assertEqual(key.address, self.address)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            MinterSigningKey('ff' * 31)
@@ -21,12 +21,18 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ),
     install_requires=[
-        'rlp',
         'sslcrypto',
         'mnemonic',
-        'pysha3',
+        'pysha3; python_version < "3.9"',
+        'safe-pysha3; python_version >= "3.9"',
         'requests',
         'pyqrcode',
         'deprecated'
-    ]
+    ],
+    extras_require={
+        'coincurve': ['coincurve'],
+        'pycryptodome': ['pycryptodome'],
+        # Reference RLP implementation for codec tests
+        'test': ['rlp']
+    }
 )